@@ -0,0 +1,14 @@
+from outbox.mail import queue_mail
+
+# purpose: (subject, message with the OTP substituted)
+OTP_EMAILS = {
+    'verify': ('Email Verification OTP', 'Your OTP for email verification is: {otp}'),
+    'reset': ('Password Reset OTP', 'Your OTP for password reset is: {otp}'),
+    'resend': ('Resend OTP', 'Your new OTP is: {otp}'),
+}
+
+
+def queue_otp_email(user, otp, purpose):
+    """Put the OTP email for `purpose` in the outbox"""
+    subject, message = OTP_EMAILS[purpose]
+    return queue_mail(subject, message.format(otp=otp), [user.email])
@@ -33,5 +33,5 @@ class User(AbstractUser):
     
     def generate_otp(self):
         self.otp = str(random.randint(100000, 999999))
-        self.save()
+        self.save(update_fields=['otp'])
         return self.otp
@@ -9,13 +9,14 @@ from .serializers import (
 )
 from rest_framework.views import APIView
 from rest_framework.permissions import IsAuthenticated
-from django.core.mail import send_mail
 from django.conf import settings
+from django.db import transaction
 from django.db.models import Count
 from django.middleware.csrf import get_token
 import jwt
 import logging
 from .models import User
+from .emails import queue_otp_email
 
 logger = logging.getLogger(__name__)
 
@@ -58,29 +59,18 @@ class RegisterAPI(APIView):
                 'message': 'Failed to create user. Please try again.'
             }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
         
+        # The OTP and its verification email are stored together; the
+        # outbox sender delivers it
         try:
-            otp = user.generate_otp()
+            with transaction.atomic():
+                otp = user.generate_otp()
+                queue_otp_email(user, otp, 'verify')
         except Exception as e:
             logger.error(f"OTP generation failed: {str(e)}")
             return Response({
                 'message': 'Failed to generate OTP. Please try again.'
             }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
         
-        # Send OTP for email verification
-        try:
-            send_mail(
-                'Email Verification OTP',
-                f'Your OTP for email verification is: {otp}',
-                settings.DEFAULT_FROM_EMAIL,
-                [user.email],
-                # amazonq-ignore-next-line
-                fail_silently=False,
-            )
-        except Exception:
-            return Response({
-                'message': 'Failed to send verification email. Please try again.'
-            }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-        
         return Response({
             'message': 'User registered successfully. Please verify your email with the OTP sent.',
             'email': user.email
@@ -145,29 +135,17 @@ class ForgotPasswordAPI(APIView):
         
         try:
             user = User.objects.get(email=serializer.validated_data['email'])
+            # Store the OTP and its email together
             try:
-                otp = user.generate_otp()
+                with transaction.atomic():
+                    otp = user.generate_otp()
+                    queue_otp_email(user, otp, 'reset')
             except Exception as e:
                 logger.error(f"OTP generation failed: {str(e)}")
                 return Response({
                     'message': 'Failed to generate OTP. Please try again.'
                 }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
             
-            # Send OTP via email
-            try:
-                send_mail(
-                    'Password Reset OTP',
-                    f'Your OTP for password reset is: {otp}',
-                    settings.DEFAULT_FROM_EMAIL,
-                    [user.email],
-                    fail_silently=False,
-                )
-            except Exception as e:
-                logger.error(f"Failed to send password reset OTP email: {str(e)}")
-                return Response({
-                    'message': 'Failed to send OTP email. Please try again later.'
-                }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-            
             return Response({
                 'message': 'OTP sent to your email'
             }, status=status.HTTP_200_OK)
@@ -247,7 +225,7 @@ class ResetPasswordAPI(APIView):
             try:
                 user.set_password(serializer.validated_data['new_password'])
                 user.otp = None
-                user.save()
+                user.save(update_fields=['password', 'otp'])
             except Exception as e:
                 logger.error(f"Password reset failed: {str(e)}")
                 return Response({
@@ -275,7 +253,7 @@ class VerifyOTPAPI(APIView):
             try:
                 user.is_verified = True
                 user.otp = None
-                user.save()
+                user.save(update_fields=['is_verified', 'otp'])
             except Exception as e:
                 logger.error(f"Email verification failed: {str(e)}")
                 return Response({
@@ -300,29 +278,17 @@ class ResendOTPAPI(APIView):
         
         try:
             user = User.objects.get(email=serializer.validated_data['email'])
+            # Store the OTP and its email together
             try:
-                otp = user.generate_otp()
+                with transaction.atomic():
+                    otp = user.generate_otp()
+                    queue_otp_email(user, otp, 'resend')
             except Exception as e:
                 logger.error(f"OTP generation failed in ResendOTP: {str(e)}")
                 return Response({
                     'message': 'Failed to generate OTP. Please try again.'
                 }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
             
-            # Send OTP via email
-            try:
-                send_mail(
-                    'Resend OTP',
-                    f'Your new OTP is: {otp}',
-                    settings.DEFAULT_FROM_EMAIL,
-                    [user.email],
-                    fail_silently=False,
-                )
-            except Exception as e:
-                logger.error(f"Failed to send resend OTP email: {str(e)}")
-                return Response({
-                    'message': 'Failed to send OTP email. Please try again later.'
-                }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-            
             return Response({
                 'message': 'New OTP sent to your email'
             }, status=status.HTTP_200_OK)
@@ -354,7 +320,7 @@ class ChangePasswordAPI(APIView):
             
             try:
                 user.set_password(serializer.validated_data['new_password'])
-                user.save()
+                user.save(update_fields=['password'])
             except Exception as e:
                 return Response({
                     'message': 'Failed to change password. Please try again.'
@@ -385,7 +351,7 @@ class UpdateJobRoleAPI(APIView):
         
         user.job_role = job_role
         try:
-            user.save()
+            user.save(update_fields=['job_role'])
         except Exception as e:
             return Response({'error': 'Failed to update job role. Please try again.'}, status=500)
         
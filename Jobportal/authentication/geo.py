@@ -0,0 +1,88 @@
+"""
+Offline city gazetteer and distance helpers for location search
+"""
+import csv
+import math
+import os
+import re
+from collections import namedtuple
+from functools import lru_cache
+
+from django.db.models import F, FloatField, Q
+from django.db.models.functions import ASin, Cos, Least, Power, Radians, Sin, Sqrt
+
+City = namedtuple('City', ['name', 'country', 'latitude', 'longitude'])
+
+GAZETTEER_PATH = os.path.join(os.path.dirname(__file__), 'data', 'cities.csv')
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE_LAT = 111.045
+
+_PART_SPLIT_RE = re.compile(r'[,/|()\-;]+')
+_MAX_NAME_WORDS = 3
+
+
+@lru_cache(maxsize=1)
+def load_gazetteer():
+    """Map every lowercase city name and alias to its City"""
+    cities = {}
+    with open(GAZETTEER_PATH, encoding='utf-8') as handle:
+        for row in csv.DictReader(handle):
+            city = City(row['name'], row['country'], float(row['latitude']), float(row['longitude']))
+            names = [row['name']] + [alias for alias in row['aliases'].split('|') if alias]
+            for name in names:
+                cities.setdefault(' '.join(name.lower().split()), city)
+    return cities
+
+
+def normalize_location(text):
+    """
+    Resolve free text such as 'Kochi, Kerala' or 'Infopark Cochin (Hybrid)'
+    to a City, or None when no gazetteer entry matches.
+    """
+    if not text:
+        return None
+    cities = load_gazetteer()
+    for part in _PART_SPLIT_RE.split(str(text).lower()):
+        words = part.split()
+        # Longest word run first so 'navi mumbai' beats 'mumbai'
+        for size in range(min(len(words), _MAX_NAME_WORDS), 0, -1):
+            for start in range(len(words) - size + 1):
+                city = cities.get(' '.join(words[start:start + size]))
+                if city:
+                    return city
+    return None
+
+
+def bounding_box(latitude, longitude, radius_km):
+    """(min_lat, max_lat, min_lon, max_lon) enclosing a circle of radius_km"""
+    lat_delta = radius_km / KM_PER_DEGREE_LAT
+    cos_lat = math.cos(math.radians(latitude))
+    if cos_lat < 1e-6 or radius_km / (KM_PER_DEGREE_LAT * cos_lat) >= 180:
+        lon_delta = 180.0
+    else:
+        lon_delta = radius_km / (KM_PER_DEGREE_LAT * cos_lat)
+    return latitude - lat_delta, latitude + lat_delta, longitude - lon_delta, longitude + lon_delta
+
+
+def within_bounding_box(latitude, longitude, radius_km, lat_field='latitude', lon_field='longitude'):
+    """Index-friendly Q prefilter for rows possibly within radius_km"""
+    min_lat, max_lat, min_lon, max_lon = bounding_box(latitude, longitude, radius_km)
+    condition = Q(**{f'{lat_field}__gte': min_lat, f'{lat_field}__lte': max_lat})
+    if min_lon < -180 or max_lon > 180:
+        # The box crosses the antimeridian; longitude is left to haversine
+        return condition
+    return condition & Q(**{f'{lon_field}__gte': min_lon, f'{lon_field}__lte': max_lon})
+
+
+def haversine_km(latitude, longitude, lat_field='latitude', lon_field='longitude'):
+    """Database expression for the great-circle distance in km from a point"""
+    origin_lat = math.radians(latitude)
+    origin_lon = math.radians(longitude)
+    lat = Radians(F(lat_field))
+    lon = Radians(F(lon_field))
+    a = (
+        Power(Sin((lat - origin_lat) / 2), 2)
+        + math.cos(origin_lat) * Cos(lat) * Power(Sin((lon - origin_lon) / 2), 2)
+    )
+    # Rounding can push sqrt(a) a hair past 1, outside asin's domain
+    return 2 * EARTH_RADIUS_KM * ASin(Least(Sqrt(a), 1.0), output_field=FloatField())
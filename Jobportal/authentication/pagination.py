@@ -0,0 +1,210 @@
+"""
+Keyset (cursor) pagination shared by all list endpoints
+"""
+import base64
+import json
+from datetime import date, datetime
+from decimal import Decimal
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import F, OrderBy, Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import replace_query_param
+
+
+def _encode_value(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    raise TypeError(f"Unsupported cursor value: {value!r}")
+
+
+class KeysetPagination(BasePagination):
+    """
+    Paginate on a composite key such as (created_at, id).
+
+    Pages are fetched with a `WHERE key < position` filter instead of OFFSET,
+    so page 500 costs the same as page 1 as long as an index covers the key.
+    The ordering comes from the queryset (or the view's `ordering`) and is
+    always completed with `id` as a unique tie-breaker. Nullable keys follow
+    the ordering's NULLS FIRST/LAST placement.
+    """
+    cursor_query_param = 'cursor'
+    page_size_query_param = 'page_size'
+    page_size = api_settings.PAGE_SIZE or 20
+    max_page_size = 100
+    ordering = ('-created_at',)
+    invalid_cursor_message = 'Invalid cursor'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.limit = self.get_page_size(request)
+        self.key = self.get_ordering(queryset, view)
+
+        cursor = self.decode_cursor(request)
+        reverse = bool(cursor and cursor['r'])
+        key = self._reverse(self.key) if reverse else self.key
+
+        queryset = queryset.order_by(*[self._order_by(part) for part in key])
+        if cursor is not None:
+            queryset = queryset.filter(self._after(queryset.model, key, cursor['p']))
+
+        results = list(queryset[:self.limit + 1])
+        has_more = len(results) > self.limit
+        results = results[:self.limit]
+
+        if reverse:
+            results.reverse()
+            self.has_next = True
+            self.has_previous = has_more
+        else:
+            self.has_next = has_more
+            self.has_previous = cursor is not None
+
+        self.page = results
+        return results
+
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return max(1, min(size, self.max_page_size))
+
+    def get_ordering(self, queryset, view):
+        """
+        Return the ordering as (field, descending, nulls_last) tuples ending
+        with a unique `id`.
+        """
+        key = [self._parse_order(o) for o in queryset.query.order_by]
+        key = [part for part in key if part is not None]
+        if not key:
+            ordering = getattr(view, 'ordering', None) or queryset.model._meta.ordering or self.ordering
+            key = [self._parse_order(o) for o in ordering]
+        if not any(name == 'id' for name, _, _ in key):
+            descending = key[-1][1]
+            key.append(('id', descending, not descending))
+        return key
+
+    def _parse_order(self, order):
+        """'-created_at' or F('salary_min').desc(nulls_last=True) -> key tuple"""
+        if isinstance(order, str):
+            descending = order.startswith('-')
+            name = order.lstrip('-')
+            nulls_last = not descending  # PostgreSQL default placement
+        elif isinstance(order, F):
+            name, descending, nulls_last = order.name, False, True
+        elif isinstance(order, OrderBy) and isinstance(order.expression, F):
+            name, descending = order.expression.name, order.descending
+            if order.nulls_last or order.nulls_first:
+                nulls_last = bool(order.nulls_last)
+            else:
+                nulls_last = not descending
+        else:
+            return None
+        return ('id' if name == 'pk' else name, descending, nulls_last)
+
+    def _order_by(self, part):
+        name, descending, nulls_last = part
+        expression = F(name).desc if descending else F(name).asc
+        return expression(nulls_last=True) if nulls_last else expression(nulls_first=True)
+
+    def _reverse(self, key):
+        return [(name, not descending, not nulls_last) for name, descending, nulls_last in key]
+
+    def _nullable(self, model, name):
+        try:
+            return model._meta.get_field(name).null
+        except FieldDoesNotExist:
+            return False
+
+    def _after(self, model, key, position):
+        """Rows strictly after `position` in `key`, as a Q object"""
+        if len(position) != len(key):
+            raise NotFound(self.invalid_cursor_message)
+
+        condition = Q()
+        equal = Q()
+        for (name, descending, nulls_last), value in zip(key, position):
+            nullable = self._nullable(model, name)
+            if value is None:
+                # Non-null values sort after a NULL only when NULLs come first
+                if not nulls_last:
+                    condition |= equal & Q(**{f'{name}__isnull': False})
+                equal &= Q(**{f'{name}__isnull': True})
+                continue
+
+            after = Q(**{f"{name}__{'lt' if descending else 'gt'}": value})
+            if nullable and nulls_last:
+                after |= Q(**{f'{name}__isnull': True})
+            condition |= equal & after
+            equal &= Q(**{name: value})
+
+        # Leading bound lets the planner range-scan the first index column
+        name, descending, _ = key[0]
+        if position[0] is not None and not self._nullable(model, name):
+            condition &= Q(**{f"{name}__{'lte' if descending else 'gte'}": position[0]})
+        return condition
+
+    def _position(self, obj):
+        values = []
+        for name, _, _ in self.key:
+            value = obj
+            for attr in name.split('__'):
+                value = getattr(value, attr)
+            values.append(value)
+        return values
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            padded = encoded + '=' * (-len(encoded) % 4)
+            cursor = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+            if not isinstance(cursor['p'], list):
+                raise ValueError
+            return {'p': cursor['p'], 'r': bool(cursor.get('r'))}
+        except (TypeError, ValueError, KeyError, UnicodeError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def encode_cursor(self, position, reverse=False):
+        payload = {'p': position}
+        if reverse:
+            payload['r'] = 1
+        raw = json.dumps(payload, default=_encode_value, separators=(',', ':'))
+        encoded = base64.urlsafe_b64encode(raw.encode('utf-8')).decode('ascii').rstrip('=')
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor(self._position(self.page[-1]))
+
+    def get_previous_link(self):
+        if not self.has_previous or not self.page:
+            return None
+        return self.encode_cursor(self._position(self.page[0]), reverse=True)
+
+    def get_paginated_response(self, data):
+        return Response({
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+            'results': data,
+        })
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'required': ['results'],
+            'properties': {
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'previous': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'results': schema,
+            },
+        }
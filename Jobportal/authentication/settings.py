@@ -41,6 +41,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     'rest_framework',
     'rest_framework.authtoken',
     'rest_framework_simplejwt',
@@ -49,6 +50,8 @@ INSTALLED_APPS = [
     'job_post',
     'posts',
     'follows',
+    'task_queue',
+    'outbox',
     'corsheaders',
 ]
 
@@ -151,8 +154,28 @@ REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
         'rest_framework_simplejwt.authentication.JWTAuthentication',
     ],
+    'DEFAULT_PAGINATION_CLASS': 'authentication.pagination.KeysetPagination',
+    'PAGE_SIZE': 20,
 }
 
+# Cache
+# CACHE_BACKEND picks 'locmem' (default, per process), 'file' (shared by the
+# workers on one host, stored under CACHE_LOCATION) or a full backend path.
+CACHE_BACKENDS = {
+    'locmem': 'django.core.cache.backends.locmem.LocMemCache',
+    'file': 'django.core.cache.backends.filebased.FileBasedCache',
+}
+_cache_backend = os.getenv('CACHE_BACKEND', 'locmem')
+CACHES = {
+    'default': {
+        'BACKEND': CACHE_BACKENDS.get(_cache_backend, _cache_backend),
+        'LOCATION': os.getenv('CACHE_LOCATION', str(BASE_DIR / '.cache') if _cache_backend == 'file' else 'jobportal'),
+    }
+}
+
+# Seconds a public /api/jobs/ page stays cached; writes invalidate sooner
+JOB_LIST_CACHE_TIMEOUT = int(os.getenv('JOB_LIST_CACHE_TIMEOUT', 300))
+
 from datetime import timedelta
 
 SIMPLE_JWT = {
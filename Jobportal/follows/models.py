@@ -8,6 +8,10 @@ class Follow(models.Model):
 
     class Meta:
         unique_together = ('follower', 'following')
+        indexes = [
+            models.Index(fields=['follower', '-created_at', '-id'], name='follow_follower_created_idx'),
+            models.Index(fields=['following', '-created_at', '-id'], name='follow_following_created_idx'),
+        ]
 
     def __str__(self):
         return f"{self.follower.username} follows {self.following.username}"
\ No newline at end of file
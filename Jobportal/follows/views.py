@@ -116,9 +116,9 @@ class MyFollowingView(generics.ListAPIView):
     permission_classes = [IsAuthenticated]
 
     def get(self, request):
-        following = Follow.objects.filter(follower=request.user).select_related('following')
+        following = Follow.objects.filter(follower=request.user).select_related('following').order_by('-created_at')
         users = []
-        for f in following:
+        for f in self.paginate_queryset(following):
             user = f.following
             user_data = {
                 'id': user.id,
@@ -139,15 +139,20 @@ class MyFollowingView(generics.ListAPIView):
             display_data = get_user_display_data(user)
             user_data.update(display_data)
             users.append(user_data)
-        return Response({'following': users, 'count': len(users)})
+        return Response({
+            'following': users,
+            'count': following.count(),
+            'next': self.paginator.get_next_link(),
+            'previous': self.paginator.get_previous_link()
+        })
 
 class MyFollowersView(generics.ListAPIView):
     permission_classes = [IsAuthenticated]
 
     def get(self, request):
-        followers = Follow.objects.filter(following=request.user).select_related('follower')
+        followers = Follow.objects.filter(following=request.user).select_related('follower').order_by('-created_at')
         users = []
-        for f in followers:
+        for f in self.paginate_queryset(followers):
             user = f.follower
             user_data = {
                 'id': user.id,
@@ -168,7 +173,12 @@ class MyFollowersView(generics.ListAPIView):
             display_data = get_user_display_data(user)
             user_data.update(display_data)
             users.append(user_data)
-        return Response({'followers': users, 'count': len(users)})
+        return Response({
+            'followers': users,
+            'count': followers.count(),
+            'next': self.paginator.get_next_link(),
+            'previous': self.paginator.get_previous_link()
+        })
 
 class NetworkStatsView(generics.RetrieveAPIView):
     permission_classes = [IsAuthenticated]
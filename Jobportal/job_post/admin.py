@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import JobPost
+from .models import JobPost, SavedSearch, JobAlert
 
 @admin.register(JobPost)
 class JobPostAdmin(admin.ModelAdmin):
@@ -7,3 +7,15 @@ class JobPostAdmin(admin.ModelAdmin):
     search_fields = ("title", "publisher__email", "publisher__first_name", "publisher__last_name")
     list_filter = ("job_type", "publisher_role", "is_active")
     readonly_fields = ("id", "created_at", "updated_at")
+
+
+@admin.register(SavedSearch)
+class SavedSearchAdmin(admin.ModelAdmin):
+    list_display = ("name", "user", "job_type", "work_mode", "is_active", "created_at")
+    search_fields = ("name", "user__email")
+    list_filter = ("is_active",)
+
+@admin.register(JobAlert)
+class JobAlertAdmin(admin.ModelAdmin):
+    list_display = ("job", "user", "saved_search", "created_at", "sent_at")
+    search_fields = ("user__email", "job__title")
@@ -0,0 +1,151 @@
+"""
+Saved-search job alerts.
+
+Saved searches are indexed by their discrete filters (job_type, work_mode,
+skills and one location token). A batch of new jobs first selects only the
+searches that could match it through those indexes, then evaluates each
+distinct candidate query once against the batch with the same filters the job
+list uses. Matches are queued as JobAlert digest entries.
+"""
+import re
+from types import SimpleNamespace
+from django.db.models import Q
+from django.http import QueryDict
+from .skills import canonical_skills
+
+_WORD_RE = re.compile(r'\w+')
+# Longer location words are not worth expanding into every substring
+_MAX_TOKEN_LENGTH = 32
+
+
+def saved_search_param_names():
+    from .filters import JobSearchFilter, JobNearFilter
+    from .views import JobFilterMixin
+    return JobFilterMixin.filter_params + (
+        JobSearchFilter.search_param, JobNearFilter.near_param, JobNearFilter.radius_param
+    )
+
+
+def normalize_search_params(params):
+    """Keep the supported, non-empty job list params as stripped strings"""
+    from .views import JobFilterMixin
+    normalized = {}
+    for name in saved_search_param_names():
+        value = params.get(name)
+        if value in (None, ''):
+            continue
+        value = str(value).strip()
+        if name in JobFilterMixin.case_insensitive_params:
+            value = value.lower()
+        if value:
+            normalized[name] = value
+    return normalized
+
+
+def location_token(location):
+    """The longest word of a location query; every matching job contains it"""
+    words = _WORD_RE.findall((location or '').lower())
+    return max(words, key=len)[:_MAX_TOKEN_LENGTH] if words else None
+
+
+def _location_substrings(location):
+    """Every substring of every word, so partial words like 'bang' are found"""
+    substrings = set()
+    for word in _WORD_RE.findall((location or '').lower()):
+        word = word[:_MAX_TOKEN_LENGTH]
+        for start in range(len(word)):
+            for end in range(start + 1, len(word) + 1):
+                substrings.add(word[start:end])
+    return substrings
+
+
+def search_index_fields(params):
+    """Denormalized SavedSearch columns used to find candidate searches"""
+    return {
+        'job_type': params.get('job_type') or None,
+        'work_mode': params.get('work_mode') or None,
+        'skills': canonical_skills(params.get('skills')),
+        'location_token': location_token(params.get('location')),
+    }
+
+
+def candidate_searches(jobs):
+    """Active saved searches whose indexed filters could match any of `jobs`"""
+    from .models import SavedSearch
+
+    job_types = {job.job_type for job in jobs}
+    work_modes = {job.work_mode for job in jobs}
+    skills = {skill for job in jobs for skill in (job.skills or [])}
+    tokens = set()
+    for job in jobs:
+        tokens |= _location_substrings(job.location)
+
+    skills_match = Q(skills=[])
+    if skills:
+        # Both "all of" and "any of" searches need at least one shared skill
+        skills_match |= Q(skills__has_any_keys=sorted(skills))
+    location_match = Q(location_token__isnull=True)
+    if tokens:
+        location_match |= Q(location_token__in=tokens)
+
+    return SavedSearch.objects.filter(
+        Q(job_type__isnull=True) | Q(job_type__in=job_types),
+        Q(work_mode__isnull=True) | Q(work_mode__in=work_modes),
+        skills_match,
+        location_match,
+        is_active=True,
+    ).select_related('user')
+
+
+def _evaluate(params, user, job_ids):
+    """Ids among job_ids that the job list would return for `params`"""
+    from .filters import JobSearchFilter, JobNearFilter
+    from .models import JobPost
+    from .views import JobFilterMixin
+
+    query_params = QueryDict(mutable=True)
+    query_params.update(params)
+    request = SimpleNamespace(query_params=query_params, GET=query_params, user=user)
+
+    matcher = JobFilterMixin()
+    matcher.request = request
+    queryset = matcher._apply_filters(JobPost.objects.filter(id__in=job_ids))
+    for backend in (JobSearchFilter, JobNearFilter):
+        queryset = backend().filter_queryset(request, queryset, None)
+    return set(queryset.order_by().values_list('id', flat=True))
+
+
+def match_new_jobs(jobs):
+    """
+    Queue JobAlert digest entries for every saved search matching a job in
+    `jobs`. Returns the number of matches, including already queued ones.
+    """
+    from .models import JobAlert
+
+    jobs = [job for job in jobs if job.is_active and job.deleted_at is None]
+    if not jobs:
+        return 0
+    job_ids = [job.id for job in jobs]
+
+    # Identical queries are evaluated once; near=me depends on the user
+    groups = {}
+    for search in candidate_searches(jobs):
+        key = tuple(sorted(search.params.items()))
+        if search.params.get('near') == 'me':
+            key += (('user', search.user_id),)
+        groups.setdefault(key, []).append(search)
+
+    publishers = {job.id: job.publisher_id for job in jobs}
+    alerts = []
+    for searches in groups.values():
+        matched = _evaluate(searches[0].params, searches[0].user, job_ids)
+        for search in searches:
+            alerts.extend(
+                JobAlert(user_id=search.user_id, saved_search=search, job_id=job_id)
+                for job_id in matched
+                # Publishers are not alerted about their own postings
+                if publishers[job_id] != search.user_id
+            )
+    # Re-running a batch is harmless: (saved_search, job) is unique
+    JobAlert.objects.bulk_create(alerts, ignore_conflicts=True)
+    return len(alerts)
@@ -0,0 +1,95 @@
+"""
+Applicant match scores for ?ordering=match on a job's applicant list.
+
+A score in [0, 1] blends how many of the job's skills an applicant lists
+with how well their experience_years fits the job's experience range. Scores
+are computed for all unscored applications of a job in one vectorized batch
+and stored on JobApplication.match_score, which doubles as the cache: it is
+cleared (set to NULL) when the job's requirements or an applicant's profile
+change, and the next ranked request rescores only those rows.
+"""
+import numpy as np
+
+from .skills import canonical_skills
+
+SKILL_WEIGHT = 0.7
+EXPERIENCE_WEIGHT = 0.3
+# Fields whose change invalidates stored scores
+JOB_SCORE_FIELDS = {'skills', 'experience', 'experience_min_years', 'experience_max_years'}
+PROFILE_SCORE_FIELDS = {'skills', 'experience_years'}
+
+
+def skill_scores(job_skills, applicant_skills):
+    """Fraction of `job_skills` listed by each applicant, as a float array"""
+    columns = {skill: column for column, skill in enumerate(canonical_skills(job_skills))}
+    if not columns:
+        return None
+    matrix = np.zeros((len(applicant_skills), len(columns)), dtype=bool)
+    for row, skills in enumerate(applicant_skills):
+        matched = [columns[skill] for skill in canonical_skills(skills) if skill in columns]
+        matrix[row, matched] = True
+    return matrix.sum(axis=1) / len(columns)
+
+
+def experience_scores(min_years, max_years, years):
+    """
+    1 inside [min_years, max_years], a linear ramp up to min_years below it and
+    0 when the applicant gave no experience. Over-qualified applicants still fit.
+    """
+    if min_years is None and max_years is None:
+        return None
+    years = np.array([np.nan if value is None else value for value in years], dtype=float)
+    minimum = min_years or 0
+    if minimum:
+        scores = np.clip(years / minimum, 0, 1)
+    else:
+        scores = np.ones_like(years)
+    return np.nan_to_num(scores, nan=0.0)
+
+
+def score_applicants(job, applicant_skills, applicant_years):
+    """Match scores for applicants of `job`, in input order"""
+    components = []
+    skills = skill_scores(job.skills, applicant_skills)
+    if skills is not None:
+        components.append((SKILL_WEIGHT, skills))
+    experience = experience_scores(job.experience_min_years, job.experience_max_years, applicant_years)
+    if experience is not None:
+        components.append((EXPERIENCE_WEIGHT, experience))
+    if not components:
+        return np.zeros(len(applicant_skills))
+
+    total_weight = sum(weight for weight, _ in components)
+    scores = sum(weight * values for weight, values in components) / total_weight
+    return np.round(scores, 4)
+
+
+def refresh_match_scores(job):
+    """Score every application of `job` that has no stored score; returns the count"""
+    from .models import JobApplication
+
+    rows = list(
+        JobApplication.objects.filter(job=job, match_score__isnull=True)
+        .order_by()
+        .values_list('id', 'applicant__userprofile__skills', 'applicant__userprofile__experience_years')
+    )
+    if not rows:
+        return 0
+    ids, skills, years = zip(*rows)
+    scores = score_applicants(job, [value or [] for value in skills], years)
+    applications = [
+        JobApplication(id=application_id, match_score=float(score))
+        for application_id, score in zip(ids, scores)
+    ]
+    JobApplication.objects.bulk_update(applications, ['match_score'], batch_size=1000)
+    return len(applications)
+
+
+def clear_job_scores(job_id):
+    from .models import JobApplication
+    JobApplication.objects.filter(job_id=job_id, match_score__isnull=False).update(match_score=None)
+
+
+def clear_applicant_scores(user_id):
+    from .models import JobApplication
+    JobApplication.objects.filter(applicant_id=user_id, match_score__isnull=False).update(match_score=None)
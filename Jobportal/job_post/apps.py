@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class JobPostConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'job_post'
+
+    def ready(self):
+        from .signals import connect_signals
+        connect_signals()
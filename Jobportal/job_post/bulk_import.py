@@ -0,0 +1,156 @@
+"""
+Bulk job import from CSV or JSON Lines uploads.
+
+Rows are read one at a time from the uploaded file, validated with
+JobPostDetailSerializer and inserted with bulk_create in chunks, so memory
+stays flat however large the file is. bulk_create skips JobPost.save() and
+post_save, so each chunk derives the parsed columns up front, fills the
+search vector with one UPDATE and bumps the job list cache generation.
+New rows keep alerts_pending and a fresh updated_at, which the alert matcher
+and the recommendation index pick up on their own.
+"""
+import csv
+import io
+import json
+
+from django.db import transaction
+from rest_framework.exceptions import ValidationError
+from rest_framework.serializers import as_serializer_error
+
+from .list_cache import bump_generation
+from .models import JobPost
+from .publisher import publisher_display_fields
+from .search import job_search_vector
+
+CHUNK_SIZE = 500
+# Per-row errors kept in the report; the rest are only counted
+MAX_REPORTED_ERRORS = 200
+FORMATS = ('csv', 'jsonl')
+# CSV cells holding a list, written as "first | second"
+CSV_LIST_FIELDS = ('requirements', 'skills')
+
+
+class ImportFileError(ValueError):
+    """The upload cannot be read any further"""
+
+
+def detect_format(upload, requested=None):
+    if requested:
+        return requested.lower() if requested.lower() in FORMATS else None
+    name = (getattr(upload, 'name', '') or '').lower()
+    if name.endswith('.csv'):
+        return 'csv'
+    if name.endswith(('.jsonl', '.ndjson')):
+        return 'jsonl'
+    return None
+
+
+def _text_lines(upload):
+    upload.seek(0)
+    return io.TextIOWrapper(upload.file, encoding='utf-8-sig', newline='')
+
+
+def _csv_rows(upload):
+    reader = csv.DictReader(_text_lines(upload))
+    while True:
+        try:
+            row = next(reader)
+        except StopIteration:
+            return
+        except csv.Error as e:
+            raise ImportFileError(f"Malformed CSV near line {reader.line_num}: {str(e)}")
+        data = {}
+        for field, value in row.items():
+            # Empty cells fall back to the field default, like an omitted key
+            if field is None or value is None or not value.strip():
+                continue
+            value = value.strip()
+            if field in CSV_LIST_FIELDS:
+                value = [part.strip() for part in value.split('|') if part.strip()]
+            data[field.strip()] = value
+        yield reader.line_num, data, None
+
+
+def _jsonl_rows(upload):
+    for line_number, line in enumerate(_text_lines(upload), start=1):
+        if not line.strip():
+            continue
+        try:
+            data = json.loads(line)
+        except ValueError:
+            yield line_number, None, {'non_field_errors': ['Invalid JSON.']}
+            continue
+        if not isinstance(data, dict):
+            yield line_number, None, {'non_field_errors': ['Each line must be a JSON object.']}
+            continue
+        yield line_number, data, None
+
+
+def iter_rows(upload, file_format):
+    """Yield (line number, row dict, parse errors) from the upload"""
+    try:
+        yield from (_csv_rows(upload) if file_format == 'csv' else _jsonl_rows(upload))
+    except UnicodeDecodeError:
+        raise ImportFileError('File must be UTF-8 encoded.')
+
+
+def _build_job(validated_data, publisher, display_fields):
+    job = JobPost(publisher=publisher, publisher_role=publisher.job_role, **validated_data)
+    for field, value in display_fields.items():
+        setattr(job, field, value)
+    # The derivations save() would run on create
+    job.apply_schedule()
+    job.apply_salary_range()
+    job.apply_experience_range()
+    job.apply_coordinates()
+    return job
+
+
+def _insert(jobs):
+    with transaction.atomic():
+        created = JobPost.objects.bulk_create(jobs)
+        JobPost.objects.filter(id__in=[job.id for job in created]).update(search_vector=job_search_vector())
+        bump_generation()
+    return len(created)
+
+
+def import_jobs(upload, file_format, publisher, serializer_class, context=None):
+    """
+    Import every valid row of `upload` as a job published by `publisher`.
+    Returns a report with created/failed counts and per-row errors; rows
+    inserted before an ImportFileError stay committed and are counted.
+    """
+    display_fields = publisher_display_fields(publisher)
+    # One serializer validates every row: building its fields per row would
+    # cost more than the inserts
+    serializer = serializer_class(context=context or {})
+    report = {'created': 0, 'failed': 0, 'errors': [], 'errors_truncated': False, 'file_error': None}
+    chunk = []
+
+    def fail(line_number, errors):
+        report['failed'] += 1
+        if len(report['errors']) < MAX_REPORTED_ERRORS:
+            report['errors'].append({'row': line_number, 'errors': errors})
+        else:
+            report['errors_truncated'] = True
+
+    try:
+        for line_number, data, errors in iter_rows(upload, file_format):
+            if errors:
+                fail(line_number, errors)
+                continue
+            try:
+                validated_data = serializer.run_validation(data)
+            except ValidationError as e:
+                fail(line_number, as_serializer_error(e))
+                continue
+            chunk.append(_build_job(validated_data, publisher, display_fields))
+            if len(chunk) >= CHUNK_SIZE:
+                report['created'] += _insert(chunk)
+                chunk = []
+    except ImportFileError as e:
+        report['file_error'] = str(e)
+
+    if chunk:
+        report['created'] += _insert(chunk)
+    return report
@@ -0,0 +1,82 @@
+"""
+Reconciliation of denormalized counters.
+
+Counters are kept with atomic F() updates where the counted rows change, but
+cascading deletes, failed requests and manual fixes can still leave them
+drifted. reconcile_counter() walks the parent table in primary key chunks,
+compares each stored value with one grouped COUNT over the child table and
+rewrites only the drifted rows. The rewrite recounts inside the UPDATE
+itself, so increments that land between the check and the fix are kept.
+"""
+from collections import namedtuple
+
+from django.apps import apps
+from django.db.models import Count, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+Counter = namedtuple('Counter', 'model field child foreign_key')
+
+# (parent model, counter field, child model, child FK to the parent)
+COUNTERS = (
+    Counter('job_post.JobPost', 'application_count', 'job_post.JobApplication', 'job'),
+    Counter('posts.Post', 'likes_count', 'posts.PostLike', 'post'),
+    Counter('posts.Post', 'comments_count', 'posts.Comment', 'post'),
+)
+DEFAULT_CHUNK_SIZE = 2000
+
+
+def counter_label(counter):
+    return f'{counter.model}.{counter.field}'
+
+
+def _child_counts(counter):
+    return apps.get_model(counter.child).objects.values(counter.foreign_key).order_by()
+
+
+def reconcile_counter(counter, chunk_size=DEFAULT_CHUNK_SIZE, fix=True):
+    """
+    Check every row of `counter.model`. Returns a report with rows checked,
+    rows drifted, the summed absolute drift and up to 10 (pk, stored, actual)
+    samples; drifted rows are rewritten unless `fix` is False.
+    """
+    model = apps.get_model(counter.model)
+    fk_id = f'{counter.foreign_key}_id'
+    recount = Coalesce(
+        Subquery(
+            _child_counts(counter)
+            .filter(**{counter.foreign_key: OuterRef('pk')})
+            .annotate(total=Count('pk'))
+            .values('total')
+        ),
+        Value(0),
+        output_field=IntegerField(),
+    )
+
+    report = {'checked': 0, 'drifted': 0, 'drift': 0, 'fixed': 0, 'samples': []}
+    last_pk = None
+    while True:
+        rows = model.objects.order_by('pk')
+        if last_pk is not None:
+            rows = rows.filter(pk__gt=last_pk)
+        stored = list(rows.values_list('pk', counter.field)[:chunk_size])
+        if not stored:
+            return report
+        last_pk = stored[-1][0]
+        first_pk = stored[0][0]
+
+        actual = dict(
+            _child_counts(counter)
+            .filter(**{f'{fk_id}__gte': first_pk, f'{fk_id}__lte': last_pk})
+            .annotate(total=Count('pk'))
+            .values_list(fk_id, 'total')
+        )
+        drifted = [(pk, value, actual.get(pk, 0)) for pk, value in stored if value != actual.get(pk, 0)]
+
+        report['checked'] += len(stored)
+        report['drifted'] += len(drifted)
+        report['drift'] += sum(abs(value - count) for _, value, count in drifted)
+        report['samples'].extend(drifted[:10 - len(report['samples'])])
+        if drifted and fix:
+            report['fixed'] += model.objects.filter(pk__in=[pk for pk, _, _ in drifted]).update(
+                **{counter.field: recount}
+            )
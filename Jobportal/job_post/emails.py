@@ -0,0 +1,30 @@
+from outbox.mail import queue_mail
+
+
+def get_provider_email(publisher):
+    """Get email address for job provider"""
+    if publisher.job_role == 'Company':
+        try:
+            return publisher.companyprofile.company_email
+        except AttributeError:
+            return publisher.email
+    return publisher.email
+
+
+def build_notification_message(job, applicant):
+    """Build email notification message"""
+    return (f'Hello,\n\n'
+            f'You have received a new application for your job posting "{job.title}".\n\n'
+            f'Applicant: {applicant.first_name} {applicant.last_name}\n'
+            f'Email: {applicant.email}\n\n'
+            f'Please log in to your account to review the application.\n\n'
+            f'Best regards,\nJob Portal Team')
+
+
+def queue_application_notification(job, applicant):
+    """Put the job provider's new-application email in the outbox"""
+    return queue_mail(
+        f'New Application for {job.title}',
+        build_notification_message(job, applicant),
+        [get_provider_email(job.publisher)],
+    )
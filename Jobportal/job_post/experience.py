@@ -0,0 +1,44 @@
+"""
+Parse free-text JobPost.experience values into year ranges
+"""
+import math
+import re
+
+_FRESHER_RE = re.compile(r'\b(fresher|freshers|entry[\s-]*level|no\s+experience)\b')
+_NUMBER_RE = re.compile(r'(\d+(?:\.\d+)?)')
+_MONTHS_RE = re.compile(r'\b(months?|mos?)\b')
+_UP_TO_RE = re.compile(r'\b(up\s*to|upto|max(imum)?|less\s+than|under|below)\b|<')
+_PLUS_RE = re.compile(r'\+|\b(min(imum)?|at\s*least|over|above|more\s+than)\b')
+# Anything longer is a year ('2021') or a typo, not a career length
+MAX_YEARS = 60
+
+
+def parse_experience(text):
+    """
+    Parse '2-4 years', '2+ yrs', '3 years', 'Up to 2 years', '6 months' or
+    'Fresher' into (min_years, max_years). max_years is None for open-ended
+    ranges; unparseable text or values over MAX_YEARS yield (None, None).
+    """
+    if not text:
+        return None, None
+
+    value = str(text).lower()
+    numbers = [float(number) for number in _NUMBER_RE.findall(value)[:2]]
+    if not numbers:
+        if _FRESHER_RE.search(value):
+            return 0, 0
+        return None, None
+
+    if _MONTHS_RE.search(value):
+        numbers = [number / 12 for number in numbers]
+    if any(number > MAX_YEARS for number in numbers):
+        return None, None
+
+    if len(numbers) == 2:
+        low, high = sorted(numbers)
+        return math.floor(low), math.ceil(high)
+    if _UP_TO_RE.search(value):
+        return 0, math.ceil(numbers[0])
+    if _PLUS_RE.search(value):
+        return math.floor(numbers[0]), None
+    return math.floor(numbers[0]), math.ceil(numbers[0])
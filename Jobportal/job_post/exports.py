@@ -0,0 +1,54 @@
+"""
+Streaming CSV export of a job's applicants.
+
+Rows are read through a server-side cursor (QuerySet.iterator) and written
+to the response as they arrive, so the export runs in constant memory and
+the first bytes go out before the query has finished.
+"""
+import csv
+
+from django.http import StreamingHttpResponse
+
+from .models import JobApplication
+
+CHUNK_SIZE = 2000
+# Rows joined into each chunk sent to the client
+ROWS_PER_WRITE = 200
+HEADER = ('name', 'email', 'status', 'applied_at', 'resume_url')
+# Cells starting with these are run as formulas by spreadsheet apps
+FORMULA_PREFIXES = ('=', '+', '-', '@', '\t', '\r')
+
+
+class _Echo:
+    """File-like object whose write() hands the formatted line back to csv.writer"""
+
+    def write(self, value):
+        return value
+
+
+def _cell(value):
+    value = '' if value is None else str(value)
+    return f"'{value}" if value.startswith(FORMULA_PREFIXES) else value
+
+
+def applicant_csv_lines(queryset, request):
+    writer = csv.writer(_Echo())
+    storage = JobApplication._meta.get_field('resume').storage
+    # Byte order mark so spreadsheet apps read the file as UTF-8
+    yield '\ufeff' + writer.writerow(HEADER)
+    rows = queryset.values_list('applicant_name', 'applicant_email', 'status', 'applied_at', 'resume')
+    lines = []
+    for name, email, status, applied_at, resume in rows.iterator(chunk_size=CHUNK_SIZE):
+        resume_url = request.build_absolute_uri(storage.url(resume)) if resume else ''
+        lines.append(writer.writerow((_cell(name), _cell(email), status, applied_at.isoformat(), resume_url)))
+        if len(lines) == ROWS_PER_WRITE:
+            yield ''.join(lines)
+            lines = []
+    if lines:
+        yield ''.join(lines)
+
+
+def stream_applicants_csv(queryset, request, filename):
+    response = StreamingHttpResponse(applicant_csv_lines(queryset, request), content_type='text/csv; charset=utf-8')
+    response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    return response
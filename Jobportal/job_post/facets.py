@@ -0,0 +1,86 @@
+"""
+Facet counts for the job board filter sidebar
+"""
+from django.db import connection
+from django.db.models import BooleanField, ExpressionWrapper
+from .models import JobPost
+
+FACET_FIELDS = ('job_type', 'work_mode', 'experience', 'location')
+TOP_LOCATIONS = 10
+
+
+def _count_matching(flags):
+    """COUNT(*) over the rows where every flag column is true"""
+    if not flags:
+        return 'COUNT(*)'
+    return f"COUNT(*) FILTER (WHERE {' AND '.join(flags)})"
+
+
+def compute_job_facets(queryset, facet_filters=None, top_locations=TOP_LOCATIONS):
+    """
+    Count jobs per facet value with a single GROUPING SETS aggregate over
+    the filtered queryset.
+
+    `facet_filters` maps facet fields to the Q filters the user picked for
+    them. Each facet's counts apply every filter but its own, so picking a
+    job type still shows how many jobs the other types have; the total
+    applies them all.
+    """
+    facet_filters = facet_filters or {}
+    flags = {field: f'match_{field}' for field in facet_filters}
+    queryset = queryset.order_by().annotate(**{
+        flags[field]: ExpressionWrapper(condition, output_field=BooleanField())
+        for field, condition in facet_filters.items()
+    })
+    inner_sql, params = queryset.values(*FACET_FIELDS, *flags.values()).query.sql_with_params()
+    columns = ', '.join(FACET_FIELDS)
+    grouping_sets = ', '.join(f'({field})' for field in FACET_FIELDS)
+    counts = [
+        _count_matching([flag for other, flag in flags.items() if other != field])
+        for field in FACET_FIELDS
+    ]
+    counts.append(_count_matching(list(flags.values())))
+    sql = (
+        f"SELECT {columns}, GROUPING({columns}), {', '.join(counts)} "
+        f'FROM ({inner_sql}) AS filtered_jobs '
+        f'GROUP BY GROUPING SETS ({grouping_sets}, ())'
+    )
+
+    # GROUPING() sets one bit per column that is *not* grouped in a row,
+    # so each facet's rows carry every bit except its own
+    all_bits = (1 << len(FACET_FIELDS)) - 1
+    facet_masks = {
+        all_bits ^ (1 << (len(FACET_FIELDS) - 1 - index)): field
+        for index, field in enumerate(FACET_FIELDS)
+    }
+
+    facets = {field: [] for field in FACET_FIELDS}
+    total = 0
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        for row in cursor.fetchall():
+            values = row[:len(FACET_FIELDS)]
+            grouping = row[len(FACET_FIELDS)]
+            counts = row[len(FACET_FIELDS) + 1:]
+            if grouping == all_bits:
+                total = counts[-1]
+                continue
+            field = facet_masks[grouping]
+            index = FACET_FIELDS.index(field)
+            value, count = values[index], counts[index]
+            if value in (None, '') or not count:
+                continue
+            facets[field].append({'value': value, 'count': count})
+
+    labels = {
+        'job_type': dict(JobPost.JOB_TYPE_CHOICES),
+        'work_mode': dict(JobPost.WORK_MODE_CHOICES),
+    }
+    for field, buckets in facets.items():
+        buckets.sort(key=lambda bucket: (-bucket['count'], str(bucket['value'])))
+        for bucket in buckets:
+            if field in labels:
+                bucket['label'] = labels[field].get(bucket['value'], bucket['value'])
+    facets['location'] = facets['location'][:top_locations]
+    facets['total'] = total
+    return facets
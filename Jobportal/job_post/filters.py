@@ -0,0 +1,84 @@
+from django.db.models import F
+from rest_framework.filters import BaseFilterBackend, OrderingFilter
+from authentication.geo import haversine_km, normalize_location, within_bounding_box
+from .search import search_jobs
+
+
+class JobSearchFilter(BaseFilterBackend):
+    """Full-text `?search=` over JobPost.search_vector, best matches first"""
+    search_param = 'search'
+
+    def filter_queryset(self, request, queryset, view):
+        terms = request.query_params.get(self.search_param, '').strip()
+        if not terms:
+            return queryset
+
+        queryset = search_jobs(queryset, terms)
+        # An explicit ?ordering= wins over relevance
+        if request.query_params.get(OrderingFilter.ordering_param):
+            return queryset
+        return queryset.order_by('-search_rank', '-created_at')
+
+
+class JobNearFilter(BaseFilterBackend):
+    """
+    `?near=<city>&radius_km=` radius search, nearest first. `near=me` uses the
+    requesting user's profile location.
+    """
+    near_param = 'near'
+    radius_param = 'radius_km'
+    default_radius_km = 25
+    max_radius_km = 500
+
+    def get_origin(self, request):
+        """(latitude, longitude) for ?near=, or None when it cannot be resolved"""
+        near = request.query_params.get(self.near_param, '').strip()
+        if near.lower() == 'me':
+            profile = getattr(request.user, 'userprofile', None) if request.user.is_authenticated else None
+            if profile is None or profile.latitude is None:
+                return None
+            return profile.latitude, profile.longitude
+        city = normalize_location(near)
+        return (city.latitude, city.longitude) if city else None
+
+    def get_radius(self, request):
+        try:
+            radius = float(request.query_params.get(self.radius_param, self.default_radius_km))
+        except ValueError:
+            radius = self.default_radius_km
+        return min(max(radius, 0), self.max_radius_km)
+
+    def filter_queryset(self, request, queryset, view):
+        if not request.query_params.get(self.near_param, '').strip():
+            return queryset
+
+        origin = self.get_origin(request)
+        if origin is None:
+            return queryset.none()
+        radius = self.get_radius(request)
+
+        # The (latitude, longitude) index narrows to a box; haversine then
+        # drops the corners
+        queryset = queryset.filter(within_bounding_box(*origin, radius)).annotate(
+            distance_km=haversine_km(*origin)
+        ).filter(distance_km__lte=radius)
+        if request.query_params.get(OrderingFilter.ordering_param):
+            return queryset
+        return queryset.order_by('distance_km', '-created_at')
+
+
+class JobOrderingFilter(OrderingFilter):
+    """
+    OrderingFilter that also accepts `?ordering=salary` / `-salary`, sorting
+    on the parsed yearly salary_min with unparsed salaries always last.
+    """
+    expressions = {
+        'salary': F('salary_min').asc(nulls_last=True),
+        '-salary': F('salary_min').desc(nulls_last=True),
+    }
+
+    def filter_queryset(self, request, queryset, view):
+        ordering = self.get_ordering(request, queryset, view)
+        if ordering:
+            return queryset.order_by(*[self.expressions.get(term, term) for term in ordering])
+        return queryset
@@ -0,0 +1,134 @@
+"""
+Scheduled publishing and auto-expiry of jobs.
+
+Due jobs are flipped with batched UPDATEs that mirror JobPost.activate() and
+deactivate(). Each pass only selects rows that still need the change, so
+runs are idempotent and several workers can share the backlog (rows locked
+by another worker are skipped). UPDATEs bypass save() and its signals, so
+every batch sets updated_at itself (the recommendation index syncs on it)
+and bumps the job list cache generation.
+
+transition_jobs() applies the same state changes to a set of an employer's
+jobs in one UPDATE.
+"""
+import logging
+
+from django.db import transaction
+from django.db.models import Case, Count, F, Min, Q, When
+from django.utils import timezone
+
+from .list_cache import bump_generation
+from .models import JobPost
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 500
+# Bulk action -> per-id result
+BULK_ACTIONS = {'activate': 'activated', 'deactivate': 'deactivated', 'delete': 'deleted'}
+
+
+def due_for_publish(now):
+    return JobPost.objects.filter(publish_at__lte=now)
+
+
+def due_for_expiry(now):
+    return JobPost.objects.filter(is_active=True, expires_at__lte=now)
+
+
+def _update_in_batches(queryset, batch_size, **changes):
+    updated = 0
+    while True:
+        with transaction.atomic():
+            ids = list(
+                queryset.order_by('id')
+                .select_for_update(skip_locked=True)
+                .values_list('id', flat=True)[:batch_size]
+            )
+            if not ids:
+                return updated
+            updated += JobPost.objects.filter(id__in=ids).update(updated_at=timezone.now(), **changes)
+            bump_generation()
+
+
+def publish_due_jobs(now=None, batch_size=DEFAULT_BATCH_SIZE):
+    """Activate jobs whose publish_at has passed; returns the number published"""
+    now = now or timezone.now()
+    due = due_for_publish(now)
+    lapsed = Q(expires_at__lte=now) | Q(deleted_at__isnull=False)
+    # Expired or deleted before their publish date: drop the schedule only
+    _update_in_batches(due.filter(lapsed), batch_size, publish_at=None)
+    # alerts_pending re-queues the job for saved-search alerts, which skipped it while inactive
+    return _update_in_batches(
+        due.exclude(lapsed), batch_size,
+        is_active=True, publish_at=None, alerts_pending=True,
+    )
+
+
+def expire_due_jobs(now=None, batch_size=DEFAULT_BATCH_SIZE):
+    """Deactivate active jobs whose expires_at has passed; returns the number expired"""
+    now = now or timezone.now()
+    return _update_in_batches(due_for_expiry(now), batch_size, is_active=False)
+
+
+def lifecycle_backlog(now=None):
+    """
+    Jobs already due but not yet processed, and how late the oldest one is.
+    A growing backlog means the scheduler is not running often enough.
+    """
+    now = now or timezone.now()
+    publish = due_for_publish(now).aggregate(count=Count('id'), oldest=Min('publish_at'))
+    expire = due_for_expiry(now).aggregate(count=Count('id'), oldest=Min('expires_at'))
+    oldest = [value for value in (publish['oldest'], expire['oldest']) if value is not None]
+    return {
+        'publish_due': publish['count'],
+        'expire_due': expire['count'],
+        'max_lag_seconds': (now - min(oldest)).total_seconds() if oldest else 0.0,
+    }
+
+
+def run_lifecycle(now=None, batch_size=DEFAULT_BATCH_SIZE):
+    """One scheduler pass: publish, then expire, then report what is left"""
+    now = now or timezone.now()
+    published = publish_due_jobs(now, batch_size)
+    expired = expire_due_jobs(now, batch_size)
+    backlog = lifecycle_backlog()
+    if published or expired:
+        logger.info(f"Job lifecycle: published {published}, expired {expired}")
+    return published, expired, backlog
+
+
+def _transition_changes(action, now):
+    """Column values matching JobPost.activate(), deactivate() and soft_delete()"""
+    if action == 'activate':
+        return {
+            # Saved-search alerts skipped the job while it was inactive
+            'alerts_pending': Case(When(is_active=False, then=True), default=F('alerts_pending')),
+            'is_active': True,
+            'deleted_at': None,
+            'publish_at': None,
+            'expires_at': Case(When(expires_at__lte=now, then=None), default=F('expires_at')),
+        }
+    changes = {'is_active': False, 'publish_at': None}
+    if action == 'delete':
+        changes['deleted_at'] = now
+    return changes
+
+
+def transition_jobs(publisher, job_ids, action):
+    """
+    Apply a bulk action to the jobs in `job_ids` that `publisher` owns.
+    Returns (id, result) pairs in request order; ids that do not exist, are
+    someone else's or are already deleted (for delete) report 'not_found'.
+    """
+    now = timezone.now()
+    jobs = JobPost.objects.filter(id__in=job_ids, publisher=publisher)
+    if action == 'delete':
+        jobs = jobs.filter(deleted_at__isnull=True)
+
+    with transaction.atomic():
+        owned = set(jobs.select_for_update().values_list('id', flat=True))
+        if owned:
+            JobPost.objects.filter(id__in=owned).update(updated_at=now, **_transition_changes(action, now))
+            bump_generation()
+
+    return [(job_id, BULK_ACTIONS[action] if job_id in owned else 'not_found') for job_id in job_ids]
@@ -0,0 +1,121 @@
+"""
+Shared response cache for the public job list payload.
+
+Entries are keyed on a generation counter plus the normalized query. Any
+JobPost write bumps the generation (see signals.py), so stale pages are
+never read again and simply expire. The time of the last bump bounds the
+anonymous Last-Modified.
+"""
+import hashlib
+import time
+from datetime import datetime, timezone
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+GENERATION_KEY = 'job-list:generation'
+CHANGED_AT_KEY = 'job-list:changed-at'
+OVERLAY_VERSION_KEY = 'job-overlay:{user_id}'
+STATS_KEYS = {'hit': 'job-list:hits', 'miss': 'job-list:misses'}
+DEFAULT_TIMEOUT = 300
+
+
+def get_timeout():
+    return getattr(settings, 'JOB_LIST_CACHE_TIMEOUT', DEFAULT_TIMEOUT)
+
+
+def get_generation():
+    generation = cache.get(GENERATION_KEY)
+    if generation is None:
+        cache.add(GENERATION_KEY, 1, None)
+        generation = cache.get(GENERATION_KEY, 1)
+    return generation
+
+
+def _increment(key):
+    try:
+        return cache.incr(key)
+    except ValueError:
+        # Missing or evicted; add() keeps a concurrent incr from being lost
+        if not cache.add(key, 1, None):
+            return cache.incr(key)
+        return 1
+
+
+def bump_generation():
+    """
+    Invalidate every cached job list page. Bumped again on commit so pages
+    cached by other requests while the write was still uncommitted are
+    dropped as well.
+    """
+    _invalidate()
+    transaction.on_commit(_invalidate)
+
+
+def _invalidate():
+    _increment(GENERATION_KEY)
+    cache.set(CHANGED_AT_KEY, time.time(), None)
+
+
+def get_changed_at():
+    """
+    When any job list last changed, including jobs leaving it, which no row
+    left on a page can show. Unknown after eviction, so reseeded with now.
+    """
+    changed_at = cache.get(CHANGED_AT_KEY)
+    if changed_at is None:
+        cache.add(CHANGED_AT_KEY, time.time(), None)
+        changed_at = cache.get(CHANGED_AT_KEY, time.time())
+    return datetime.fromtimestamp(changed_at, tz=timezone.utc)
+
+
+def get_overlay_version(user):
+    """
+    Version of `user`'s has_applied/is_following_company flags, bumped when
+    they apply or follow. Seeded from the clock so a version lost to eviction
+    is never reissued.
+    """
+    if not user or not user.is_authenticated:
+        return 0
+    key = OVERLAY_VERSION_KEY.format(user_id=user.pk)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, time.time_ns() // 1000, None)
+        version = cache.get(key, 0)
+    return version
+
+
+def bump_overlay_version(user_id):
+    key = OVERLAY_VERSION_KEY.format(user_id=user_id)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.add(key, time.time_ns() // 1000, None)
+
+
+def make_key(prefix, signature):
+    digest = hashlib.sha1(repr(signature).encode('utf-8')).hexdigest()
+    return f'{prefix}:{get_generation()}:{digest}'
+
+
+def record(outcome):
+    """Count a 'hit' or 'miss' for stats()"""
+    _increment(STATS_KEYS[outcome])
+
+
+def stats():
+    """Hit/miss counters and hit ratio since the last reset"""
+    counts = cache.get_many(STATS_KEYS.values())
+    hits = counts.get(STATS_KEYS['hit'], 0)
+    misses = counts.get(STATS_KEYS['miss'], 0)
+    total = hits + misses
+    return {
+        'hits': hits,
+        'misses': misses,
+        'hit_ratio': round(hits / total, 4) if total else None,
+        'generation': get_generation(),
+    }
+
+
+def reset_stats():
+    cache.delete_many(STATS_KEYS.values())
@@ -0,0 +1,46 @@
+from django.core.management.base import BaseCommand
+
+from job_post.experience import parse_experience
+from job_post.models import JobPost
+
+FIELDS = ['experience_min_years', 'experience_max_years']
+
+
+class Command(BaseCommand):
+    help = ('Parse JobPost.experience into experience_min_years/experience_max_years '
+            'for existing postings, in primary key order and fixed-size batches.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=2000)
+        parser.add_argument('--all', action='store_true',
+                            help='Re-parse every posting, not just those without a parsed range')
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        queryset = JobPost.objects.exclude(experience__isnull=True).exclude(experience='')
+        if not options['all']:
+            queryset = queryset.filter(experience_min_years__isnull=True)
+
+        # Walk the table by id so each batch is a short index range scan and
+        # progress survives an interrupted run
+        last_id = 0
+        scanned = updated = 0
+        while True:
+            batch = list(queryset.filter(id__gt=last_id).order_by('id').only('id', 'experience', *FIELDS)[:batch_size])
+            if not batch:
+                break
+            last_id = batch[-1].id
+            scanned += len(batch)
+
+            changed = []
+            for job in batch:
+                parsed = parse_experience(job.experience)
+                if parsed != (job.experience_min_years, job.experience_max_years):
+                    job.experience_min_years, job.experience_max_years = parsed
+                    changed.append(job)
+            if changed:
+                JobPost.objects.bulk_update(changed, FIELDS)
+                updated += len(changed)
+            self.stdout.write(f'Processed up to id {last_id}: {scanned} scanned, {updated} updated')
+
+        self.stdout.write(self.style.SUCCESS(f'Backfilled experience ranges for {updated} of {scanned} postings'))
@@ -0,0 +1,131 @@
+import queue
+import shutil
+import statistics
+import tempfile
+import threading
+import time
+import uuid
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, connections
+from django.test import override_settings
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from accounts.models import User
+from job_post.models import JobApplication, JobPost
+from job_post.views import JobApplicationView
+from outbox.models import OutboxEmail
+
+
+class Command(BaseCommand):
+    help = ('Submit applications to one hot job from parallel workers and check '
+            'throughput, latency and that counters and duplicates stay exact. '
+            'Benchmark rows are committed (other connections must see them) and '
+            'deleted afterwards.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--applicants', type=int, default=200)
+        parser.add_argument('--workers', type=int, default=16)
+        parser.add_argument('--duplicate-every', type=int, default=10,
+                            help='Every Nth applicant also submits a concurrent duplicate')
+        parser.add_argument('--min-rate', type=float, default=50.0,
+                            help='Minimum submissions per second across all workers')
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'postgresql':
+            raise CommandError('This benchmark requires PostgreSQL.')
+
+        token = uuid.uuid4().hex[:8]
+        media_root = tempfile.mkdtemp(prefix='benchmark-applies-')
+        publisher = User.objects.create_user(
+            email=f'benchmark-publisher-{token}@example.com',
+            first_name='Benchmark',
+            job_role='Company'
+        )
+        applicants = User.objects.bulk_create([
+            User(email=f'benchmark-applicant-{token}-{i}@example.com', first_name=f'Applicant {i}', job_role='Employee')
+            for i in range(options['applicants'])
+        ])
+        job = JobPost.objects.create(title='Benchmark hot job', description='Benchmark posting', publisher=publisher)
+
+        submissions = list(applicants)
+        if options['duplicate_every'] > 0:
+            submissions += applicants[::options['duplicate_every']]
+
+        try:
+            with override_settings(MEDIA_ROOT=media_root):
+                pending = queue.Queue()
+                for user in submissions:
+                    pending.put(user)
+                results = []
+                workers = [
+                    threading.Thread(target=self._worker, args=(job, pending, results))
+                    for _ in range(options['workers'])
+                ]
+                started = time.perf_counter()
+                for worker in workers:
+                    worker.start()
+                for worker in workers:
+                    worker.join()
+                elapsed = time.perf_counter() - started
+
+            created = sum(1 for status_code, _ in results if status_code == 201)
+            rejected = sum(1 for status_code, _ in results if status_code == 400)
+            timings = sorted(ms for _, ms in results)
+            p50 = statistics.median(timings)
+            p95 = timings[int(len(timings) * 0.95) - 1]
+            job.refresh_from_db(fields=['application_count'])
+            stored = JobApplication.objects.filter(job=job).count()
+            queued = self._notifications(publisher).count()
+
+            self.stdout.write(
+                f"{len(submissions)} submissions with {options['workers']} workers in {elapsed:.2f}s "
+                f"({len(submissions) / elapsed:.0f}/s): created={created} duplicates_rejected={rejected} "
+                f"p50 {p50:.1f} ms, p95 {p95:.1f} ms"
+            )
+        finally:
+            self._notifications(publisher).delete()
+            job.delete()
+            User.objects.filter(pk__in=[user.pk for user in applicants] + [publisher.pk]).delete()
+            shutil.rmtree(media_root, ignore_errors=True)
+
+        if not created == stored == job.application_count == len(applicants):
+            raise CommandError(
+                f'Counts disagree: created={created} stored={stored} '
+                f'application_count={job.application_count} expected={len(applicants)}'
+            )
+        if queued != created:
+            raise CommandError(f'Expected {created} queued notifications, got {queued}')
+        if rejected != len(submissions) - len(applicants):
+            raise CommandError(f'Expected {len(submissions) - len(applicants)} duplicates rejected, got {rejected}')
+        rate = len(submissions) / elapsed
+        if rate < options['min_rate']:
+            raise CommandError(f"Throughput of {rate:.0f}/s is below the minimum of {options['min_rate']:.0f}/s")
+        self.stdout.write(self.style.SUCCESS('Concurrent applies consistent and within budget'))
+
+    def _notifications(self, publisher):
+        """Outbox emails queued by the benchmark's applications"""
+        return OutboxEmail.objects.filter(to=[publisher.email])
+
+    def _worker(self, job, pending, results):
+        view = JobApplicationView.as_view()
+        factory = APIRequestFactory()
+        try:
+            while True:
+                try:
+                    user = pending.get_nowait()
+                except queue.Empty:
+                    return
+                request = factory.post(f'/api/jobs/{job.id}/apply/', {
+                    'resume': SimpleUploadedFile('resume.pdf', b'%PDF-1.4 benchmark', content_type='application/pdf'),
+                    'cover_letter': 'Benchmark application',
+                }, format='multipart')
+                force_authenticate(request, user=user)
+                started = time.perf_counter()
+                response = view(request, job_id=job.id)
+                # list.append is atomic under the GIL
+                results.append((response.status_code, (time.perf_counter() - started) * 1000))
+        finally:
+            # Each worker thread opened its own connection
+            connections.close_all()
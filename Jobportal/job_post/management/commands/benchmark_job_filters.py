@@ -0,0 +1,111 @@
+import random
+import statistics
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test import RequestFactory
+from rest_framework.request import Request
+
+from accounts.models import User
+from job_post.models import JobPost
+from job_post.views import JobListCreateView
+
+TITLES = ['Python Developer', 'Backend Engineer', 'Frontend Engineer', 'Data Analyst',
+          'DevOps Engineer', 'Product Designer', 'QA Engineer', 'Mobile Developer']
+COMPANIES = ['Acme Corp', 'Globex', 'Initech', 'Umbrella', 'Hooli', 'Stark Industries',
+             'Wayne Enterprises', 'Vandelay Industries']
+CITIES = ['Kochi', 'Bangalore', 'Chennai', 'Hyderabad', 'Mumbai', 'Pune', 'Delhi', 'Trivandrum']
+
+# (query params, description) pairs run against JobListCreateView's filter path
+CASES = [
+    ({'title': 'engineer'}, 'title substring'),
+    ({'company': 'industries'}, 'company substring'),
+    ({'location': 'bangal'}, 'location substring'),
+    ({'title': 'developer', 'location': 'kochi'}, 'title + location'),
+]
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = ('Seed JobPost rows inside a transaction and check that filtered job '
+            'search stays within a latency budget. Data is rolled back afterwards.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=1_000_000)
+        parser.add_argument('--batch-size', type=int, default=10_000)
+        parser.add_argument('--repeat', type=int, default=20)
+        parser.add_argument('--budget-ms', type=float, default=50.0,
+                            help='Maximum allowed p95 latency per filtered page query')
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'postgresql':
+            raise CommandError('This benchmark requires PostgreSQL (pg_trgm indexes).')
+
+        failures = []
+        try:
+            with transaction.atomic():
+                self._seed(options['rows'], options['batch_size'])
+                for params, label in CASES:
+                    p95 = self._measure(params, label, options['repeat'])
+                    if p95 > options['budget_ms']:
+                        failures.append(f'{label}: p95 {p95:.1f} ms')
+                raise _Rollback
+        except _Rollback:
+            pass
+
+        if failures:
+            raise CommandError(f"Latency budget of {options['budget_ms']} ms exceeded: " + '; '.join(failures))
+        self.stdout.write(self.style.SUCCESS('All filtered searches within budget'))
+
+    def _seed(self, rows, batch_size):
+        publisher = User.objects.create_user(
+            email='benchmark-publisher@example.com',
+            first_name='Benchmark',
+            job_role='Company'
+        )
+        rng = random.Random(42)
+        started = time.perf_counter()
+        for offset in range(0, rows, batch_size):
+            JobPost.objects.bulk_create([
+                JobPost(
+                    title=f'{rng.choice(TITLES)} {i}',
+                    description='Benchmark posting',
+                    company_name=rng.choice(COMPANIES),
+                    location=rng.choice(CITIES),
+                    publisher=publisher,
+                    publisher_role='Company',
+                )
+                for i in range(offset, min(offset + batch_size, rows))
+            ])
+        with connection.cursor() as cursor:
+            cursor.execute(f'ANALYZE {connection.ops.quote_name(JobPost._meta.db_table)}')
+        self.stdout.write(f'Seeded {rows} jobs in {time.perf_counter() - started:.1f}s')
+
+    def _queryset(self, params):
+        view = JobListCreateView()
+        view.request = Request(RequestFactory().get('/api/jobs/', params))
+        view.format_kwarg = None
+        return view.get_queryset()[:20]
+
+    def _measure(self, params, label, repeat):
+        queryset = self._queryset(params)
+        plan = queryset.explain()
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            list(self._queryset(params))
+            timings.append((time.perf_counter() - started) * 1000)
+
+        timings.sort()
+        p50 = statistics.median(timings)
+        p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+        uses_trigram = '_trgm' in plan
+        self.stdout.write(
+            f'{label:<20} p50={p50:7.2f} ms  p95={p95:7.2f} ms  '
+            f'trigram index={"yes" if uses_trigram else "no"}'
+        )
+        return p95
@@ -0,0 +1,51 @@
+import random
+import statistics
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from job_post.recommendations import SkillIndex
+
+
+class Command(BaseCommand):
+    help = ('Build an in-memory recommendation index of synthetic jobs and check '
+            'that top-k queries stay within a latency budget. No data is written.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--jobs', type=int, default=100_000)
+        parser.add_argument('--skills', type=int, default=2_000, help='Vocabulary size')
+        parser.add_argument('--repeat', type=int, default=200)
+        parser.add_argument('--k', type=int, default=20)
+        parser.add_argument('--budget-ms', type=float, default=50.0,
+                            help='Maximum allowed p95 latency per query')
+
+    def handle(self, *args, **options):
+        rng = random.Random(42)
+        vocabulary = [f'skill-{i}' for i in range(options['skills'])]
+        # A few skills are very common, most are rare
+        weights = [1 / (rank + 1) for rank in range(len(vocabulary))]
+
+        jobs = [
+            (job_id, rng.choices(vocabulary, weights, k=rng.randint(3, 10)))
+            for job_id in range(1, options['jobs'] + 1)
+        ]
+        index = SkillIndex()
+        started = time.perf_counter()
+        for job_id, skills in jobs:
+            index.add(job_id, skills)
+        self.stdout.write(f"Indexed {index.active_jobs} jobs in {time.perf_counter() - started:.1f}s")
+
+        timings = []
+        for _ in range(options['repeat']):
+            skills = rng.choices(vocabulary, weights, k=rng.randint(5, 15))
+            started = time.perf_counter()
+            index.query(skills, k=options['k'])
+            timings.append((time.perf_counter() - started) * 1000)
+
+        timings.sort()
+        p50 = statistics.median(timings)
+        p95 = timings[int(len(timings) * 0.95) - 1]
+        self.stdout.write(f'top-{options["k"]} query: p50 {p50:.2f} ms, p95 {p95:.2f} ms')
+        if p95 > options['budget_ms']:
+            raise CommandError(f"Latency budget of {options['budget_ms']} ms exceeded: p95 {p95:.1f} ms")
+        self.stdout.write(self.style.SUCCESS('Recommendations within budget'))
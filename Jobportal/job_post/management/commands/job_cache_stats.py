@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from job_post import list_cache
+
+
+class Command(BaseCommand):
+    help = 'Report hit/miss counts and hit ratio of the shared job list cache.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--reset', action='store_true', help='Clear the counters after reporting')
+
+    def handle(self, *args, **options):
+        stats = list_cache.stats()
+        ratio = 'n/a' if stats['hit_ratio'] is None else f"{stats['hit_ratio']:.1%}"
+        self.stdout.write(
+            f"hits={stats['hits']} misses={stats['misses']} hit_ratio={ratio} generation={stats['generation']}"
+        )
+        if options['reset']:
+            list_cache.reset_stats()
+            self.stdout.write('Counters reset')
@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from job_post.alerts import match_new_jobs
+from job_post.models import JobPost
+
+
+class Command(BaseCommand):
+    help = ('Match newly created jobs against saved searches in batches and queue '
+            'JobAlert digest entries.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500)
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        processed = matched = 0
+        while True:
+            with transaction.atomic():
+                # skip_locked lets several workers split the pending jobs
+                batch = list(
+                    JobPost.objects.filter(alerts_pending=True)
+                    .order_by('id')
+                    .select_for_update(skip_locked=True)[:batch_size]
+                )
+                if not batch:
+                    break
+                matched += match_new_jobs(batch)
+                JobPost.objects.filter(id__in=[job.id for job in batch]).update(alerts_pending=False)
+            processed += len(batch)
+
+        self.stdout.write(self.style.SUCCESS(f'Matched {processed} new jobs: {matched} alerts queued'))
@@ -0,0 +1,38 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from job_post.counters import COUNTERS, DEFAULT_CHUNK_SIZE, counter_label, reconcile_counter
+
+
+class Command(BaseCommand):
+    help = ('Recompute denormalized counters (application, like and comment counts) '
+            'in chunks with grouped COUNTs, report drift and fix drifted rows.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE)
+        parser.add_argument('--dry-run', action='store_true', help='Report drift without fixing it')
+        parser.add_argument('--counter', action='append', dest='counters',
+                            help='Only this counter, e.g. posts.Post.likes_count (repeatable)')
+
+    def handle(self, *args, **options):
+        counters = COUNTERS
+        if options['counters']:
+            counters = [counter for counter in COUNTERS if counter_label(counter) in options['counters']]
+            unknown = set(options['counters']) - {counter_label(counter) for counter in counters}
+            if unknown:
+                raise CommandError(f"Unknown counters: {', '.join(sorted(unknown))}")
+
+        total_drifted = 0
+        for counter in counters:
+            report = reconcile_counter(counter, options['chunk_size'], fix=not options['dry_run'])
+            total_drifted += report['drifted']
+            self.stdout.write(
+                f"{counter_label(counter)}: checked={report['checked']} drifted={report['drifted']} "
+                f"drift={report['drift']} fixed={report['fixed']}"
+            )
+            for pk, stored, actual in report['samples']:
+                self.stdout.write(f'  pk={pk} stored={stored} actual={actual}')
+
+        if options['dry_run']:
+            self.stdout.write(f'Dry run: {total_drifted} drifted rows left unchanged')
+        else:
+            self.stdout.write(self.style.SUCCESS(f'Reconciled counters: {total_drifted} drifted rows fixed'))
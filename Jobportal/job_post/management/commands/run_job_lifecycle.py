@@ -0,0 +1,38 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from job_post.lifecycle import DEFAULT_BATCH_SIZE, lifecycle_backlog, run_lifecycle
+
+
+class Command(BaseCommand):
+    help = ('Publish jobs whose publish_at has passed and expire jobs past their '
+            'expires_at, in batches. Safe to re-run and to run on several workers.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE)
+        parser.add_argument('--loop', action='store_true', help='Keep running every --interval seconds')
+        parser.add_argument('--interval', type=float, default=60.0)
+        parser.add_argument('--backlog', action='store_true', help='Only report the backlog of due jobs')
+
+    def handle(self, *args, **options):
+        if options['backlog']:
+            self._report_backlog(lifecycle_backlog())
+            return
+
+        while True:
+            published, expired, backlog = run_lifecycle(batch_size=options['batch_size'])
+            self.stdout.write(self.style.SUCCESS(f'Published {published} jobs, expired {expired} jobs'))
+            self._report_backlog(backlog)
+            if not options['loop']:
+                return
+            try:
+                time.sleep(options['interval'])
+            except KeyboardInterrupt:
+                return
+
+    def _report_backlog(self, backlog):
+        self.stdout.write(
+            f"backlog publish_due={backlog['publish_due']} expire_due={backlog['expire_due']} "
+            f"max_lag_seconds={backlog['max_lag_seconds']:.0f}"
+        )
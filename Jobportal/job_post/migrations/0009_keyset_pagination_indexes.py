@@ -0,0 +1,31 @@
+# Generated by Django 5.2.8 on 2026-10-18 04:10
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('job_post', '0008_add_soft_delete_and_counters'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='jobapplication',
+            index=models.Index(fields=['job', '-applied_at', '-id'], name='jobapp_job_applied_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='jobapplication',
+            index=models.Index(fields=['applicant', '-applied_at', '-id'], name='jobapp_user_applied_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='jobpost',
+            index=models.Index(fields=['-created_at', '-id'], name='jobpost_created_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='jobpost',
+            index=models.Index(fields=['publisher', '-created_at', '-id'], name='jobpost_pub_created_id_idx'),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.8 on 2026-10-18 04:12
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.conf import settings
+from django.db import migrations
+
+
+def populate_search_vector(apps, schema_editor):
+    from job_post.search import job_search_vector
+    JobPost = apps.get_model('job_post', 'JobPost')
+    JobPost.objects.update(search_vector=job_search_vector())
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('job_post', '0009_keyset_pagination_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='jobpost',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='jobpost',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='jobpost_search_vector_gin'),
+        ),
+        migrations.RunPython(populate_search_vector, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 5.2.8 on 2026-10-18 04:20
+
+import django.contrib.postgres.indexes
+from django.conf import settings
+from django.db import migrations, models
+
+
+def populate_skills(apps, schema_editor):
+    from job_post.skills import canonical_skills
+    JobPost = apps.get_model('job_post', 'JobPost')
+    batch = []
+    for job in JobPost.objects.only('id', 'requirements').iterator(chunk_size=2000):
+        job.skills = canonical_skills(job.requirements)
+        batch.append(job)
+        if len(batch) >= 2000:
+            JobPost.objects.bulk_update(batch, ['skills'])
+            batch = []
+    if batch:
+        JobPost.objects.bulk_update(batch, ['skills'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('job_post', '0011_jobpost_trigram_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='jobpost',
+            name='skills',
+            field=models.JSONField(blank=True, default=list),
+        ),
+        migrations.AddIndex(
+            model_name='jobpost',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['skills'], name='jobpost_skills_gin'),
+        ),
+        migrations.RunPython(populate_skills, migrations.RunPython.noop),
+    ]
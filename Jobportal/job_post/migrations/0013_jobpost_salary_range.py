@@ -0,0 +1,60 @@
+# Generated by Django 5.2.8 on 2026-10-18 04:22
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+def populate_salary_range(apps, schema_editor):
+    from job_post.salary import parse_salary
+    JobPost = apps.get_model('job_post', 'JobPost')
+    fields = ['salary_min', 'salary_max', 'salary_currency', 'salary_period']
+    batch = []
+    jobs = JobPost.objects.exclude(salary__isnull=True).exclude(salary='').only('id', 'salary')
+    for job in jobs.iterator(chunk_size=2000):
+        job.salary_min, job.salary_max, job.salary_currency, job.salary_period = parse_salary(job.salary)
+        batch.append(job)
+        if len(batch) >= 2000:
+            JobPost.objects.bulk_update(batch, fields)
+            batch = []
+    if batch:
+        JobPost.objects.bulk_update(batch, fields)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('job_post', '0012_jobpost_skills'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='jobpost',
+            name='salary_currency',
+            field=models.CharField(blank=True, editable=False, max_length=3, null=True),
+        ),
+        migrations.AddField(
+            model_name='jobpost',
+            name='salary_max',
+            field=models.PositiveBigIntegerField(blank=True, db_index=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='jobpost',
+            name='salary_min',
+            field=models.PositiveBigIntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='jobpost',
+            name='salary_period',
+            field=models.CharField(blank=True, choices=[('hour', 'Hourly'), ('day', 'Daily'), ('week', 'Weekly'), ('month', 'Monthly'), ('year', 'Yearly')], editable=False, max_length=10, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='jobpost',
+            index=models.Index(fields=['salary_min', 'id'], name='jobpost_salary_min_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='jobpost',
+            index=models.Index(models.OrderBy(models.F('salary_min'), descending=True, nulls_last=True), models.OrderBy(models.F('id'), descending=True), name='jobpost_salary_min_desc_idx'),
+        ),
+        migrations.RunPython(populate_salary_range, migrations.RunPython.noop),
+    ]
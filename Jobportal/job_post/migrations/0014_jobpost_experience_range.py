@@ -0,0 +1,29 @@
+# Generated by Django 5.2.8 on 2026-10-18 04:24
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('job_post', '0013_jobpost_salary_range'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='jobpost',
+            name='experience_max_years',
+            field=models.PositiveSmallIntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='jobpost',
+            name='experience_min_years',
+            field=models.PositiveSmallIntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='jobpost',
+            index=models.Index(fields=['experience_min_years', 'experience_max_years'], name='jobpost_experience_range_idx'),
+        ),
+    ]
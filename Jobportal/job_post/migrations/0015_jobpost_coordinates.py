@@ -0,0 +1,49 @@
+# Generated by Django 5.2.8 on 2026-10-18 04:26
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+def populate_coordinates(apps, schema_editor):
+    from authentication.geo import normalize_location
+    JobPost = apps.get_model('job_post', 'JobPost')
+    batch = []
+    rows = JobPost.objects.exclude(location__isnull=True).exclude(location='').only('id', 'location')
+    for row in rows.iterator(chunk_size=2000):
+        city = normalize_location(row.location)
+        if city is None:
+            continue
+        row.latitude, row.longitude = city.latitude, city.longitude
+        batch.append(row)
+        if len(batch) >= 2000:
+            JobPost.objects.bulk_update(batch, ['latitude', 'longitude'])
+            batch = []
+    if batch:
+        JobPost.objects.bulk_update(batch, ['latitude', 'longitude'])
+
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('job_post', '0014_jobpost_experience_range'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='jobpost',
+            name='latitude',
+            field=models.FloatField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='jobpost',
+            name='longitude',
+            field=models.FloatField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='jobpost',
+            index=models.Index(fields=['latitude', 'longitude'], name='jobpost_lat_lon_idx'),
+        ),
+        migrations.RunPython(populate_coordinates, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,60 @@
+# Generated by Django 5.2.8 on 2026-10-18 04:30
+
+from django.db import migrations, models
+
+
+def populate_publisher_display(apps, schema_editor):
+    JobPost = apps.get_model('job_post', 'JobPost')
+    User = apps.get_model('accounts', 'User')
+    UserProfile = apps.get_model('profiles', 'UserProfile')
+    CompanyProfile = apps.get_model('profiles', 'CompanyProfile')
+
+    publisher_ids = JobPost.objects.values_list('publisher_id', flat=True).distinct()
+    for user in User.objects.filter(id__in=publisher_ids).iterator(chunk_size=500):
+        name = f"{user.first_name or ''} {user.last_name or ''}".strip()
+        company_name = logo_url = None
+        if user.job_role == 'Company':
+            profile = CompanyProfile.objects.filter(user_id=user.id).first()
+            if profile:
+                company_name = profile.company_name or None
+                logo_url = profile.company_logo.url if profile.company_logo else None
+        else:
+            profile = UserProfile.objects.filter(user_id=user.id).first()
+            if profile:
+                if user.job_role == 'Employer':
+                    company_name = profile.company_name or None
+                logo_url = profile.profile_image.url if profile.profile_image else None
+        if company_name is None and user.job_role in ('Company', 'Employer'):
+            company_name = name or None
+        JobPost.objects.filter(publisher_id=user.id).update(
+            publisher_display_name=name,
+            publisher_company_name=company_name,
+            publisher_logo_url=logo_url,
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('job_post', '0015_jobpost_coordinates'),
+        ('profiles', '0010_userprofile_coordinates'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='jobpost',
+            name='publisher_company_name',
+            field=models.CharField(blank=True, editable=False, max_length=255, null=True),
+        ),
+        migrations.AddField(
+            model_name='jobpost',
+            name='publisher_display_name',
+            field=models.CharField(blank=True, default='', editable=False, max_length=255),
+        ),
+        migrations.AddField(
+            model_name='jobpost',
+            name='publisher_logo_url',
+            field=models.CharField(blank=True, editable=False, max_length=500, null=True),
+        ),
+        migrations.RunPython(populate_publisher_display, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,103 @@
+# Generated by Django 5.2.8 on 2026-10-18 04:34
+
+import django.contrib.postgres.indexes
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('job_post', '0016_jobpost_publisher_display'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='JobAlert',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('sent_at', models.DateTimeField(blank=True, null=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='SavedSearch',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(blank=True, max_length=255)),
+                ('params', models.JSONField(default=dict)),
+                ('is_active', models.BooleanField(default=True)),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('job_type', models.CharField(blank=True, editable=False, max_length=20, null=True)),
+                ('work_mode', models.CharField(blank=True, editable=False, max_length=20, null=True)),
+                ('skills', models.JSONField(blank=True, default=list, editable=False)),
+                ('location_token', models.CharField(blank=True, editable=False, max_length=32, null=True)),
+            ],
+        ),
+        # Existing jobs predate every saved search, so they start out matched
+        migrations.AddField(
+            model_name='jobpost',
+            name='alerts_pending',
+            field=models.BooleanField(default=False, editable=False),
+        ),
+        migrations.AlterField(
+            model_name='jobpost',
+            name='alerts_pending',
+            field=models.BooleanField(default=True, editable=False),
+        ),
+        migrations.AddIndex(
+            model_name='jobpost',
+            index=models.Index(condition=models.Q(('alerts_pending', True)), fields=['id'], name='jobpost_alerts_pending_idx'),
+        ),
+        migrations.AddField(
+            model_name='jobalert',
+            name='job',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='alerts', to='job_post.jobpost'),
+        ),
+        migrations.AddField(
+            model_name='jobalert',
+            name='user',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='job_alerts', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name='savedsearch',
+            name='user',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='saved_searches', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name='jobalert',
+            name='saved_search',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='alerts', to='job_post.savedsearch'),
+        ),
+        migrations.AddIndex(
+            model_name='savedsearch',
+            index=models.Index(fields=['user', '-created_at', '-id'], name='savedsearch_user_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='savedsearch',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['job_type', 'work_mode'], name='savedsearch_type_mode_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='savedsearch',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['skills'], name='savedsearch_skills_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='savedsearch',
+            index=models.Index(fields=['location_token'], name='savedsearch_location_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='jobalert',
+            index=models.Index(fields=['user', '-created_at', '-id'], name='jobalert_user_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='jobalert',
+            index=models.Index(condition=models.Q(('sent_at__isnull', True)), fields=['user', 'id'], name='jobalert_unsent_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='jobalert',
+            constraint=models.UniqueConstraint(fields=('saved_search', 'job'), name='jobalert_search_job_unique'),
+        ),
+    ]
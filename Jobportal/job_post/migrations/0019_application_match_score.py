@@ -0,0 +1,24 @@
+# Generated by Django 5.2.8 on 2026-10-18 04:39
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('job_post', '0018_jobpost_updated_at_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='jobapplication',
+            name='match_score',
+            field=models.FloatField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='jobapplication',
+            index=models.Index(models.F('job'), models.OrderBy(models.F('match_score'), descending=True, nulls_last=True), models.OrderBy(models.F('id'), descending=True), name='jobapp_job_match_idx'),
+        ),
+    ]
@@ -0,0 +1,50 @@
+# Generated by Django 5.2.8 on 2026-10-18 04:49
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count
+from django.db.models.functions import TruncDate
+
+
+def backfill_applications(apps, schema_editor):
+    # Only applications can be recovered; status changes and views start at zero
+    JobApplication = apps.get_model('job_post', 'JobApplication')
+    JobDailyStats = apps.get_model('job_post', 'JobDailyStats')
+    rows = (
+        JobApplication.objects.annotate(date=TruncDate('applied_at'))
+        .values('job_id', 'date')
+        .annotate(applications=Count('id'))
+        .order_by()
+    )
+    batch = []
+    for row in rows.iterator(chunk_size=2000):
+        batch.append(JobDailyStats(job_id=row['job_id'], date=row['date'], applications=row['applications']))
+        if len(batch) >= 2000:
+            JobDailyStats.objects.bulk_create(batch)
+            batch = []
+    JobDailyStats.objects.bulk_create(batch)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('job_post', '0020_job_lifecycle_schedule'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='JobDailyStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('applications', models.PositiveIntegerField(default=0)),
+                ('status_changes', models.PositiveIntegerField(default=0)),
+                ('views', models.PositiveIntegerField(default=0)),
+                ('job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_stats', to='job_post.jobpost')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('job', 'date'), name='jobdailystats_job_date_unique')],
+            },
+        ),
+        migrations.RunPython(backfill_applications, migrations.RunPython.noop),
+    ]
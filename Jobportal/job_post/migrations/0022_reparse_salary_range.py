@@ -0,0 +1,33 @@
+from django.db import migrations
+
+
+def reparse_salary_range(apps, schema_editor):
+    # Ranges stored before the parser handled "$25 / hr", "30000month" and
+    # experience figures in the salary text
+    from job_post.salary import parse_salary
+    JobPost = apps.get_model('job_post', 'JobPost')
+    fields = ['salary_min', 'salary_max', 'salary_currency', 'salary_period']
+    batch = []
+    jobs = JobPost.objects.exclude(salary__isnull=True).exclude(salary='').only('id', *fields, 'salary')
+    for job in jobs.iterator(chunk_size=2000):
+        parsed = parse_salary(job.salary)
+        if parsed == (job.salary_min, job.salary_max, job.salary_currency, job.salary_period):
+            continue
+        job.salary_min, job.salary_max, job.salary_currency, job.salary_period = parsed
+        batch.append(job)
+        if len(batch) >= 2000:
+            JobPost.objects.bulk_update(batch, fields)
+            batch = []
+    if batch:
+        JobPost.objects.bulk_update(batch, fields)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('job_post', '0021_job_daily_stats'),
+    ]
+
+    operations = [
+        migrations.RunPython(reparse_salary_range, migrations.RunPython.noop),
+    ]
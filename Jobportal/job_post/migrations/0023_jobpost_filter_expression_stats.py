@@ -0,0 +1,27 @@
+from django.db import migrations
+
+FILTER_COLUMNS = ('title', 'company_name', 'location')
+
+
+class Migration(migrations.Migration):
+    """
+    Statistics on the UPPER(col) expressions the icontains filters use. The
+    trigram GIN indexes collect none, so the planner estimated one row for
+    combined filters and chose a full scan and sort over walking created_at.
+    Expression statistics need PostgreSQL 14+.
+    """
+
+    dependencies = [
+        ('job_post', '0022_reparse_salary_range'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            [
+                f'CREATE STATISTICS IF NOT EXISTS jobpost_{column}_upper_stats '
+                f'ON (UPPER({column}::text)) FROM job_post_jobpost'
+                for column in FILTER_COLUMNS
+            ] + ['ANALYZE job_post_jobpost'],
+            [f'DROP STATISTICS IF EXISTS jobpost_{column}_upper_stats' for column in FILTER_COLUMNS],
+        ),
+    ]
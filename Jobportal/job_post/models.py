@@ -1,6 +1,15 @@
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
+from django.db.models.functions import Upper
 from django.utils import timezone
 from accounts.models import User
+from authentication.geo import normalize_location
+from .search import SEARCH_FIELDS, job_search_vector
+from .salary import PERIOD_CHOICES, parse_salary
+from .experience import parse_experience
+from .publisher import publisher_display_fields
+from .alerts import search_index_fields
 
 class JobPost(models.Model):
     JOB_TYPE_CHOICES = [
@@ -16,73 +25,187 @@ class JobPost(models.Model):
     title = models.CharField(max_length=255, db_index=True)
     description = models.TextField()
     requirements = models.JSONField(default=list, blank=True)
+    skills = models.JSONField(default=list, blank=True)  # canonical lowercase names
     location = models.CharField(max_length=255, blank=True, null=True, db_index=True)
+    # Resolved from `location` against the bundled gazetteer on save
+    latitude = models.FloatField(null=True, blank=True, editable=False)
+    longitude = models.FloatField(null=True, blank=True, editable=False)
     salary = models.CharField(max_length=100, blank=True, null=True)
+    # Parsed from `salary` on save; amounts are yearly in salary_currency
+    salary_min = models.PositiveBigIntegerField(null=True, blank=True, editable=False)
+    salary_max = models.PositiveBigIntegerField(null=True, blank=True, editable=False, db_index=True)
+    salary_currency = models.CharField(max_length=3, null=True, blank=True, editable=False)
+    salary_period = models.CharField(max_length=10, choices=PERIOD_CHOICES, null=True, blank=True, editable=False)
     experience = models.CharField(max_length=100, blank=True, null=True, db_index=True)
+    # Parsed from `experience` on save; max is None for open-ended ranges ("2+ years")
+    experience_min_years = models.PositiveSmallIntegerField(null=True, blank=True, editable=False)
+    experience_max_years = models.PositiveSmallIntegerField(null=True, blank=True, editable=False)
     job_type = models.CharField(max_length=20, choices=JOB_TYPE_CHOICES, default='fulltime', db_index=True)
     work_mode = models.CharField(max_length=20, choices=WORK_MODE_CHOICES, default='onsite', db_index=True)
     company_name = models.CharField(max_length=255, blank=True, null=True)
     
     publisher = models.ForeignKey(User, on_delete=models.CASCADE, related_name='jobs')
     publisher_role = models.CharField(max_length=20, blank=True, null=True)
+    # Resolved from the publisher and their profile; kept in sync by
+    # job_post.signals so the job list needs no profile lookups
+    publisher_display_name = models.CharField(max_length=255, blank=True, default='', editable=False)
+    publisher_company_name = models.CharField(max_length=255, blank=True, null=True, editable=False)
+    publisher_logo_url = models.CharField(max_length=500, blank=True, null=True, editable=False)
     
     created_at = models.DateTimeField(default=timezone.now, db_index=True)
     updated_at = models.DateTimeField(auto_now=True)
     is_active = models.BooleanField(default=True, db_index=True)
     deleted_at = models.DateTimeField(null=True, blank=True)
+    # Scheduled publishing and auto-expiry, applied by run_job_lifecycle.
+    # publish_at is cleared once the job has been published.
+    publish_at = models.DateTimeField(null=True, blank=True)
+    expires_at = models.DateTimeField(null=True, blank=True)
     application_count = models.PositiveIntegerField(default=0)
+    search_vector = SearchVectorField(null=True, editable=False)
+    # Cleared once match_job_alerts has checked the job against saved searches
+    alerts_pending = models.BooleanField(default=True, editable=False)
+    
+    class Meta:
+        indexes = [
+            # Keyset pagination keys: (created_at, id), optionally per publisher
+            models.Index(fields=['-created_at', '-id'], name='jobpost_created_id_idx'),
+            models.Index(fields=['publisher', '-created_at', '-id'], name='jobpost_pub_created_id_idx'),
+            GinIndex(fields=['search_vector'], name='jobpost_search_vector_gin'),
+            # Trigram indexes on UPPER(col) match the SQL Django emits for
+            # __icontains, so substring filters avoid a sequential scan
+            GinIndex(OpClass(Upper('title'), name='gin_trgm_ops'), name='jobpost_title_trgm'),
+            GinIndex(OpClass(Upper('company_name'), name='gin_trgm_ops'), name='jobpost_company_trgm'),
+            GinIndex(OpClass(Upper('location'), name='gin_trgm_ops'), name='jobpost_location_trgm'),
+            # Serves skills @> (all of) and ?| (any of) lookups
+            GinIndex(fields=['skills'], name='jobpost_skills_gin'),
+            # ?ordering=salary / -salary (NULLS LAST both ways) and salary range filters
+            models.Index(fields=['salary_min', 'id'], name='jobpost_salary_min_idx'),
+            models.Index(models.F('salary_min').desc(nulls_last=True), models.F('id').desc(), name='jobpost_salary_min_desc_idx'),
+            # ?experience_years= range overlap
+            models.Index(fields=['experience_min_years', 'experience_max_years'], name='jobpost_experience_range_idx'),
+            # Bounding-box prefilter for ?near= radius search
+            models.Index(fields=['latitude', 'longitude'], name='jobpost_lat_lon_idx'),
+            # Small, shrinking set scanned by match_job_alerts
+            models.Index(fields=['id'], condition=models.Q(alerts_pending=True), name='jobpost_alerts_pending_idx'),
+            # Incremental sync of the in-memory recommendation index
+            models.Index(fields=['updated_at'], name='jobpost_updated_at_idx'),
+            # Due-job scans of run_job_lifecycle; both sets stay small
+            models.Index(fields=['publish_at'], condition=models.Q(publish_at__isnull=False), name='jobpost_publish_at_idx'),
+            models.Index(fields=['expires_at'], condition=models.Q(is_active=True, expires_at__isnull=False), name='jobpost_expires_at_idx'),
+        ]
     
     def get_company_name(self):
-        # If company_name is stored in job, use it
-        if self.company_name:
-            return self.company_name
-        
-        # For Company users - use company profile name or user name
-        if self.publisher.job_role == 'Company':
-            try:
-                if hasattr(self.publisher, 'companyprofile'):
-                    return self.publisher.companyprofile.company_name
-            except:
-                pass
-            return f"{self.publisher.first_name} {self.publisher.last_name}".strip() or "Company Name"
-        
-        # For Employer users - try to get from user profile or use name
-        if self.publisher.job_role == 'Employer':
-            try:
-                if hasattr(self.publisher, 'userprofile') and self.publisher.userprofile.company_name:
-                    return self.publisher.userprofile.company_name
-            except:
-                pass
-            return f"{self.publisher.first_name} {self.publisher.last_name}".strip() or "Company Name"
-        
-        return "Company Name"
+        return self.company_name or self.publisher_company_name or "Company Name"
     
     def save(self, *args, **kwargs):
         if self.pk is None and self.is_active is None:
             self.is_active = True
+        
+        if self.pk is None:
+            self.apply_publisher_display()
+        
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None or 'publish_at' in update_fields:
+            self.apply_schedule()
+            if update_fields is not None:
+                kwargs['update_fields'] = set(update_fields) | {'is_active', 'publish_at', 'alerts_pending'}
+        
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None or 'salary' in update_fields:
+            self.apply_salary_range()
+            if update_fields is not None:
+                kwargs['update_fields'] = set(update_fields) | {'salary_min', 'salary_max', 'salary_currency', 'salary_period'}
+        
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None or 'experience' in update_fields:
+            self.apply_experience_range()
+            if update_fields is not None:
+                kwargs['update_fields'] = set(update_fields) | {'experience_min_years', 'experience_max_years'}
+        
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None or 'location' in update_fields:
+            self.apply_coordinates()
+            if update_fields is not None:
+                kwargs['update_fields'] = set(update_fields) | {'latitude', 'longitude'}
+        
         super().save(*args, **kwargs)
+        
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None or set(update_fields) & set(SEARCH_FIELDS):
+            self.refresh_search_vector()
+    
+    def apply_publisher_display(self):
+        """Copy the publisher's current display fields onto the job"""
+        for field, value in publisher_display_fields(self.publisher).items():
+            setattr(self, field, value)
+    
+    def apply_schedule(self):
+        """Hold the job back until a future publish_at; publish it once that time has passed"""
+        if self.publish_at is None:
+            return
+        now = timezone.now()
+        if self.publish_at > now:
+            self.is_active = False
+            return
+        # Same rule as publish_due_jobs: expired or deleted jobs only drop the schedule
+        lapsed = self.deleted_at is not None or (self.expires_at is not None and self.expires_at <= now)
+        if not self.is_active and not lapsed:
+            self.is_active = True
+            self.alerts_pending = True
+        self.publish_at = None
+    
+    def apply_salary_range(self):
+        """Fill the numeric salary columns from the free-text salary"""
+        self.salary_min, self.salary_max, self.salary_currency, self.salary_period = parse_salary(self.salary)
+    
+    def apply_experience_range(self):
+        """Fill the numeric experience columns from the free-text experience"""
+        self.experience_min_years, self.experience_max_years = parse_experience(self.experience)
+    
+    def apply_coordinates(self):
+        """Geocode the free-text location from the offline gazetteer"""
+        city = normalize_location(self.location)
+        self.latitude, self.longitude = (city.latitude, city.longitude) if city else (None, None)
+    
+    def refresh_search_vector(self):
+        """Recompute the full-text document in the database"""
+        JobPost.objects.filter(pk=self.pk).update(search_vector=job_search_vector())
     
     def soft_delete(self):
         """Soft delete job by setting deleted_at timestamp"""
         self.deleted_at = timezone.now()
         self.is_active = False
+        self.publish_at = None
         self.save()
     
     def activate(self):
-        """Activate job"""
+        """Activate job now, replacing any schedule and a lapsed expiry"""
+        if not self.is_active:
+            # Re-queue for saved-search alerts, which skipped it while inactive
+            self.alerts_pending = True
         self.is_active = True
         self.deleted_at = None
+        self.publish_at = None
+        if self.expires_at and self.expires_at <= timezone.now():
+            self.expires_at = None
         self.save()
     
     def deactivate(self):
-        """Deactivate job without deleting"""
+        """Deactivate job without deleting; cancels a pending publish"""
         self.is_active = False
+        self.publish_at = None
         self.save()
     
-    def increment_application_count(self):
-        """Increment application count"""
-        self.application_count += 1
-        self.save(update_fields=['application_count'])
+    def increment_application_count(self, refresh=True):
+        """Atomically increment application count; safe under concurrent applies"""
+        JobPost.objects.filter(pk=self.pk).update(
+            application_count=models.F('application_count') + 1,
+            updated_at=timezone.now()
+        )
+        if refresh:
+            self.refresh_from_db(fields=['application_count', 'updated_at'])
+        # No bump_generation(): cached job list pages read application_count
+        # live (see get_job_counters), so applies keep the shared cache warm
     
     def __str__(self):
         return f"{self.title} by {self.company_name}"
@@ -113,11 +236,89 @@ class JobApplication(models.Model):
     # Status tracking
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='submitted')
     
+    # Cached applicant/job fit for ?ordering=match; NULL until (re)scored
+    match_score = models.FloatField(null=True, blank=True, editable=False)
+    
     applied_at = models.DateTimeField(default=timezone.now)
     updated_at = models.DateTimeField(auto_now=True)
     
     class Meta:
         unique_together = ('job', 'applicant')  # Prevent duplicate applications
+        indexes = [
+            # Keyset pagination keys: (applied_at, id) per job and per applicant
+            models.Index(fields=['job', '-applied_at', '-id'], name='jobapp_job_applied_id_idx'),
+            models.Index(fields=['applicant', '-applied_at', '-id'], name='jobapp_user_applied_id_idx'),
+            # ?ordering=match per job
+            models.Index(models.F('job'), models.F('match_score').desc(nulls_last=True), models.F('id').desc(), name='jobapp_job_match_idx'),
+        ]
+    
+    def __str__(self):
+        return f"{self.applicant_name} applied for {self.job.title}"
+
+class SavedSearch(models.Model):
+    """A user's saved job list query, alerted on when new jobs match"""
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='saved_searches')
+    name = models.CharField(max_length=255, blank=True)
+    params = models.JSONField(default=dict)  # normalized /api/jobs/ filter params
+    is_active = models.BooleanField(default=True)
+    created_at = models.DateTimeField(default=timezone.now)
+    
+    # Derived from params on save to find candidate searches for new jobs
+    job_type = models.CharField(max_length=20, null=True, blank=True, editable=False)
+    work_mode = models.CharField(max_length=20, null=True, blank=True, editable=False)
+    skills = models.JSONField(default=list, blank=True, editable=False)
+    location_token = models.CharField(max_length=32, null=True, blank=True, editable=False)
+    
+    class Meta:
+        indexes = [
+            models.Index(fields=['user', '-created_at', '-id'], name='savedsearch_user_created_idx'),
+            models.Index(fields=['job_type', 'work_mode'], condition=models.Q(is_active=True), name='savedsearch_type_mode_idx'),
+            GinIndex(fields=['skills'], name='savedsearch_skills_gin'),
+            models.Index(fields=['location_token'], name='savedsearch_location_idx'),
+        ]
+    
+    def save(self, *args, **kwargs):
+        for field, value in search_index_fields(self.params).items():
+            setattr(self, field, value)
+        super().save(*args, **kwargs)
+    
+    def __str__(self):
+        return self.name or f"Saved search {self.pk} for {self.user}"
+
+class JobAlert(models.Model):
+    """A queued digest entry: `job` matched `saved_search`"""
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='job_alerts')
+    saved_search = models.ForeignKey(SavedSearch, on_delete=models.CASCADE, related_name='alerts')
+    job = models.ForeignKey(JobPost, on_delete=models.CASCADE, related_name='alerts')
+    created_at = models.DateTimeField(default=timezone.now)
+    sent_at = models.DateTimeField(null=True, blank=True)
+    
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['saved_search', 'job'], name='jobalert_search_job_unique'),
+        ]
+        indexes = [
+            models.Index(fields=['user', '-created_at', '-id'], name='jobalert_user_created_idx'),
+            # Unsent digest entries per user
+            models.Index(fields=['user', 'id'], condition=models.Q(sent_at__isnull=True), name='jobalert_unsent_idx'),
+        ]
+    
+    def __str__(self):
+        return f"{self.job} for {self.user}"
+
+class JobDailyStats(models.Model):
+    """Per-job activity for one day, incremented as it happens (see job_post.stats)"""
+    job = models.ForeignKey(JobPost, on_delete=models.CASCADE, related_name='daily_stats')
+    date = models.DateField()
+    applications = models.PositiveIntegerField(default=0)
+    status_changes = models.PositiveIntegerField(default=0)
+    views = models.PositiveIntegerField(default=0)
+    
+    class Meta:
+        constraints = [
+            # Also serves per-job date range reads
+            models.UniqueConstraint(fields=['job', 'date'], name='jobdailystats_job_date_unique'),
+        ]
     
     def __str__(self):
-        return f"{self.applicant_name} applied for {self.job.title}"
\ No newline at end of file
+        return f"{self.job_id} on {self.date}"
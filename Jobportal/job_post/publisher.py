@@ -0,0 +1,56 @@
+"""
+Publisher display fields denormalized onto JobPost
+"""
+DISPLAY_FIELDS = ('publisher_display_name', 'publisher_company_name', 'publisher_logo_url')
+
+
+def publisher_display_fields(user):
+    """
+    Resolve the publisher name, company name and logo/profile image URL the
+    job list shows for `user`
+    """
+    from profiles.models import CompanyProfile, UserProfile
+
+    name = f"{user.first_name or ''} {user.last_name or ''}".strip()
+    company_name = None
+    logo_url = None
+
+    if user.job_role == 'Company':
+        profile = CompanyProfile.objects.filter(user_id=user.pk).first()
+        if profile:
+            company_name = profile.company_name or None
+            logo_url = profile.company_logo.url if profile.company_logo else None
+    else:
+        profile = UserProfile.objects.filter(user_id=user.pk).first()
+        if profile:
+            if user.job_role == 'Employer':
+                company_name = profile.company_name or None
+            logo_url = profile.profile_image.url if profile.profile_image else None
+
+    if company_name is None and user.job_role in ('Company', 'Employer'):
+        company_name = name or None
+
+    return {
+        'publisher_display_name': name,
+        'publisher_company_name': company_name,
+        'publisher_logo_url': logo_url,
+    }
+
+
+def refresh_publisher_jobs(user):
+    """
+    Rewrite the display fields on all of `user`'s jobs in one UPDATE. Also
+    moves updated_at, which the job ETags are derived from.
+    """
+    from django.utils import timezone
+    from .list_cache import bump_generation
+    from .models import JobPost
+
+    updated = JobPost.objects.filter(publisher_id=user.pk).update(
+        updated_at=timezone.now(),
+        **publisher_display_fields(user)
+    )
+    if updated:
+        # A queryset update sends no post_save, so invalidate here
+        bump_generation()
+    return updated
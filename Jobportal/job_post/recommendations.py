@@ -0,0 +1,189 @@
+"""
+Skill-based job recommendations.
+
+Each active job is a precomputed sparse vector over canonical skills: binary
+term frequencies scaled by 1/sqrt(number of skills). A user's skills are
+weighted by inverse document frequency, so the score of every job is one
+vectorized sparse dot product (a scatter-add per user skill over the jobs
+posting that skill) followed by a top-k partition.
+
+The index lives in process memory. It is loaded once, then kept current
+incrementally: saves in this process apply directly, and every query first
+applies rows whose updated_at moved since the last sync.
+"""
+import math
+import threading
+from datetime import timedelta
+
+import numpy as np
+
+from .skills import canonical_skills
+
+# Re-read rows updated this long before the last sync, so transactions
+# that committed late are still picked up
+SYNC_OVERLAP = timedelta(seconds=60)
+# Rebuild instead of syncing when this many rows changed at once
+MAX_SYNC_ROWS = 50_000
+
+
+class SkillIndex:
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.reset()
+
+    def reset(self):
+        self.vocabulary = {}      # skill -> column
+        self.document_frequency = []
+        self.postings = []        # column -> rows posting the skill
+        self._posting_arrays = {}
+        self.rows = {}            # job id -> live row
+        self.row_columns = []     # row -> columns, None once replaced
+        self.job_ids = np.zeros(1024, dtype=np.int64)
+        self.weights = np.zeros(1024, dtype=np.float32)
+        self.size = 0
+        self.watermark = None
+        self.loaded = False
+
+    @property
+    def active_jobs(self):
+        return len(self.rows)
+
+    def _column(self, skill):
+        column = self.vocabulary.get(skill)
+        if column is None:
+            column = self.vocabulary[skill] = len(self.postings)
+            self.postings.append([])
+            self.document_frequency.append(0)
+        return column
+
+    def remove(self, job_id):
+        with self.lock:
+            row = self.rows.pop(job_id, None)
+            if row is None:
+                return
+            # Posting lists keep the dead row; a zero weight drops its score
+            self.weights[row] = 0
+            for column in self.row_columns[row]:
+                self.document_frequency[column] -= 1
+            self.row_columns[row] = None
+
+    def add(self, job_id, skills):
+        """Insert or replace the vector for `job_id`"""
+        with self.lock:
+            columns = sorted({self._column(skill) for skill in skills})
+            row = self.rows.get(job_id)
+            if row is not None and self.row_columns[row] == columns:
+                return
+            self.remove(job_id)
+            if not columns:
+                return
+            if self.size == len(self.job_ids):
+                self.job_ids = np.resize(self.job_ids, self.size * 2)
+                self.weights = np.resize(self.weights, self.size * 2)
+            row = self.size
+            self.size += 1
+            self.job_ids[row] = job_id
+            self.weights[row] = 1 / math.sqrt(len(columns))
+            self.row_columns.append(columns)
+            self.rows[job_id] = row
+            for column in columns:
+                self.postings[column].append(row)
+                self.document_frequency[column] += 1
+                self._posting_arrays.pop(column, None)
+
+    def apply(self, job_id, skills, is_active):
+        if is_active:
+            self.add(job_id, skills)
+        else:
+            self.remove(job_id)
+
+    def _posting_array(self, column):
+        array = self._posting_arrays.get(column)
+        if array is None:
+            array = self._posting_arrays[column] = np.array(self.postings[column], dtype=np.int64)
+        return array
+
+    def query(self, skills, k=20, exclude=()):
+        """
+        Top-k (job_id, score) pairs for a user with `skills`, best first.
+        Scores are cosine-style and fall in (0, 1].
+        """
+        with self.lock:
+            columns = [self.vocabulary[skill] for skill in set(skills) if skill in self.vocabulary]
+            if not columns or not self.rows:
+                return []
+
+            total = len(self.rows)
+            idf = {
+                column: math.log((1 + total) / (1 + self.document_frequency[column])) + 1
+                for column in columns
+            }
+            user_norm = math.sqrt(sum(weight * weight for weight in idf.values()))
+
+            scores = np.zeros(self.size, dtype=np.float32)
+            for column, weight in idf.items():
+                scores[self._posting_array(column)] += weight / user_norm
+            scores *= self.weights[:self.size]
+
+            if exclude:
+                excluded = [self.rows[job_id] for job_id in exclude if job_id in self.rows]
+                scores[excluded] = 0
+
+            candidates = np.flatnonzero(scores)
+            if len(candidates) > k:
+                candidates = candidates[np.argpartition(scores[candidates], -k)[-k:]]
+            candidates = candidates[np.argsort(-scores[candidates], kind='stable')]
+            return [(int(self.job_ids[row]), float(scores[row])) for row in candidates]
+
+    def needs_compaction(self):
+        return self.size > 1024 and len(self.rows) < self.size // 2
+
+    def sync(self):
+        """Load on first use, then apply jobs updated since the last sync"""
+        from django.utils import timezone
+        from .models import JobPost
+
+        with self.lock:
+            if self.loaded and self.needs_compaction():
+                self.reset()
+
+            now = timezone.now()
+            fields = ('id', 'skills', 'is_active', 'deleted_at')
+            if self.loaded:
+                rows = list(
+                    JobPost.objects.filter(updated_at__gte=self.watermark - SYNC_OVERLAP)
+                    .order_by().values_list(*fields)[:MAX_SYNC_ROWS + 1]
+                )
+                if len(rows) > MAX_SYNC_ROWS:
+                    self.reset()
+                    return self.sync()
+            else:
+                rows = (
+                    JobPost.objects.filter(is_active=True, deleted_at__isnull=True)
+                    .order_by().values_list(*fields).iterator(chunk_size=5000)
+                )
+
+            for job_id, skills, is_active, deleted_at in rows:
+                self.apply(job_id, skills or [], is_active and deleted_at is None)
+            self.watermark = now
+            self.loaded = True
+
+
+skill_index = SkillIndex()
+
+
+def index_job(job):
+    """Apply a saved job to the loaded index; unloaded indexes load it later"""
+    if skill_index.loaded:
+        skill_index.apply(job.id, job.skills or [], job.is_active and job.deleted_at is None)
+
+
+def unindex_job(job_id):
+    if skill_index.loaded:
+        skill_index.remove(job_id)
+
+
+def recommend_job_ids(skills, k=20, exclude=()):
+    """Top-k (job_id, score) for the given skill names against active jobs"""
+    skill_index.sync()
+    return skill_index.query(canonical_skills(skills), k=k, exclude=exclude)
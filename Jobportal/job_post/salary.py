@@ -0,0 +1,101 @@
+"""
+Parse free-text JobPost.salary values into numeric yearly ranges
+"""
+import re
+from collections import namedtuple
+
+SalaryRange = namedtuple('SalaryRange', ['min', 'max', 'currency', 'period'])
+
+EMPTY_RANGE = SalaryRange(None, None, None, None)
+
+PERIOD_CHOICES = [
+    ('hour', 'Hourly'),
+    ('day', 'Daily'),
+    ('week', 'Weekly'),
+    ('month', 'Monthly'),
+    ('year', 'Yearly'),
+]
+
+# Multipliers that turn an amount for the period into a yearly amount
+PERIODS_PER_YEAR = {'hour': 2080, 'day': 260, 'week': 52, 'month': 12, 'year': 1}
+
+# (?<![a-z]) / (?![a-z]) instead of \b, which never matches before a spaced
+# "/" ("$25 / hr") and does not separate "30000month"
+_PERIOD_PATTERNS = [
+    ('hour', r'(?<![a-z])(per\s*(hour|hr)|hourly|p\.?h)(?![a-z])|/\s*(hours?|hrs?|h)(?![a-z])'),
+    ('day', r'(?<![a-z])(per\s*day|daily)(?![a-z])|/\s*days?(?![a-z])'),
+    ('week', r'(?<![a-z])(per\s*week|weekly)(?![a-z])|/\s*(weeks?|wk)(?![a-z])'),
+    ('month', r'(?<![a-z])(per\s*month|monthly|p\.?m)(?![a-z])|/\s*(months?|mo)(?![a-z])|(?<=\d)\s*month(?![a-z])'),
+    ('year', r'(?<![a-z])(per\s*(year|annum)|yearly|annual(ly)?|p\.?a|lpa|ctc)(?![a-z])|/\s*(years?|yr)(?![a-z])'),
+]
+
+_CURRENCY_PATTERNS = [
+    ('INR', r'₹|(?<![a-z])(inr|rs\.?|lpa|lakhs?|lacs?|cr|crores?)(?![a-z])|(?<=\d)\s*l(?![a-z])'),
+    ('USD', r'(\$|\busd\b)'),
+    ('EUR', r'(€|\beur\b)'),
+    ('GBP', r'(£|\bgbp\b)'),
+]
+
+_UNITS = {
+    'k': 1_000,
+    'l': 100_000, 'lpa': 100_000, 'lakh': 100_000, 'lakhs': 100_000, 'lac': 100_000, 'lacs': 100_000,
+    'cr': 10_000_000, 'crore': 10_000_000, 'crores': 10_000_000,
+    'm': 1_000_000, 'mn': 1_000_000, 'million': 1_000_000,
+}
+
+_UNIT = r'(k|lpa|lakhs?|lacs?|l|crores?|cr|million|mn|m)(?![a-z])'
+
+# A whole number (never the tail of a longer digit run) with an optional
+# unit that must end at a word boundary, so "30000month" is not 3000 million.
+# Experience ("2 years", "3-5 yrs") and durations ("for 6 months") are not
+# amounts.
+_AMOUNT_RE = re.compile(
+    r'(?<![\d.])(\d+(?:\.\d+)?)(?!\d)'
+    r'(?!(?:\s*(?:-|to)\s*\d+(?:\.\d+)?)?\s*\+?\s*(?:years?|yrs?|months|weeks|days)(?![a-z]))'
+    rf'(?:\s*{_UNIT})?'
+)
+# "45.000" / "1.200.000": a dot before exactly three digits and no unit
+_THOUSANDS_DOT_RE = re.compile(rf'(?<=\d)\.(?=\d{{3}}(?!\d)(?!\s*{_UNIT}))')
+_UP_TO_RE = re.compile(r'\b(up\s*to|upto|max(imum)?|below|under|<)\s*[^\d]*$')
+_FROM_RE = re.compile(r'(\+|\b(from|min(imum)?|above|over|starting|at\s*least)\b)')
+
+
+def parse_salary(text):
+    """
+    Parse '5-8 LPA', '₹30,000/month', '$50k - $70k', 'Up to 10 lakhs' or
+    '$25/hr' into a SalaryRange with yearly amounts. Unparseable text
+    (e.g. 'Negotiable') yields EMPTY_RANGE.
+    """
+    if not text:
+        return EMPTY_RANGE
+
+    value = str(text).lower()
+    # Thousands separators ("5,00,000" / "50,000") would split numbers
+    value = re.sub(r'(?<=\d),(?=\d)', '', value)
+    value = _THOUSANDS_DOT_RE.sub('', value)
+
+    matches = list(_AMOUNT_RE.finditer(value))[:2]
+    if not matches:
+        return EMPTY_RANGE
+
+    period = next((name for name, pattern in _PERIOD_PATTERNS if re.search(pattern, value)), 'year')
+    currency = next((code for code, pattern in _CURRENCY_PATTERNS if re.search(pattern, value)), None)
+
+    # A unit written once applies to the whole range: "5-8 LPA"
+    units = [match.group(2) for match in matches]
+    shared_unit = next((unit for unit in reversed(units) if unit), None)
+    amounts = []
+    for match, unit in zip(matches, units):
+        multiplier = _UNITS.get(unit or shared_unit, 1)
+        amounts.append(int(round(float(match.group(1)) * multiplier * PERIODS_PER_YEAR[period])))
+
+    if len(amounts) == 2:
+        low, high = sorted(amounts)
+    elif _UP_TO_RE.search(value[:matches[0].start()]):
+        low, high = None, amounts[0]
+    elif _FROM_RE.search(value):
+        low, high = amounts[0], None
+    else:
+        low = high = amounts[0]
+
+    return SalaryRange(low, high, currency, period)
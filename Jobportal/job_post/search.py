@@ -0,0 +1,30 @@
+"""
+PostgreSQL full-text search for job postings
+"""
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+from django.db.models import F, FloatField, TextField
+from django.db.models.functions import Cast
+
+SEARCH_CONFIG = 'english'
+
+# Fields that feed JobPost.search_vector; saving any of them refreshes it
+SEARCH_FIELDS = ('title', 'requirements', 'description')
+
+
+def job_search_vector():
+    """Weighted document: title (A) > requirements (B) > description (C)"""
+    return (
+        SearchVector('title', weight='A', config=SEARCH_CONFIG)
+        + SearchVector(Cast('requirements', TextField()), weight='B', config=SEARCH_CONFIG)
+        + SearchVector('description', weight='C', config=SEARCH_CONFIG)
+    )
+
+
+def search_jobs(queryset, terms):
+    """Filter jobs matching `terms` through the GIN index and annotate ts_rank"""
+    query = SearchQuery(terms, search_type='websearch', config=SEARCH_CONFIG)
+    # ts_rank returns float4; widen it so the value round-trips exactly
+    # through pagination cursors
+    return queryset.filter(search_vector=query).annotate(
+        search_rank=Cast(SearchRank(F('search_vector'), query), FloatField())
+    )
@@ -1,30 +1,50 @@
 from rest_framework import serializers
-from .models import JobPost, JobApplication
-from .utils import get_applicant_name, convert_to_pdf
+from .models import JobPost, JobApplication, SavedSearch, JobAlert
+from django.db import IntegrityError, transaction
+from .utils import get_applicant_name, get_user_job_flags
+from .tasks import convert_application_resume
+from .emails import queue_application_notification
+from .skills import canonical_skills
+from .alerts import normalize_search_params
+from .lifecycle import BULK_ACTIONS
 import os
 
+class JobPostListSerializerBatch(serializers.ListSerializer):
+    """Resolve has_applied/is_following_company for the whole page at once"""
+    
+    def to_representation(self, data):
+        jobs = list(data.all() if hasattr(data, 'all') else data)
+        if self.context.get('public_payload'):
+            # Shared, cacheable output; per-user flags are overlaid afterwards
+            self.context['user_job_flags'] = (set(), set())
+        else:
+            self.context['user_job_flags'] = get_user_job_flags(self.context.get('request'), jobs)
+        return super().to_representation(jobs)
+
 class JobPostListSerializer(serializers.ModelSerializer):
     publisher_id = serializers.IntegerField(source='publisher.id', read_only=True)
     publisher_name = serializers.SerializerMethodField()
     publisher_email = serializers.CharField(source="publisher.email", read_only=True)
     publisher_role = serializers.SerializerMethodField()
+    publisher_profile_img = serializers.CharField(source='publisher_logo_url', read_only=True)
     company_name = serializers.SerializerMethodField()
     has_applied = serializers.SerializerMethodField()
     is_following_company = serializers.SerializerMethodField()
+    distance_km = serializers.SerializerMethodField()
 
     class Meta:
         model = JobPost
         fields = (
-            "id", "title", "description", "salary", "experience", "company_name", "publisher", "publisher_id",
-            "publisher_name", "publisher_email", "publisher_role", "job_type", 
-            "work_mode", "location", "requirements", "application_count", "created_at", "is_active", "has_applied", "is_following_company"
+            "id", "title", "description", "salary", "salary_min", "salary_max", "salary_currency", "salary_period", "experience", "experience_min_years", "experience_max_years", "company_name", "publisher", "publisher_id",
+            "publisher_name", "publisher_email", "publisher_role", "publisher_profile_img", "job_type", 
+            "work_mode", "location", "latitude", "longitude", "distance_km", "requirements", "skills", "application_count", "created_at", "is_active",
+            "has_applied", "is_following_company"
         )
+        list_serializer_class = JobPostListSerializerBatch
 
     def get_publisher_name(self, obj):
         from django.utils.html import escape
-        first_name = escape(obj.publisher.first_name or '')
-        last_name = escape(obj.publisher.last_name or '')
-        return f"{first_name} {last_name}".strip()
+        return escape(obj.publisher_display_name)
     
     def get_publisher_role(self, obj):
         try:
@@ -33,32 +53,24 @@ class JobPostListSerializer(serializers.ModelSerializer):
             return None
     
     def get_company_name(self, obj):
-        # First try the stored company_name field
-        if obj.company_name:
-            return obj.company_name
-        
-        # For Company users - use first_name + last_name as company name
-        if obj.publisher.job_role == 'Company':
-            return f"{obj.publisher.first_name} {obj.publisher.last_name}".strip() or "Company Name"
-        
-        # For Employer users - try to get from user profile or use name
-        if obj.publisher.job_role == 'Employer':
-            try:
-                if hasattr(obj.publisher, 'userprofile') and obj.publisher.userprofile.company_name:
-                    return obj.publisher.userprofile.company_name
-            except:
-                pass
-            return f"{obj.publisher.first_name} {obj.publisher.last_name}".strip() or "Company Name"
-        
-        return "Company Name"
+        # The job's own company_name, else the publisher's denormalized one
+        return obj.get_company_name()
     
     def get_has_applied(self, obj):
+        flags = self.context.get('user_job_flags')
+        if flags is not None:
+            return obj.id in flags[0]
+        
         request = self.context.get('request')
         if request and request.user.is_authenticated:
             return JobApplication.objects.filter(job=obj, applicant=request.user).exists()
         return False
     
     def get_is_following_company(self, obj):
+        flags = self.context.get('user_job_flags')
+        if flags is not None:
+            return obj.publisher_id in flags[1]
+        
         request = self.context.get('request')
         if not request or not request.user.is_authenticated:
             return False
@@ -69,6 +81,11 @@ class JobPostListSerializer(serializers.ModelSerializer):
         except ImportError:
             return False
     
+    def get_distance_km(self, obj):
+        # Only annotated on ?near= searches
+        distance = getattr(obj, 'distance_km', None)
+        return round(distance, 1) if distance is not None else None
+    
 
 
 class JobPostDetailSerializer(serializers.ModelSerializer):
@@ -85,14 +102,18 @@ class JobPostDetailSerializer(serializers.ModelSerializer):
     class Meta:
         model = JobPost
         fields = (
-            "id", "title", "description", "requirements", "company_name", "location", "salary", "experience", "job_type", "work_mode",
+            "id", "title", "description", "requirements", "skills", "company_name", "location", "latitude", "longitude", "salary",
+            "salary_min", "salary_max", "salary_currency", "salary_period", "experience", "experience_min_years", "experience_max_years",
+            "job_type", "work_mode",
             "publisher", "publisher_id", "publisher_name", "publisher_email", "publisher_role", "publisher_phone", "publisher_profile_img",
-            "created_at", "updated_at", "is_active", "application_count", "has_applied", "is_following_company"
+            "created_at", "updated_at", "is_active", "publish_at", "expires_at", "application_count", "has_applied", "is_following_company"
         )
+        list_serializer_class = JobPostListSerializerBatch
         read_only_fields = ("publisher", "publisher_name", "publisher_email", "publisher_role", "created_at", "updated_at")
         extra_kwargs = {
             # Job details - optional fields
             'requirements': {'required': False},
+            'skills': {'required': False},
             'location': {'required': False},
             'salary': {'required': False},
             'experience': {'required': False},
@@ -100,13 +121,14 @@ class JobPostDetailSerializer(serializers.ModelSerializer):
             # Job type and mode - optional fields
             'job_type': {'required': False},
             'work_mode': {'required': False},
+            # Scheduling - optional fields
+            'publish_at': {'required': False},
+            'expires_at': {'required': False},
         }
 
     def get_publisher_name(self, obj):
         from django.utils.html import escape
-        first_name = escape(obj.publisher.first_name or '')
-        last_name = escape(obj.publisher.last_name or '')
-        return f"{first_name} {last_name}".strip()
+        return escape(obj.publisher_display_name)
     
     def get_publisher_role(self, obj):
         try:
@@ -129,46 +151,27 @@ class JobPostDetailSerializer(serializers.ModelSerializer):
         return None
     
     def get_company_name(self, obj):
-        # First try the stored company_name field
-        if obj.company_name:
-            return obj.company_name
-        
-        # For Company users - use first_name + last_name as company name
-        if obj.publisher.job_role == 'Company':
-            return f"{obj.publisher.first_name} {obj.publisher.last_name}".strip() or "Company Name"
-        
-        # For Employer users - try to get from user profile or use name
-        if obj.publisher.job_role == 'Employer':
-            try:
-                if hasattr(obj.publisher, 'userprofile') and obj.publisher.userprofile.company_name:
-                    return obj.publisher.userprofile.company_name
-            except:
-                pass
-            return f"{obj.publisher.first_name} {obj.publisher.last_name}".strip() or "Company Name"
-        
-        return "Company Name"
+        # The job's own company_name, else the publisher's denormalized one
+        return obj.get_company_name()
     
     def get_publisher_profile_img(self, obj):
-        try:
-            if obj.publisher.job_role == 'Company':
-                if hasattr(obj.publisher, 'companyprofile') and obj.publisher.companyprofile.company_logo:
-                    return obj.publisher.companyprofile.company_logo.url
-            else:
-                if hasattr(obj.publisher, 'userprofile') and obj.publisher.userprofile.profile_image:
-                    return obj.publisher.userprofile.profile_image.url
-        except (AttributeError, Exception) as e:
-            import logging
-            logger = logging.getLogger(__name__)
-            logger.error(f"Error getting publisher profile image for job {obj.id}: {str(e)}")
-        return None
+        return obj.publisher_logo_url
     
     def get_has_applied(self, obj):
+        flags = self.context.get('user_job_flags')
+        if flags is not None:
+            return obj.id in flags[0]
+        
         request = self.context.get('request')
         if request and request.user.is_authenticated:
             return JobApplication.objects.filter(job=obj, applicant=request.user).exists()
         return False
     
     def get_is_following_company(self, obj):
+        flags = self.context.get('user_job_flags')
+        if flags is not None:
+            return obj.publisher_id in flags[1]
+        
         request = self.context.get('request')
         if not request or not request.user.is_authenticated:
             return False
@@ -179,7 +182,24 @@ class JobPostDetailSerializer(serializers.ModelSerializer):
         except ImportError:
             return False
     
+    def validate(self, data):
+        # Canonical skills drive the ?skills= filter; derive them from the
+        # requirements unless the client sends them explicitly
+        if 'skills' in data:
+            data['skills'] = canonical_skills(data['skills'])
+        elif 'requirements' in data:
+            data['skills'] = canonical_skills(data['requirements'])
+        
+        publish_at = data.get('publish_at', getattr(self.instance, 'publish_at', None))
+        expires_at = data.get('expires_at', getattr(self.instance, 'expires_at', None))
+        if publish_at and expires_at and expires_at <= publish_at:
+            raise serializers.ValidationError({'expires_at': 'Expiry must be after the publish date.'})
+        return data
+    
     def update(self, instance, validated_data):
+        if validated_data.get('is_active') and not instance.is_active:
+            # Re-queue for saved-search alerts, as activate() does
+            instance.alerts_pending = True
         # Only update fields that are provided
         for attr, value in validated_data.items():
             setattr(instance, attr, value)
@@ -193,7 +213,8 @@ class JobApplicationSerializer(serializers.ModelSerializer):
     class Meta:
         model = JobApplication
         fields = ['job', 'resume', 'cover_letter', 'applicant_name', 'applicant_email', 'applied_at']
-        read_only_fields = ['applicant_name', 'applicant_email', 'applied_at']
+        # The job comes from the URL; see JobApplicationView
+        read_only_fields = ['job', 'applicant_name', 'applicant_email', 'applied_at']
     
     def _is_safe_filename(self, filename):
         """Check if filename is safe from path traversal and invalid characters"""
@@ -227,45 +248,41 @@ class JobApplicationSerializer(serializers.ModelSerializer):
     def validate(self, data):
         """Validate application rules"""
         user = self.context['request'].user
-        job = data['job']
+        job = self.context['job']
         
         # Check if user is the job publisher
-        if job.publisher == user:
+        if job.publisher_id == user.pk:
             raise serializers.ValidationError("You cannot apply to your own job")
         
-        # Check if user already applied
-        if JobApplication.objects.filter(job=job, applicant=user).exists():
-            raise serializers.ValidationError("You have already applied to this job")
-        
+        # Duplicates are rejected by the (job, applicant) unique constraint
+        # on insert, which also holds under concurrent submissions
         return data
     
     def create(self, validated_data):
+        """
+        Insert the application and bump the job's counter in one transaction.
+        Raises IntegrityError if the user already applied; the uploaded
+        resume is removed again in that case.
+        """
         user = self.context['request'].user
-        
-        # Auto-fill applicant details
-        validated_data['applicant'] = user
-        validated_data['applicant_name'] = get_applicant_name(user)
-        validated_data['applicant_email'] = user.email
-        
-        # Create application
-        application = JobApplication.objects.create(**validated_data)
-        
-        # Increment job application count
-        application.job.increment_application_count()
-        
-        # Convert resume to PDF if needed
+        application = JobApplication(
+            applicant=user,
+            applicant_name=get_applicant_name(user),
+            applicant_email=user.email,
+            **validated_data
+        )
         try:
-            pdf_resume = convert_to_pdf(application.resume)
-            if pdf_resume != application.resume:
-                application.resume_pdf = pdf_resume
+            with transaction.atomic():
                 application.save()
-        except Exception as e:
-            import logging
-            logger = logging.getLogger(__name__)
-            logger.error(f"Failed to convert resume to PDF: {str(e)}")
-        
-        # Email notification removed as per requirement
-        
+                application.job.increment_application_count(refresh=False)
+                # Queued in the same transaction, so only committed
+                # applications are notified and converted
+                queue_application_notification(application.job, user)
+                if os.path.splitext(application.resume.name)[1].lower() != '.pdf':
+                    convert_application_resume.delay(application.id)
+        except IntegrityError:
+            application.resume.delete(save=False)
+            raise
         return application
 
 class MyApplicationSerializer(serializers.ModelSerializer):
@@ -330,10 +347,50 @@ class ApplicantSerializer(serializers.ModelSerializer):
     
     class Meta:
         model = JobApplication
-        fields = ['id', 'applicant_name', 'applicant_email', 'status', 'resume_url', 'cover_letter', 'applied_at']
+        fields = ['id', 'applicant_name', 'applicant_email', 'status', 'resume_url', 'cover_letter', 'applied_at', 'match_score']
     
     def get_resume_url(self, obj):
         try:
             return obj.resume.url if obj.resume else None
         except (AttributeError, ValueError):
-            return None
\ No newline at end of file
+            return None
+class SavedSearchSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = SavedSearch
+        fields = ['id', 'name', 'params', 'is_active', 'created_at']
+        read_only_fields = ['created_at']
+    
+    def validate_params(self, value):
+        if not isinstance(value, dict):
+            raise serializers.ValidationError("Params must be an object of job list filters.")
+        params = normalize_search_params(value)
+        if not params:
+            raise serializers.ValidationError("At least one supported job filter is required.")
+        return params
+
+class JobAlertSerializer(serializers.ModelSerializer):
+    saved_search_name = serializers.CharField(source='saved_search.name', read_only=True)
+    job = serializers.SerializerMethodField()
+    
+    class Meta:
+        model = JobAlert
+        fields = ['id', 'saved_search', 'saved_search_name', 'job', 'created_at', 'sent_at']
+    
+    def get_job(self, obj):
+        return {
+            'id': obj.job.id,
+            'title': obj.job.title,
+            'company_name': obj.job.get_company_name(),
+            'location': obj.job.location,
+            'job_type': obj.job.job_type,
+            'work_mode': obj.job.work_mode,
+            'created_at': obj.job.created_at
+        }
+
+class JobBulkActionSerializer(serializers.Serializer):
+    action = serializers.ChoiceField(choices=list(BULK_ACTIONS))
+    job_ids = serializers.ListField(child=serializers.IntegerField(min_value=1), min_length=1, max_length=500)
+    
+    def validate_job_ids(self, value):
+        # Keep the request order, drop repeats
+        return list(dict.fromkeys(value))
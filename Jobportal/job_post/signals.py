@@ -0,0 +1,112 @@
+from django.db.models.signals import post_save, post_delete, pre_save
+from django.utils import timezone
+from .applicant_ranking import JOB_SCORE_FIELDS, PROFILE_SCORE_FIELDS, clear_applicant_scores, clear_job_scores
+from .list_cache import bump_generation, bump_overlay_version
+from .publisher import refresh_publisher_jobs
+from .recommendations import index_job, unindex_job
+from .stats import record_job_activity
+
+# Models whose rows appear in the cached job list. Publisher names and logos
+# are denormalized onto JobPost; refresh_publisher_jobs invalidates for those
+INVALIDATING_MODELS = ('job_post.JobPost',)
+PROFILE_MODELS = ('profiles.UserProfile', 'profiles.CompanyProfile')
+# User fields that feed JobPost's denormalized publisher display fields
+PUBLISHER_USER_FIELDS = {'first_name', 'last_name', 'job_role'}
+
+
+def invalidate_job_list(sender, **kwargs):
+    bump_generation()
+
+
+def refresh_jobs_for_profile(sender, instance, **kwargs):
+    from accounts.models import User
+    # The user may already be gone when a profile is deleted by cascade
+    user = User.objects.filter(pk=instance.user_id).first()
+    if user is not None:
+        refresh_publisher_jobs(user)
+
+
+def snapshot_publisher_fields(sender, instance, update_fields=None, **kwargs):
+    # OTP, password and login saves leave the name and role alone; compare
+    # with the stored row so they don't rewrite every job of the user
+    instance._publisher_fields_changed = False
+    if instance._state.adding or (update_fields is not None and not PUBLISHER_USER_FIELDS & set(update_fields)):
+        return
+    stored = sender.objects.filter(pk=instance.pk).values(*PUBLISHER_USER_FIELDS).first()
+    instance._publisher_fields_changed = stored is not None and any(
+        stored[field] != getattr(instance, field) for field in PUBLISHER_USER_FIELDS
+    )
+
+
+def refresh_jobs_for_user(sender, instance, created, **kwargs):
+    if not created and getattr(instance, '_publisher_fields_changed', True):
+        refresh_publisher_jobs(instance)
+
+
+def invalidate_applicant_overlay(sender, instance, **kwargs):
+    bump_overlay_version(instance.applicant_id)
+
+
+def invalidate_follower_overlay(sender, instance, **kwargs):
+    bump_overlay_version(instance.follower_id)
+
+
+def update_recommendation_index(sender, instance, **kwargs):
+    index_job(instance)
+
+
+def remove_from_recommendation_index(sender, instance, **kwargs):
+    unindex_job(instance.pk)
+
+
+def snapshot_score_inputs(sender, instance, update_fields=None, **kwargs):
+    # Full saves (activate(), deactivate(), edits of other fields) rarely
+    # change the scoring inputs; compare with the stored row to find out
+    instance._score_inputs_changed = False
+    if instance._state.adding or (update_fields is not None and not JOB_SCORE_FIELDS & set(update_fields)):
+        return
+    stored = sender.objects.filter(pk=instance.pk).values(*JOB_SCORE_FIELDS).first()
+    instance._score_inputs_changed = stored is not None and any(
+        stored[field] != getattr(instance, field) for field in JOB_SCORE_FIELDS
+    )
+
+
+def clear_scores_for_job(sender, instance, created, **kwargs):
+    if not created and getattr(instance, '_score_inputs_changed', True):
+        clear_job_scores(instance.pk)
+
+
+def clear_scores_for_profile(sender, instance, update_fields=None, **kwargs):
+    if update_fields is not None and not PROFILE_SCORE_FIELDS & set(update_fields):
+        return
+    clear_applicant_scores(instance.user_id)
+
+
+def count_application(sender, instance, created, **kwargs):
+    if created:
+        record_job_activity(instance.job_id, day=timezone.localdate(instance.applied_at), applications=1)
+
+
+def connect_signals():
+    for model in INVALIDATING_MODELS:
+        post_save.connect(invalidate_job_list, sender=model, dispatch_uid=f'job-list-cache:save:{model}')
+        post_delete.connect(invalidate_job_list, sender=model, dispatch_uid=f'job-list-cache:delete:{model}')
+    for model in PROFILE_MODELS:
+        post_save.connect(refresh_jobs_for_profile, sender=model, dispatch_uid=f'job-publisher:save:{model}')
+        post_delete.connect(refresh_jobs_for_profile, sender=model, dispatch_uid=f'job-publisher:delete:{model}')
+    pre_save.connect(snapshot_publisher_fields, sender='accounts.User', dispatch_uid='job-publisher:pre-save:user')
+    post_save.connect(refresh_jobs_for_user, sender='accounts.User', dispatch_uid='job-publisher:save:user')
+    # Per-user has_applied / is_following_company versions used in ETags
+    post_save.connect(invalidate_applicant_overlay, sender='job_post.JobApplication', dispatch_uid='job-overlay:save:application')
+    post_delete.connect(invalidate_applicant_overlay, sender='job_post.JobApplication', dispatch_uid='job-overlay:delete:application')
+    post_save.connect(invalidate_follower_overlay, sender='follows.Follow', dispatch_uid='job-overlay:save:follow')
+    post_delete.connect(invalidate_follower_overlay, sender='follows.Follow', dispatch_uid='job-overlay:delete:follow')
+    post_save.connect(update_recommendation_index, sender='job_post.JobPost', dispatch_uid='job-recommendations:save')
+    post_delete.connect(remove_from_recommendation_index, sender='job_post.JobPost', dispatch_uid='job-recommendations:delete')
+    # Stored applicant match scores
+    pre_save.connect(snapshot_score_inputs, sender='job_post.JobPost', dispatch_uid='applicant-scores:pre-save:job')
+    post_save.connect(clear_scores_for_job, sender='job_post.JobPost', dispatch_uid='applicant-scores:save:job')
+    post_save.connect(clear_scores_for_profile, sender='profiles.UserProfile', dispatch_uid='applicant-scores:save:profile')
+    post_delete.connect(clear_scores_for_profile, sender='profiles.UserProfile', dispatch_uid='applicant-scores:delete:profile')
+    # Daily activity rollup
+    post_save.connect(count_application, sender='job_post.JobApplication', dispatch_uid='job-stats:save:application')
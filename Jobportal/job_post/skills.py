@@ -0,0 +1,35 @@
+"""
+Skill name canonicalization for JobPost.skills
+"""
+import re
+
+_SPLIT_RE = re.compile(r'[,;\n\r•]+')
+_BULLET_RE = re.compile(r'^\s*(?:[-*•]+|\d+[.)])\s*')
+
+
+def canonical_skill(name):
+    """'  Django REST  ' -> 'django rest'"""
+    name = _BULLET_RE.sub('', str(name))
+    return ' '.join(name.lower().split())
+
+
+def canonical_skills(value):
+    """
+    Normalize a list of skills, or a comma/newline separated string, into a
+    de-duplicated list of lowercase names in their original order.
+    """
+    if not value:
+        return []
+    if isinstance(value, str):
+        items = _SPLIT_RE.split(value)
+    elif isinstance(value, (list, tuple)):
+        items = [part for item in value for part in _SPLIT_RE.split(str(item))]
+    else:
+        return []
+
+    skills = []
+    for item in items:
+        skill = canonical_skill(item)
+        if skill and skill not in skills:
+            skills.append(skill)
+    return skills
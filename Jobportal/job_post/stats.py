@@ -0,0 +1,63 @@
+"""
+Daily per-job activity rollup behind JobStatsView trends.
+
+Each application, status change and detail view increments one
+JobDailyStats row for (job, today), so an N-day trend reads at most N rows
+per job instead of scanning JobApplication. Detail views are added in
+batches by a background task (see tasks.record_job_views).
+"""
+from datetime import timedelta
+
+from django.db import IntegrityError, transaction
+from django.db.models import F, Sum
+from django.utils import timezone
+
+from .models import JobDailyStats
+
+ACTIVITY_FIELDS = ('applications', 'status_changes', 'views')
+TREND_DAYS = (7, 30, 90)
+
+
+def record_job_activity(job_id, day=None, **counts):
+    """Add `counts` (e.g. views=1) to the job's row for `day`, creating it on first use"""
+    day = day or timezone.localdate()
+    increments = {field: F(field) + amount for field, amount in counts.items() if amount}
+    if not increments:
+        return
+    rows = JobDailyStats.objects.filter(job_id=job_id, date=day)
+    if rows.update(**increments):
+        return
+    try:
+        with transaction.atomic():
+            JobDailyStats.objects.create(job_id=job_id, date=day, **counts)
+    except IntegrityError:
+        # Created concurrently; add to that row instead
+        rows.update(**increments)
+
+
+def job_trend(jobs, days):
+    """
+    Daily totals over the last `days` days (today included) for the jobs in
+    the `jobs` queryset, oldest first with zero-filled gaps.
+    """
+    end = timezone.localdate()
+    start = end - timedelta(days=days - 1)
+    rows = (
+        JobDailyStats.objects.filter(job__in=jobs, date__gte=start, date__lte=end)
+        .values('date')
+        .annotate(**{field: Sum(field) for field in ACTIVITY_FIELDS})
+        .order_by('date')
+    )
+    by_date = {row['date']: row for row in rows}
+
+    series = []
+    totals = dict.fromkeys(ACTIVITY_FIELDS, 0)
+    for offset in range(days):
+        day = start + timedelta(days=offset)
+        row = by_date.get(day, {})
+        entry = {'date': day.isoformat()}
+        for field in ACTIVITY_FIELDS:
+            entry[field] = row.get(field) or 0
+            totals[field] += entry[field]
+        series.append(entry)
+    return {'days': days, 'totals': totals, 'series': series}
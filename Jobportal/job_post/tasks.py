@@ -0,0 +1,40 @@
+from datetime import date, timedelta
+
+from django.db import transaction
+from django.utils import timezone
+
+from task_queue.queue import discard_pending, task
+from .models import JobApplication
+from .stats import record_job_activity
+from .utils import attach_pdf_resume
+
+# How long detail views queue up before one task adds them to the stats
+VIEW_BATCH_SECONDS = 60
+
+
+@task(max_attempts=3)
+def convert_application_resume(application_id):
+    """Store a PDF copy of a DOC/DOCX resume"""
+    application = JobApplication.objects.filter(id=application_id).first()
+    if application is not None:
+        attach_pdf_resume(application)
+
+
+@task(max_attempts=3)
+def record_job_views(job_id, day):
+    """Add this view, and those of the copies still queued, to the job's daily stats"""
+    with transaction.atomic():
+        views = 1 + discard_pending(record_job_views.task_name, (job_id, day))
+        record_job_activity(job_id, day=date.fromisoformat(day), views=views)
+
+
+def queue_job_view(job_id):
+    """
+    Count a detail view without touching the job's hot JobDailyStats row
+    from the request; the insert here is the only write
+    """
+    record_job_views.schedule(
+        timezone.now() + timedelta(seconds=VIEW_BATCH_SECONDS),
+        job_id,
+        timezone.localdate().isoformat(),
+    )
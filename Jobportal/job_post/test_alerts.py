@@ -0,0 +1,73 @@
+from io import StringIO
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from rest_framework.test import APIClient
+from rest_framework import status
+from .alerts import candidate_searches
+from .models import JobPost, SavedSearch, JobAlert
+
+User = get_user_model()
+
+
+class JobAlertTestCase(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.employer = User.objects.create_user(
+            email='employer@test.com',
+            password='testpass123',
+            first_name='Jane',
+            job_role='Employer'
+        )
+        self.employee = User.objects.create_user(
+            email='employee@test.com',
+            password='testpass123',
+            first_name='John',
+            job_role='Employee'
+        )
+        self.client.force_authenticate(user=self.employee)
+
+    def _save_search(self, params):
+        response = self.client.post('/api/saved-searches/', {'name': 'Alert', 'params': params}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        return SavedSearch.objects.get(id=response.data['id'])
+
+    def _create_job(self, title, **fields):
+        return JobPost.objects.create(title=title, description='Test Description', publisher=self.employer, **fields)
+
+    def test_params_are_normalized(self):
+        search = self._save_search({'title': 'Python', 'work_mode': 'remote', 'unknown': 'x'})
+        self.assertEqual(search.params, {'title': 'python', 'work_mode': 'remote'})
+
+        response = self.client.post('/api/saved-searches/', {'params': {'unknown': 'x'}}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_candidates_use_indexed_filters(self):
+        remote = self._save_search({'work_mode': 'remote'})
+        skills = self._save_search({'skills': 'django,python'})
+        location = self._save_search({'location': 'bang'})
+        title_only = self._save_search({'title': 'python'})
+
+        job = self._create_job('Python Developer', work_mode='onsite', location='Bangalore', skills=['python'])
+        self.assertEqual(
+            set(candidate_searches([job])),
+            {skills, location, title_only}
+        )
+        self.assertNotIn(remote, candidate_searches([job]))
+
+    def test_matcher_queues_digest_entries_once(self):
+        python_remote = self._save_search({'title': 'python', 'work_mode': 'remote'})
+        self._save_search({'title': 'golang'})
+        job = self._create_job('Python Developer', work_mode='remote')
+        self._create_job('Designer', work_mode='remote')
+
+        call_command('match_job_alerts', stdout=StringIO())
+        call_command('match_job_alerts', stdout=StringIO())
+
+        alerts = JobAlert.objects.all()
+        self.assertEqual([(a.saved_search_id, a.job_id) for a in alerts], [(python_remote.id, job.id)])
+        self.assertFalse(JobPost.objects.filter(alerts_pending=True).exists())
+
+        response = self.client.get('/api/job-alerts/?unsent=true')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['results'][0]['job']['id'], job.id)
@@ -0,0 +1,79 @@
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+from rest_framework import status
+from profiles.models import UserProfile
+from .models import JobPost, JobApplication
+
+User = get_user_model()
+
+
+class ApplicantRankingTestCase(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.employer = User.objects.create_user(
+            email='employer@test.com',
+            password='testpass123',
+            first_name='Jane',
+            job_role='Employer'
+        )
+        self.job = JobPost.objects.create(
+            title='Backend Developer',
+            description='Test Description',
+            skills=['python', 'django', 'postgresql'],
+            experience='3-5 years',
+            publisher=self.employer
+        )
+        self.client.force_authenticate(user=self.employer)
+
+    def _apply(self, email, skills, experience_years):
+        user = User.objects.create_user(email=email, password='testpass123', first_name=email, job_role='Employee')
+        UserProfile.objects.create(user=user, skills=skills, experience_years=experience_years)
+        return JobApplication.objects.create(
+            job=self.job,
+            applicant=user,
+            applicant_name=email,
+            applicant_email=email,
+            resume='resumes/test.pdf'
+        )
+
+    def _ranked_ids(self):
+        response = self.client.get(f'/api/jobs/{self.job.id}/applicants/?ordering=match')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [applicant['id'] for applicant in response.data['applicants']]
+
+    def test_applicants_ranked_by_skills_and_experience(self):
+        partial = self._apply('partial@test.com', ['Python'], 4)
+        full = self._apply('full@test.com', ['Python', 'Django', 'PostgreSQL'], 4)
+        junior = self._apply('junior@test.com', ['Python', 'Django', 'PostgreSQL'], 1)
+
+        self.assertEqual(self._ranked_ids(), [full.id, junior.id, partial.id])
+        full.refresh_from_db()
+        self.assertEqual(full.match_score, 1.0)
+
+    def test_scores_are_cached_until_a_profile_or_job_changes(self):
+        first = self._apply('first@test.com', ['python', 'django'], 4)
+        second = self._apply('second@test.com', ['python'], 4)
+        self.assertEqual(self._ranked_ids(), [first.id, second.id])
+
+        # Stored scores are reused
+        with self.assertNumQueries(4):
+            self._ranked_ids()
+
+        profile = UserProfile.objects.get(user=second.applicant)
+        profile.skills = ['python', 'django', 'postgresql']
+        profile.save()
+        self.assertEqual(self._ranked_ids(), [second.id, first.id])
+
+        # Saves that leave the scoring inputs alone keep the scores
+        self.job.deactivate()
+        self.job.activate()
+        self.job.title = 'Senior Backend Developer'
+        self.job.save()
+        self.assertIsNotNone(JobApplication.objects.get(id=first.id).match_score)
+
+        self.job.skills = ['django']
+        self.job.save()
+        self.assertIsNone(JobApplication.objects.get(id=first.id).match_score)
+        ranked = self._ranked_ids()
+        self.assertEqual(ranked, [second.id, first.id])  # tie broken by newest id
@@ -0,0 +1,70 @@
+import os
+import tempfile
+from django.core import mail
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+from rest_framework import status
+from outbox.mail import drain
+from .models import JobPost, JobApplication
+
+User = get_user_model()
+
+
+@override_settings(MEDIA_ROOT=tempfile.mkdtemp())
+class JobApplicationSubmitTestCase(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.employer = User.objects.create_user(
+            email='employer@test.com',
+            password='testpass123',
+            first_name='Jane',
+            job_role='Employer'
+        )
+        self.employee = User.objects.create_user(
+            email='employee@test.com',
+            password='testpass123',
+            first_name='John',
+            job_role='Employee'
+        )
+        self.job = JobPost.objects.create(title='Backend', description='Test Description', publisher=self.employer)
+        self.client.force_authenticate(user=self.employee)
+
+    def _apply(self):
+        return self.client.post(f'/api/jobs/{self.job.id}/apply/', {
+            'resume': SimpleUploadedFile('cv.pdf', b'%PDF-1.4', content_type='application/pdf'),
+            'cover_letter': 'Hello'
+        }, format='multipart')
+
+    def test_apply_then_duplicate(self):
+        response = self._apply()
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        # The notification goes to the outbox, not SMTP, in the request
+        self.assertEqual(len(mail.outbox), 0)
+        self.assertEqual(drain()['sent'], 1)
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].to, ['employer@test.com'])
+
+        application = JobApplication.objects.get(job=self.job, applicant=self.employee)
+        self.assertEqual(application.applicant_name, 'John')
+        self.assertEqual(JobPost.objects.get(id=self.job.id).application_count, 1)
+
+        response = self._apply()
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data['error'], 'ALREADY_APPLIED')
+        # Rolled back with the duplicate insert
+        self.assertEqual(drain()['sent'], 0)
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(JobPost.objects.get(id=self.job.id).application_count, 1)
+        # The rejected upload is not left behind
+        resumes = os.listdir(os.path.dirname(application.resume.path))
+        self.assertEqual(resumes, [os.path.basename(application.resume.name)])
+
+    def test_invalid_resume(self):
+        response = self.client.post(f'/api/jobs/{self.job.id}/apply/', {
+            'resume': SimpleUploadedFile('cv.exe', b'MZ'),
+        }, format='multipart')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('resume', response.data['details'])
+        self.assertFalse(JobApplication.objects.exists())
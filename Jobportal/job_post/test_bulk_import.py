@@ -0,0 +1,92 @@
+import json
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+from rest_framework import status
+from .models import JobPost
+
+User = get_user_model()
+
+
+class JobImportTestCase(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.employer = User.objects.create_user(
+            email='employer@test.com',
+            password='testpass123',
+            first_name='Jane',
+            job_role='Employer'
+        )
+        self.client.force_authenticate(user=self.employer)
+
+    def _upload(self, name, content):
+        return self.client.post(
+            '/api/jobs/import/',
+            {'file': SimpleUploadedFile(name, content.encode('utf-8'))},
+            format='multipart'
+        )
+
+    def test_csv_import_derives_fields_and_reports_bad_rows(self):
+        content = (
+            'title,description,requirements,salary,experience,location,work_mode\n'
+            'Python Developer,Build APIs,Python | Django,10-20 LPA,2-4 years,Bangalore,remote\n'
+            ',Missing title,,,,,\n'
+            'Designer,Design things,Figma,,,,bogus\n'
+        )
+        response = self._upload('jobs.csv', content)
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual((response.data['created'], response.data['failed']), (1, 2))
+        self.assertEqual([error['row'] for error in response.data['errors']], [3, 4])
+        self.assertIn('title', response.data['errors'][0]['errors'])
+
+        job = JobPost.objects.get(title='Python Developer')
+        self.assertEqual(job.requirements, ['Python', 'Django'])
+        self.assertEqual(job.skills, ['python', 'django'])
+        self.assertEqual((job.experience_min_years, job.experience_max_years), (2, 4))
+        self.assertIsNotNone(job.salary_min)
+        self.assertIsNotNone(job.latitude)
+        self.assertEqual(job.publisher_display_name, 'Jane')
+
+        # Searchable and listed right away
+        response = self.client.get('/api/jobs/?search=django')
+        self.assertEqual([result['id'] for result in response.data['results']], [job.id])
+
+    def test_csv_skills_cell_holds_a_list(self):
+        content = (
+            'title,description,skills\n'
+            'Backend,APIs,python | django\n'
+        )
+        response = self._upload('jobs.csv', content)
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['created'], 1)
+        job = JobPost.objects.get(title='Backend')
+        self.assertEqual(job.skills, ['python', 'django'])
+
+        response = self.client.get('/api/jobs/?skills=django')
+        self.assertEqual([result['id'] for result in response.data['results']], [job.id])
+
+    def test_jsonl_import(self):
+        lines = [
+            json.dumps({'title': 'Backend', 'description': 'APIs', 'skills': ['Go']}),
+            'not json',
+            json.dumps({'title': 'Frontend', 'description': 'UI', 'job_type': 'parttime'}),
+        ]
+        response = self._upload('jobs.jsonl', '\n'.join(lines))
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual((response.data['created'], response.data['failed']), (2, 1))
+        self.assertEqual(response.data['errors'][0]['row'], 2)
+        self.assertEqual(
+            set(JobPost.objects.values_list('title', 'publisher_id')),
+            {('Backend', self.employer.id), ('Frontend', self.employer.id)}
+        )
+
+    def test_rejects_unknown_format_and_employees(self):
+        response = self._upload('jobs.xlsx', 'x')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data['error'], 'UNSUPPORTED_FORMAT')
+
+        employee = User.objects.create_user(email='employee@test.com', password='testpass123', job_role='Employee')
+        self.client.force_authenticate(user=employee)
+        response = self._upload('jobs.csv', 'title,description\nA,B\n')
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
@@ -0,0 +1,68 @@
+from io import StringIO
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from posts.models import Post, PostLike, Comment
+from .counters import COUNTERS, reconcile_counter
+from .models import JobPost, JobApplication
+
+User = get_user_model()
+
+
+class CounterReconciliationTestCase(TestCase):
+    def setUp(self):
+        self.employer = User.objects.create_user(
+            email='employer@test.com',
+            password='testpass123',
+            first_name='Jane',
+            job_role='Employer'
+        )
+        self.employee = User.objects.create_user(
+            email='employee@test.com',
+            password='testpass123',
+            first_name='John',
+            job_role='Employee'
+        )
+        self.job = JobPost.objects.create(title='Backend', description='Test Description', publisher=self.employer)
+        self.post = Post.objects.create(author=self.employer, content='Hello')
+
+    def test_increment_is_atomic_update(self):
+        stale = JobPost.objects.get(id=self.job.id)
+        self.job.increment_application_count()
+        stale.increment_application_count()
+        self.assertEqual(stale.application_count, 2)
+        self.assertEqual(JobPost.objects.get(id=self.job.id).application_count, 2)
+
+    def test_command_reports_and_fixes_drift(self):
+        JobApplication.objects.create(
+            job=self.job,
+            applicant=self.employee,
+            applicant_name='John',
+            applicant_email=self.employee.email,
+            resume='resumes/test.pdf'
+        )
+        PostLike.objects.create(user=self.employee, post=self.post)
+        Comment.objects.create(user=self.employee, post=self.post, text='Hi')
+        Post.objects.filter(id=self.post.id).update(likes_count=5, comments_count=1)
+        Post.objects.create(author=self.employer, content='Second', comments_count=2)
+
+        report = reconcile_counter(COUNTERS[0], fix=False)
+        self.assertEqual((report['checked'], report['drifted'], report['fixed']), (1, 1, 0))
+        self.assertEqual(report['samples'], [(self.job.id, 0, 1)])
+
+        out = StringIO()
+        call_command('reconcile_counters', '--chunk-size', '1', stdout=out)
+        output = out.getvalue()
+        self.assertIn('job_post.JobPost.application_count: checked=1 drifted=1 drift=1 fixed=1', output)
+        self.assertIn('posts.Post.likes_count: checked=2 drifted=1 drift=4 fixed=1', output)
+        self.assertIn('posts.Post.comments_count: checked=2 drifted=1 drift=2 fixed=1', output)
+
+        self.assertEqual(JobPost.objects.get(id=self.job.id).application_count, 1)
+        self.assertEqual(
+            list(Post.objects.order_by('id').values_list('likes_count', 'comments_count')),
+            [(1, 1), (0, 0)]
+        )
+
+        out = StringIO()
+        call_command('reconcile_counters', stdout=out)
+        self.assertIn('0 drifted rows fixed', out.getvalue())
@@ -0,0 +1,76 @@
+from io import StringIO
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from rest_framework.test import APIClient
+from rest_framework import status
+from .models import JobPost
+from .experience import parse_experience
+
+User = get_user_model()
+
+
+class ExperienceParserTestCase(TestCase):
+    def test_common_formats(self):
+        self.assertEqual(parse_experience('2-4 years'), (2, 4))
+        self.assertEqual(parse_experience('2+ yrs'), (2, None))
+        self.assertEqual(parse_experience('3 years'), (3, 3))
+        self.assertEqual(parse_experience('Up to 2 years'), (0, 2))
+        self.assertEqual(parse_experience('6 months'), (0, 1))
+        self.assertEqual(parse_experience('Fresher'), (0, 0))
+        self.assertEqual(parse_experience('Senior'), (None, None))
+
+    def test_implausible_values_are_ignored(self):
+        self.assertEqual(parse_experience('2021'), (None, None))
+        self.assertEqual(parse_experience('5-100 years'), (None, None))
+        self.assertEqual(parse_experience('60 years'), (60, 60))
+        self.assertEqual(parse_experience('36 months'), (3, 3))
+        # Would overflow the PositiveSmallIntegerField columns
+        job = JobPost.objects.create(
+            title='Developer',
+            description='Test Description',
+            experience='40000 years',
+            publisher=User.objects.create_user(email='employer@test.com', password='testpass123', job_role='Employer')
+        )
+        self.assertEqual((job.experience_min_years, job.experience_max_years), (None, None))
+
+
+class ExperienceFilterTestCase(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.employer = User.objects.create_user(
+            email='employer@test.com',
+            password='testpass123',
+            first_name='Jane',
+            job_role='Employer'
+        )
+        self.range = self._create_job('2-4 years')
+        self.open_ended = self._create_job('2+ yrs')
+        self.exact = self._create_job('3 years')
+        self.fresher = self._create_job('Fresher')
+
+    def _create_job(self, experience):
+        return JobPost.objects.create(
+            title='Developer',
+            description='Test Description',
+            experience=experience,
+            publisher=self.employer
+        )
+
+    def _ids(self, url):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return {job['id'] for job in response.data['results']}
+
+    def test_filter_by_years_overlap(self):
+        self.assertEqual(self._ids('/api/jobs/?experience_years=3'), {self.range.id, self.open_ended.id, self.exact.id})
+        self.assertEqual(self._ids('/api/jobs/?experience_years=10'), {self.open_ended.id})
+        self.assertEqual(self._ids('/api/jobs/?experience_years=0'), {self.fresher.id})
+
+    def test_backfill_command(self):
+        JobPost.objects.update(experience_min_years=None, experience_max_years=None)
+        call_command('backfill_job_experience', batch_size=2, stdout=StringIO())
+        self.range.refresh_from_db()
+        self.open_ended.refresh_from_db()
+        self.assertEqual((self.range.experience_min_years, self.range.experience_max_years), (2, 4))
+        self.assertEqual((self.open_ended.experience_min_years, self.open_ended.experience_max_years), (2, None))
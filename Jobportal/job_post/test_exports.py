@@ -0,0 +1,61 @@
+import csv
+import io
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+from rest_framework import status
+from .models import JobPost, JobApplication
+
+User = get_user_model()
+
+
+class ApplicantExportTestCase(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.employer = User.objects.create_user(
+            email='employer@test.com',
+            password='testpass123',
+            first_name='Jane',
+            job_role='Employer'
+        )
+        self.job = JobPost.objects.create(title='Backend Developer', description='Test Description', publisher=self.employer)
+        self.client.force_authenticate(user=self.employer)
+
+    def _apply(self, name, **fields):
+        user = User.objects.create_user(email=f'{name}@test.com', password='testpass123', job_role='Employee')
+        return JobApplication.objects.create(
+            job=self.job,
+            applicant=user,
+            applicant_name=name,
+            applicant_email=user.email,
+            resume='resumes/test.pdf',
+            **fields
+        )
+
+    def _export(self, query=''):
+        response = self.client.get(f'/api/jobs/{self.job.id}/applicants/export/{query}')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        content = b''.join(response.streaming_content).decode('utf-8-sig')
+        return list(csv.reader(io.StringIO(content)))
+
+    def test_export_streams_all_applicants(self):
+        self._apply('alice')
+        self._apply('=cmd()', status='shortlisted')
+
+        rows = self._export()
+        self.assertEqual(rows[0], ['name', 'email', 'status', 'applied_at', 'resume_url'])
+        self.assertEqual([row[:3] for row in rows[1:]], [
+            ["'=cmd()", "'=cmd()@test.com", 'shortlisted'],
+            ['alice', 'alice@test.com', 'submitted'],
+        ])
+        self.assertEqual(rows[1][4], 'http://testserver/media/resumes/test.pdf')
+
+        rows = self._export('?status=submitted')
+        self.assertEqual([row[0] for row in rows[1:]], ['alice'])
+
+    def test_only_the_publisher_can_export(self):
+        other = User.objects.create_user(email='other@test.com', password='testpass123', job_role='Employer')
+        self.client.force_authenticate(user=other)
+        response = self.client.get(f'/api/jobs/{self.job.id}/applicants/export/')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
@@ -0,0 +1,77 @@
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from rest_framework.test import APIClient
+from .facets import TOP_LOCATIONS
+from .models import JobPost
+
+User = get_user_model()
+
+
+class JobFacetsTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.employer = User.objects.create_user(
+            email='employer@test.com',
+            password='testpass123',
+            first_name='Jane',
+            job_role='Employer'
+        )
+        self._create_job('Python Developer', job_type='fulltime', work_mode='remote', location='Kochi', experience='2 years')
+        self._create_job('Django Developer', job_type='fulltime', work_mode='onsite', location='Kochi', experience='2 years')
+        self._create_job('Data Intern', job_type='intern', work_mode='remote', location='Pune')
+        self._create_job('Old Job', job_type='parttime', location='Kochi', is_active=False)
+
+    def _create_job(self, title, **fields):
+        return JobPost.objects.create(title=title, description='Test Description', publisher=self.employer, **fields)
+
+    def _get(self, query=''):
+        response = self.client.get(f'/api/jobs/facets/{query}')
+        self.assertEqual(response.status_code, 200)
+        return response.data
+
+    @staticmethod
+    def _counts(buckets):
+        return {bucket['value']: bucket['count'] for bucket in buckets}
+
+    def test_counts_per_facet(self):
+        facets = self._get()
+        self.assertEqual(facets['total'], 3)
+        self.assertEqual(self._counts(facets['job_type']), {'fulltime': 2, 'intern': 1})
+        self.assertEqual(facets['job_type'][0]['label'], 'Full-time')
+        self.assertEqual(self._counts(facets['work_mode']), {'remote': 2, 'onsite': 1})
+        self.assertEqual(self._counts(facets['experience']), {'2 years': 2})
+        self.assertEqual(facets['location'], [{'value': 'Kochi', 'count': 2}, {'value': 'Pune', 'count': 1}])
+
+    def test_locations_cut_off_at_top_n(self):
+        for index in range(TOP_LOCATIONS + 2):
+            self._create_job(f'Job {index}', location=f'City {index:02d}')
+        locations = self._get()['location']
+        self.assertEqual(len(locations), TOP_LOCATIONS)
+        self.assertEqual(locations[0], {'value': 'Kochi', 'count': 2})
+
+    def test_list_filters_apply_except_each_facets_own(self):
+        facets = self._get('?job_type=fulltime&work_mode=remote')
+        self.assertEqual(facets['total'], 1)
+        # job_type counts ignore job_type=fulltime but keep work_mode=remote
+        self.assertEqual(self._counts(facets['job_type']), {'fulltime': 1, 'intern': 1})
+        self.assertEqual(self._counts(facets['work_mode']), {'remote': 1, 'onsite': 1})
+        self.assertEqual(self._counts(facets['location']), {'Kochi': 1})
+
+        # title narrows every facet, location all but its own
+        facets = self._get('?title=developer&location=kochi')
+        self.assertEqual(facets['total'], 2)
+        self.assertEqual(self._counts(facets['location']), {'Kochi': 2})
+        self.assertEqual(self._counts(facets['job_type']), {'fulltime': 2})
+
+    def test_cached_until_a_job_changes(self):
+        self.assertEqual(self._get('?location=Kochi')['total'], 2)
+        # bulk_create sends no signals, so the cached counts are served
+        JobPost.objects.bulk_create([
+            JobPost(title='Bulk Job', description='Test Description', publisher=self.employer, location='Kochi', is_active=True)
+        ])
+        self.assertEqual(self._get('?location=kochi')['total'], 2)
+
+        self._create_job('Go Developer', location='Kochi')
+        self.assertEqual(self._get('?location=Kochi')['total'], 4)
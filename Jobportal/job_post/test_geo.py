@@ -0,0 +1,62 @@
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+from rest_framework import status
+from authentication.geo import normalize_location
+from profiles.models import UserProfile
+from .models import JobPost
+
+User = get_user_model()
+
+
+class GazetteerTestCase(TestCase):
+    def test_normalize_location(self):
+        self.assertEqual(normalize_location('Kochi, Kerala').name, 'Kochi')
+        self.assertEqual(normalize_location('Infopark Cochin (Hybrid)').name, 'Kochi')
+        self.assertEqual(normalize_location('Navi Mumbai').name, 'Navi Mumbai')
+        self.assertIsNone(normalize_location('Remote'))
+
+
+class JobNearFilterTestCase(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.employer = User.objects.create_user(
+            email='employer@test.com',
+            password='testpass123',
+            first_name='Jane',
+            job_role='Employer'
+        )
+        self.kochi = self._create_job('Kochi, Kerala')
+        self.thrissur = self._create_job('Thrissur')
+        self.bangalore = self._create_job('Bangalore')
+        self.remote = self._create_job('Remote')
+
+    def _create_job(self, location):
+        return JobPost.objects.create(
+            title='Developer',
+            description='Test Description',
+            location=location,
+            publisher=self.employer
+        )
+
+    def _ids(self, url):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [job['id'] for job in response.data['results']]
+
+    def test_coordinates_saved(self):
+        self.assertIsNotNone(self.kochi.latitude)
+        self.assertIsNone(self.remote.latitude)
+
+    def test_radius_nearest_first(self):
+        self.assertEqual(self._ids('/api/jobs/?near=ernakulam&radius_km=100'), [self.kochi.id, self.thrissur.id])
+        self.assertEqual(self._ids('/api/jobs/?near=cochin&radius_km=10'), [self.kochi.id])
+        self.assertEqual(self._ids('/api/jobs/?near=kochi&radius_km=500'), [self.kochi.id, self.thrissur.id, self.bangalore.id])
+
+    def test_unknown_city_matches_nothing(self):
+        self.assertEqual(self._ids('/api/jobs/?near=atlantis'), [])
+
+    def test_near_me_uses_profile_location(self):
+        UserProfile.objects.create(user=self.employer, location='Thrissur')
+        self.client.force_authenticate(user=self.employer)
+        self.assertEqual(self._ids('/api/jobs/?near=me&radius_km=10'), [self.thrissur.id])
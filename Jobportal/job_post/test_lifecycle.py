@@ -0,0 +1,161 @@
+from datetime import timedelta
+from io import StringIO
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework import status
+from .lifecycle import lifecycle_backlog, run_lifecycle
+from .models import JobPost
+
+User = get_user_model()
+
+
+class JobLifecycleTestCase(TestCase):
+    def setUp(self):
+        self.employer = User.objects.create_user(
+            email='employer@test.com',
+            password='testpass123',
+            first_name='Jane',
+            job_role='Employer'
+        )
+
+    def _create_job(self, title, **fields):
+        return JobPost.objects.create(title=title, description='Test Description', publisher=self.employer, **fields)
+
+    def test_future_publish_at_holds_job_back(self):
+        job = self._create_job('Scheduled', publish_at=timezone.now() + timedelta(days=1))
+        self.assertFalse(job.is_active)
+
+        job.activate()
+        job.refresh_from_db()
+        self.assertTrue(job.is_active)
+        self.assertIsNone(job.publish_at)
+
+    def test_edit_scheduled_job_after_publish_time(self):
+        job = self._create_job('Scheduled', publish_at=timezone.now() + timedelta(hours=1))
+        JobPost.objects.filter(id=job.id).update(publish_at=timezone.now() - timedelta(minutes=5), alerts_pending=False)
+        job.refresh_from_db()
+
+        job.title = 'Scheduled (edited)'
+        job.save()
+        job.refresh_from_db()
+        self.assertTrue(job.is_active)
+        self.assertIsNone(job.publish_at)
+        self.assertTrue(job.alerts_pending)
+
+    def test_scheduler_publishes_and_expires_idempotently(self):
+        now = timezone.now()
+        scheduled = self._create_job('Scheduled', publish_at=now + timedelta(hours=1))
+        expiring = self._create_job('Expiring', expires_at=now + timedelta(hours=1))
+        lapsed = self._create_job('Lapsed', publish_at=now + timedelta(hours=1), expires_at=now + timedelta(minutes=70))
+        JobPost.objects.filter(id=scheduled.id).update(alerts_pending=False)
+
+        later = now + timedelta(hours=1, minutes=30)
+        self.assertEqual(lifecycle_backlog(later), {'publish_due': 2, 'expire_due': 1, 'max_lag_seconds': 1800.0})
+
+        published, expired, _ = run_lifecycle(later, batch_size=1)
+        self.assertEqual((published, expired), (1, 1))
+        self.assertEqual(run_lifecycle(later)[:2], (0, 0))
+
+        scheduled.refresh_from_db()
+        self.assertTrue(scheduled.is_active)
+        self.assertIsNone(scheduled.publish_at)
+        self.assertTrue(scheduled.alerts_pending)
+        self.assertFalse(JobPost.objects.get(id=expiring.id).is_active)
+        # Expired before the scheduler got to publish it
+        self.assertEqual(
+            JobPost.objects.filter(id=lapsed.id).values_list('is_active', 'publish_at').get(),
+            (False, None)
+        )
+
+    def test_command_reports_backlog(self):
+        self._create_job('Expired', expires_at=timezone.now() - timedelta(minutes=5))
+        out = StringIO()
+        call_command('run_job_lifecycle', '--backlog', stdout=out)
+        self.assertIn('expire_due=1', out.getvalue())
+
+        out = StringIO()
+        call_command('run_job_lifecycle', stdout=out)
+        self.assertIn('expired 1 jobs', out.getvalue())
+        self.assertIn('expire_due=0', out.getvalue())
+
+
+class JobBulkActionTestCase(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.employer = User.objects.create_user(
+            email='employer@test.com',
+            password='testpass123',
+            first_name='Jane',
+            job_role='Employer'
+        )
+        self.other = User.objects.create_user(
+            email='other@test.com',
+            password='testpass123',
+            first_name='Other',
+            job_role='Employer'
+        )
+        self.client.force_authenticate(user=self.employer)
+
+    def _create_job(self, title, publisher=None, **fields):
+        return JobPost.objects.create(title=title, description='Test Description', publisher=publisher or self.employer, **fields)
+
+    def _bulk(self, action, job_ids):
+        return self.client.post('/api/jobs/bulk/', {'action': action, 'job_ids': job_ids}, format='json')
+
+    def test_bulk_actions_report_per_id_results(self):
+        first = self._create_job('First')
+        second = self._create_job('Second', expires_at=timezone.now() + timedelta(days=1))
+        foreign = self._create_job('Foreign', publisher=self.other)
+
+        with self.assertNumQueries(4):  # savepoint, lock, update, release
+            response = self._bulk('deactivate', [first.id, foreign.id, second.id, first.id, 999999])
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['updated'], 2)
+        self.assertEqual(
+            [(r['id'], r['result']) for r in response.data['results']],
+            [(first.id, 'deactivated'), (foreign.id, 'not_found'), (second.id, 'deactivated'), (999999, 'not_found')]
+        )
+        self.assertEqual(JobPost.objects.filter(is_active=True).get(), foreign)
+
+        response = self._bulk('delete', [first.id])
+        self.assertEqual(response.data['results'][0]['result'], 'deleted')
+        self.assertIsNotNone(JobPost.objects.get(id=first.id).deleted_at)
+        response = self._bulk('delete', [first.id])
+        self.assertEqual(response.data['results'][0]['result'], 'not_found')
+
+        # Activation restores deleted jobs and keeps a future expiry, like activate()
+        response = self._bulk('activate', [first.id, second.id])
+        self.assertEqual(response.data['updated'], 2)
+        first.refresh_from_db()
+        second.refresh_from_db()
+        self.assertTrue(first.is_active and second.is_active)
+        self.assertIsNone(first.deleted_at)
+        self.assertIsNotNone(second.expires_at)
+
+    def test_manual_activation_requeues_alerts(self):
+        bulk = self._create_job('Bulk', is_active=False)
+        single = self._create_job('Single', is_active=False)
+        patched = self._create_job('Patched', is_active=False)
+        already_active = self._create_job('Active')
+        # The alert matcher has processed (and skipped) them all
+        JobPost.objects.update(alerts_pending=False)
+
+        self._bulk('activate', [bulk.id, already_active.id])
+        self.client.patch(f'/api/jobs/{single.id}/activate/')
+        self.client.patch(f'/api/jobs/{patched.id}/', {'is_active': True}, format='json')
+
+        self.assertEqual(
+            set(JobPost.objects.filter(alerts_pending=True).values_list('title', flat=True)),
+            {'Bulk', 'Single', 'Patched'}
+        )
+
+    def test_invalid_requests(self):
+        self.assertEqual(self._bulk('archive', [1]).status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self._bulk('delete', []).status_code, status.HTTP_400_BAD_REQUEST)
+
+        employee = User.objects.create_user(email='employee@test.com', password='testpass123', job_role='Employee')
+        self.client.force_authenticate(user=employee)
+        self.assertEqual(self._bulk('delete', [1]).status_code, status.HTTP_403_FORBIDDEN)
@@ -0,0 +1,202 @@
+from datetime import timedelta
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+from follows.models import Follow
+from profiles.models import UserProfile
+from . import list_cache
+from .models import JobPost, JobApplication
+
+User = get_user_model()
+
+
+class JobListCacheTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.employer = User.objects.create_user(
+            email='employer@test.com',
+            password='testpass123',
+            first_name='Jane',
+            job_role='Employer'
+        )
+        self.job = JobPost.objects.create(
+            title='Python Developer',
+            description='Test Description',
+            publisher=self.employer
+        )
+
+    def _get(self, url='/api/jobs/'):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return response
+
+    def test_repeat_anonymous_request_is_served_from_cache(self):
+        self.assertEqual(self._get()['X-Cache'], 'MISS')
+        self.assertEqual(self._get()['X-Cache'], 'HIT')
+        # Case-insensitive filters share an entry
+        self._get('/api/jobs/?title=Python')
+        self.assertEqual(self._get('/api/jobs/?title=python')['X-Cache'], 'HIT')
+
+        stats = list_cache.stats()
+        self.assertEqual((stats['hits'], stats['misses']), (2, 2))
+        self.assertEqual(stats['hit_ratio'], 0.5)
+
+    def test_job_write_invalidates(self):
+        self._get()
+        self.job.title = 'Golang Developer'
+        self.job.save()
+
+        response = self._get()
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertEqual(response.data['results'][0]['title'], 'Golang Developer')
+
+        self.job.delete()
+        self.assertEqual(self._get().data['results'], [])
+
+    def test_apply_keeps_cache_with_live_application_count(self):
+        first = self._get()
+        generation = list_cache.get_generation()
+
+        self.job.increment_application_count()
+        self.assertEqual(list_cache.get_generation(), generation)
+
+        response = self._get()
+        self.assertEqual(response['X-Cache'], 'HIT')
+        self.assertEqual(response.data['results'][0]['application_count'], 1)
+        self.assertNotEqual(response['ETag'], first['ETag'])
+        # Revalidating with the old ETag sees the new count
+        self.assertEqual(self.client.get('/api/jobs/', HTTP_IF_NONE_MATCH=first['ETag']).status_code, 200)
+        self.assertEqual(self.client.get('/api/jobs/', HTTP_IF_NONE_MATCH=response['ETag']).status_code, 304)
+
+    def test_publisher_profile_write_invalidates(self):
+        self._get()
+        UserProfile.objects.create(user=self.employer, company_name='Acme')
+        response = self._get()
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertEqual(response.data['results'][0]['company_name'], 'Acme')
+
+    def test_publisher_user_save_refreshes_only_on_display_change(self):
+        self._get()
+        updated_at = JobPost.objects.get(id=self.job.id).updated_at
+        # OTP and plain full saves leave the name and role alone
+        self.employer.generate_otp()
+        self.employer.save()
+        self.assertEqual(JobPost.objects.get(id=self.job.id).updated_at, updated_at)
+        self.assertEqual(self._get()['X-Cache'], 'HIT')
+
+        self.employer.first_name = 'Janet'
+        self.employer.save()
+        response = self._get()
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertEqual(JobPost.objects.get(id=self.job.id).publisher_display_name, 'Janet')
+
+    def test_authenticated_requests_share_cache_with_user_overlay(self):
+        employee = User.objects.create_user(
+            email='employee@test.com',
+            password='testpass123',
+            first_name='John',
+            job_role='Employee'
+        )
+        JobApplication.objects.create(
+            job=self.job,
+            applicant=employee,
+            applicant_name='John',
+            applicant_email='employee@test.com',
+            resume='resumes/test.pdf'
+        )
+        Follow.objects.create(follower=employee, following=self.employer)
+
+        anonymous = self._get()
+        self.assertFalse(anonymous.data['results'][0]['has_applied'])
+
+        self.client.force_authenticate(user=employee)
+        response = self._get()
+        self.assertEqual(response['X-Cache'], 'HIT')
+        self.assertTrue(response.data['results'][0]['has_applied'])
+        self.assertTrue(response.data['results'][0]['is_following_company'])
+
+        # The overlay never leaks into the shared entry
+        self.client.force_authenticate(user=None)
+        self.assertFalse(self._get().data['results'][0]['has_applied'])
+
+
+class JobConditionalGetTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.employer = User.objects.create_user(
+            email='employer@test.com',
+            password='testpass123',
+            first_name='Jane',
+            job_role='Employer'
+        )
+        self.employee = User.objects.create_user(
+            email='employee@test.com',
+            password='testpass123',
+            first_name='John',
+            job_role='Employee'
+        )
+        self.job = JobPost.objects.create(
+            title='Python Developer',
+            description='Test Description',
+            publisher=self.employer
+        )
+
+    def _revalidate(self, url, etag):
+        return self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+    def test_unchanged_list_and_detail_return_304(self):
+        for url in ('/api/jobs/', f'/api/jobs/{self.job.id}/'):
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            self.assertTrue(response['ETag'].startswith('W/'))
+            self.assertIn('Last-Modified', response)
+
+            not_modified = self._revalidate(url, response['ETag'])
+            self.assertEqual(not_modified.status_code, 304)
+            self.assertEqual(not_modified['ETag'], response['ETag'])
+
+    def test_304_skips_serialization(self):
+        etag = self.client.get(f'/api/jobs/{self.job.id}/')['ETag']
+        with CaptureQueriesContext(connection) as queries:
+            response = self._revalidate(f'/api/jobs/{self.job.id}/', etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(len(queries), 1)
+
+    def test_job_leaving_the_list_moves_last_modified(self):
+        hour_ago = timezone.now() - timedelta(hours=1)
+        newer = JobPost.objects.create(title='Go Developer', description='Test Description', publisher=self.employer)
+        JobPost.objects.filter(id=self.job.id).update(updated_at=hour_ago - timedelta(hours=1))
+        JobPost.objects.filter(id=newer.id).update(updated_at=hour_ago)
+        cache.set(list_cache.CHANGED_AT_KEY, hour_ago.timestamp(), None)
+        last_modified = self.client.get('/api/jobs/')['Last-Modified']
+        self.assertEqual(self.client.get('/api/jobs/', HTTP_IF_MODIFIED_SINCE=last_modified).status_code, 304)
+
+        # Only the older job is left on the page
+        newer.deactivate()
+        response = self.client.get('/api/jobs/', HTTP_IF_MODIFIED_SINCE=last_modified)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([job['id'] for job in response.data['results']], [self.job.id])
+
+    def test_job_change_invalidates_etag(self):
+        list_etag = self.client.get('/api/jobs/')['ETag']
+        detail_etag = self.client.get(f'/api/jobs/{self.job.id}/')['ETag']
+        self.job.title = 'Golang Developer'
+        self.job.save()
+        self.assertEqual(self._revalidate('/api/jobs/', list_etag).status_code, 200)
+        self.assertEqual(self._revalidate(f'/api/jobs/{self.job.id}/', detail_etag).status_code, 200)
+
+    def test_user_overlay_change_invalidates_etag(self):
+        self.client.force_authenticate(user=self.employee)
+        etag = self.client.get('/api/jobs/')['ETag']
+        self.assertEqual(self._revalidate('/api/jobs/', etag).status_code, 304)
+
+        Follow.objects.create(follower=self.employee, following=self.employer)
+        response = self._revalidate('/api/jobs/', etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.data['results'][0]['is_following_company'])
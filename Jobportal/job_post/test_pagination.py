@@ -0,0 +1,72 @@
+from datetime import timedelta
+from unittest import mock
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework import status
+from authentication.pagination import KeysetPagination
+from .models import JobPost
+
+User = get_user_model()
+
+
+class KeysetPaginationTestCase(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.employer = User.objects.create_user(
+            email='employer@test.com',
+            password='testpass123',
+            first_name='Jane',
+            job_role='Employer'
+        )
+        now = timezone.now()
+        # Two jobs share each timestamp so the id tie-breaker is exercised
+        self.jobs = [
+            JobPost.objects.create(
+                title=f'Job {i}',
+                description='Test Description',
+                publisher=self.employer,
+                created_at=now - timedelta(minutes=i // 2)
+            )
+            for i in range(7)
+        ]
+
+    def _ids(self, response):
+        return [job['id'] for job in response.data['results']]
+
+    def test_walks_all_pages_without_duplicates(self):
+        """Following next links visits every job exactly once in order"""
+        url = '/api/jobs/?page_size=3'
+        seen = []
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertLessEqual(len(response.data['results']), 3)
+            seen.extend(self._ids(response))
+            url = response.data['next']
+
+        expected = list(JobPost.objects.order_by('-created_at', '-id').values_list('id', flat=True))
+        self.assertEqual(seen, expected)
+
+    def test_previous_link_returns_prior_page(self):
+        """The previous cursor of page two yields page one"""
+        first = self.client.get('/api/jobs/?page_size=3')
+        self.assertIsNone(first.data['previous'])
+
+        second = self.client.get(first.data['next'])
+        back = self.client.get(second.data['previous'])
+        self.assertEqual(self._ids(back), self._ids(first))
+
+    def test_page_size_is_bounded(self):
+        """Requested page sizes are capped at the paginator maximum"""
+        with mock.patch.object(KeysetPagination, 'max_page_size', 5):
+            response = self.client.get('/api/jobs/?page_size=100000')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['results']), 5)
+        self.assertIsNotNone(response.data['next'])
+
+    def test_invalid_cursor(self):
+        """A tampered cursor is rejected instead of raising a server error"""
+        response = self.client.get('/api/jobs/?cursor=not-a-cursor')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
@@ -0,0 +1,113 @@
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+from follows.models import Follow
+from profiles.models import CompanyProfile
+from .models import JobPost, JobApplication
+
+User = get_user_model()
+
+
+class JobListQueryCountTestCase(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.company = User.objects.create_user(
+            email='company@test.com',
+            password='testpass123',
+            first_name='TechCorp',
+            job_role='Company'
+        )
+        self.employee = User.objects.create_user(
+            email='employee@test.com',
+            password='testpass123',
+            first_name='John',
+            job_role='Employee'
+        )
+        self.client.force_authenticate(user=self.employee)
+
+    def _create_jobs(self, count):
+        return [
+            JobPost.objects.create(
+                title=f'Job {i}',
+                description='Test Description',
+                company_name='TechCorp',
+                publisher=self.company
+            )
+            for i in range(count)
+        ]
+
+    def _count_queries(self, url):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return len(queries), response
+
+    def test_user_flags_do_not_scale_with_page_size(self):
+        """has_applied/is_following_company cost the same for 2 or 10 jobs"""
+        self._create_jobs(2)
+        small, _ = self._count_queries('/api/jobs/')
+
+        self._create_jobs(8)
+        large, _ = self._count_queries('/api/jobs/')
+        self.assertEqual(small, large)
+
+    def test_user_flags_values(self):
+        """Batched flags match the user's applications and follows"""
+        applied, other = self._create_jobs(2)
+        JobApplication.objects.create(
+            job=applied,
+            applicant=self.employee,
+            applicant_name='John',
+            applicant_email='employee@test.com',
+            resume='resumes/test.pdf'
+        )
+        Follow.objects.create(follower=self.employee, following=self.company)
+
+        _, response = self._count_queries('/api/jobs/')
+        flags = {job['id']: (job['has_applied'], job['is_following_company']) for job in response.data['results']}
+        self.assertEqual(flags[applied.id], (True, True))
+        self.assertEqual(flags[other.id], (False, True))
+
+
+class PublisherDisplayTestCase(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.company = User.objects.create_user(
+            email='company@test.com',
+            password='testpass123',
+            first_name='TechCorp',
+            job_role='Company'
+        )
+        self.job = JobPost.objects.create(
+            title='Job',
+            description='Test Description',
+            publisher=self.company
+        )
+
+    def _list(self):
+        response = self.client.get('/api/jobs/')
+        self.assertEqual(response.status_code, 200)
+        return response.data['results'][0]
+
+    def test_profile_change_refreshes_jobs(self):
+        self.assertEqual(self._list()['company_name'], 'TechCorp')
+
+        profile = CompanyProfile.objects.create(user=self.company, company_name='TechCorp Ltd', company_logo='company_logos/logo.png')
+        job = self._list()
+        self.assertEqual(job['company_name'], 'TechCorp Ltd')
+        self.assertTrue(job['publisher_profile_img'].endswith('company_logos/logo.png'))
+
+        self.company.first_name = 'Renamed'
+        self.company.save()
+        self.assertEqual(self._list()['publisher_name'], 'Renamed')
+
+        profile.delete()
+        self.assertEqual(self._list()['company_name'], 'Renamed')
+
+    def test_list_does_not_query_profiles(self):
+        CompanyProfile.objects.create(user=self.company, company_name='TechCorp Ltd')
+        with CaptureQueriesContext(connection) as queries:
+            self._list()
+        self.assertFalse([q for q in queries.captured_queries if 'profiles_' in q['sql']])
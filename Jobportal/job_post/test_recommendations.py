@@ -0,0 +1,81 @@
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+from rest_framework import status
+from profiles.models import UserProfile
+from .models import JobPost
+from .recommendations import SkillIndex
+
+User = get_user_model()
+
+
+class SkillIndexTestCase(TestCase):
+    def test_rare_skills_and_short_skill_lists_rank_higher(self):
+        index = SkillIndex()
+        index.add(1, ['python', 'django'])
+        index.add(2, ['python', 'django', 'docker', 'aws'])
+        index.add(3, ['python'])
+        index.add(4, ['python', 'react'])
+
+        ranked = [job_id for job_id, _ in index.query(['django', 'python'])]
+        self.assertEqual(ranked[0], 1)
+        self.assertEqual(set(ranked), {1, 2, 3, 4})
+
+    def test_replace_and_remove(self):
+        index = SkillIndex()
+        index.add(1, ['python'])
+        index.add(1, ['golang'])
+        self.assertEqual(index.query(['python']), [])
+        self.assertEqual([job_id for job_id, _ in index.query(['golang'])], [1])
+
+        index.remove(1)
+        self.assertEqual(index.query(['golang']), [])
+
+
+class JobRecommendationsViewTestCase(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.employer = User.objects.create_user(
+            email='employer@test.com',
+            password='testpass123',
+            first_name='Jane',
+            job_role='Employer'
+        )
+        self.employee = User.objects.create_user(
+            email='employee@test.com',
+            password='testpass123',
+            first_name='John',
+            job_role='Employee'
+        )
+        self.client.force_authenticate(user=self.employee)
+
+    def _create_job(self, title, skills, **fields):
+        return JobPost.objects.create(
+            title=title,
+            description='Test Description',
+            skills=skills,
+            publisher=self.employer,
+            **fields
+        )
+
+    def test_recommendations_follow_profile_skills(self):
+        UserProfile.objects.create(user=self.employee, skills=['Python', 'Django'])
+        backend = self._create_job('Backend', ['python', 'django'])
+        scripting = self._create_job('Scripting', ['python', 'bash'])
+        self._create_job('Design', ['figma'])
+        self._create_job('Inactive', ['python', 'django'], is_active=False)
+
+        response = self.client.get('/api/jobs/recommended/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([job['id'] for job in response.data['results']], [backend.id, scripting.id])
+        self.assertEqual(response.data['results'][0]['matched_skills'], ['python', 'django'])
+
+        # Later saves are reflected without a rebuild
+        scripting.deactivate()
+        response = self.client.get('/api/jobs/recommended/')
+        self.assertEqual([job['id'] for job in response.data['results']], [backend.id])
+
+    def test_no_profile_skills(self):
+        response = self.client.get('/api/jobs/recommended/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['results'], [])
@@ -0,0 +1,88 @@
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+from rest_framework import status
+from .models import JobPost
+from .salary import parse_salary, EMPTY_RANGE
+
+User = get_user_model()
+
+
+class SalaryParserTestCase(TestCase):
+    def test_common_formats(self):
+        self.assertEqual(parse_salary('5-8 LPA'), (500_000, 800_000, 'INR', 'year'))
+        self.assertEqual(parse_salary('₹30,000/month'), (360_000, 360_000, 'INR', 'month'))
+        self.assertEqual(parse_salary('$50k - $70k'), (50_000, 70_000, 'USD', 'year'))
+        self.assertEqual(parse_salary('Up to 10 lakhs'), (None, 1_000_000, 'INR', 'year'))
+        self.assertEqual(parse_salary('$25/hr'), (52_000, 52_000, 'USD', 'hour'))
+        self.assertEqual(parse_salary('$25 / hr'), (52_000, 52_000, 'USD', 'hour'))
+        self.assertEqual(parse_salary('$40 per hour'), (83_200, 83_200, 'USD', 'hour'))
+        self.assertEqual(parse_salary('30000month'), (360_000, 360_000, None, 'month'))
+        self.assertEqual(parse_salary('₹45,000 / month'), (540_000, 540_000, 'INR', 'month'))
+        self.assertEqual(parse_salary('2 years experience, 5 LPA'), (500_000, 500_000, 'INR', 'year'))
+        self.assertEqual(parse_salary('3-5 yrs exp, 6-9 LPA'), (600_000, 900_000, 'INR', 'year'))
+        self.assertEqual(parse_salary('1.5m'), (1_500_000, 1_500_000, None, 'year'))
+        self.assertEqual(parse_salary('8LPA'), (800_000, 800_000, 'INR', 'year'))
+        self.assertEqual(parse_salary('CTC 12L'), (1_200_000, 1_200_000, 'INR', 'year'))
+        self.assertEqual(parse_salary('€45.000'), (45_000, 45_000, 'EUR', 'year'))
+        self.assertEqual(parse_salary('€1.200.000 per year'), (1_200_000, 1_200_000, 'EUR', 'year'))
+        self.assertEqual(parse_salary('2.500 LPA'), (250_000, 250_000, 'INR', 'year'))
+        self.assertEqual(parse_salary('30k per month for 6 months'), (360_000, 360_000, None, 'month'))
+        self.assertEqual(parse_salary('5 LPA, 6 months probation'), (500_000, 500_000, 'INR', 'year'))
+        self.assertEqual(parse_salary('3 yrs, 9 lakhs'), (900_000, 900_000, 'INR', 'year'))
+
+    def test_unparseable(self):
+        self.assertEqual(parse_salary('Negotiable'), EMPTY_RANGE)
+        self.assertEqual(parse_salary(''), EMPTY_RANGE)
+
+
+class SalaryFilterTestCase(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.employer = User.objects.create_user(
+            email='employer@test.com',
+            password='testpass123',
+            first_name='Jane',
+            job_role='Employer'
+        )
+        self.low = self._create_job('Junior', '3-5 LPA')
+        self.mid = self._create_job('Mid', '6-9 LPA')
+        self.high = self._create_job('Senior', '20 LPA+')
+        self.unknown = self._create_job('Lead', 'Negotiable')
+
+    def _create_job(self, title, salary):
+        return JobPost.objects.create(
+            title=title,
+            description='Test Description',
+            salary=salary,
+            publisher=self.employer
+        )
+
+    def _ids(self, url):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [job['id'] for job in response.data['results']]
+
+    def test_range_saved_on_create(self):
+        self.low.refresh_from_db()
+        self.assertEqual((self.low.salary_min, self.low.salary_max), (300_000, 500_000))
+        self.assertIsNone(self.unknown.salary_min)
+
+    def test_filter_by_overlapping_range(self):
+        self.assertEqual(set(self._ids('/api/jobs/?salary_min=700000')), {self.mid.id, self.high.id})
+        self.assertEqual(set(self._ids('/api/jobs/?salary_max=400000')), {self.low.id})
+        self.assertEqual(set(self._ids('/api/jobs/?salary_min=550000&salary_max=650000')), {self.mid.id})
+
+    def test_order_by_salary_keeps_unparsed_last(self):
+        ids = [self.high.id, self.mid.id, self.low.id, self.unknown.id]
+        self.assertEqual(self._ids('/api/jobs/?ordering=-salary'), ids)
+        self.assertEqual(self._ids('/api/jobs/?ordering=salary'), [self.low.id, self.mid.id, self.high.id, self.unknown.id])
+
+    def test_salary_ordering_paginates(self):
+        """Keyset cursors walk past jobs without a parsed salary"""
+        response = self.client.get('/api/jobs/?ordering=-salary&page_size=3')
+        ids = [job['id'] for job in response.data['results']]
+        response = self.client.get(response.data['next'])
+        ids += [job['id'] for job in response.data['results']]
+        self.assertEqual(ids, [self.high.id, self.mid.id, self.low.id, self.unknown.id])
+        self.assertIsNone(response.data['next'])
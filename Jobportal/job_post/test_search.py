@@ -0,0 +1,97 @@
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+from rest_framework import status
+from .models import JobPost
+
+User = get_user_model()
+
+
+class JobSearchTestCase(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.employer = User.objects.create_user(
+            email='employer@test.com',
+            password='testpass123',
+            first_name='Jane',
+            job_role='Employer'
+        )
+        self.title_match = JobPost.objects.create(
+            title='Python Developer',
+            description='Build internal tools',
+            publisher=self.employer
+        )
+        self.requirement_match = JobPost.objects.create(
+            title='Backend Engineer',
+            description='Own our APIs',
+            requirements=['Python', 'PostgreSQL'],
+            publisher=self.employer
+        )
+        self.description_match = JobPost.objects.create(
+            title='Data Analyst',
+            description='Some Python scripting is a plus',
+            publisher=self.employer
+        )
+        JobPost.objects.create(
+            title='Designer',
+            description='Figma all day',
+            publisher=self.employer
+        )
+
+    def test_search_ranks_by_field_weight(self):
+        """Title matches rank above requirements, which rank above description"""
+        response = self.client.get('/api/jobs/?search=python')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        ids = [job['id'] for job in response.data['results']]
+        self.assertEqual(ids, [self.title_match.id, self.requirement_match.id, self.description_match.id])
+
+    def test_search_vector_refreshed_on_save(self):
+        """Editing a searchable field updates the stored document"""
+        self.title_match.title = 'Golang Developer'
+        self.title_match.save()
+
+        response = self.client.get('/api/jobs/?search=golang')
+        ids = [job['id'] for job in response.data['results']]
+        self.assertEqual(ids, [self.title_match.id])
+
+
+class JobSkillsFilterTestCase(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.employer = User.objects.create_user(
+            email='employer@test.com',
+            password='testpass123',
+            first_name='Jane',
+            job_role='Employer'
+        )
+        self.client.force_authenticate(user=self.employer)
+
+    def _create_job(self, title, requirements):
+        response = self.client.post('/api/jobs/', {
+            'title': title,
+            'description': 'Test Description',
+            'requirements': requirements,
+        }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        return response.data['job_id']
+
+    def _ids(self, url):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return {job['id'] for job in response.data['results']}
+
+    def test_skills_canonicalized_on_write(self):
+        """Requirements are normalized into lowercase, de-duplicated skills"""
+        job_id = self._create_job('Backend', ['Python', ' DJANGO ', 'python'])
+        self.assertEqual(JobPost.objects.get(id=job_id).skills, ['python', 'django'])
+
+    def test_skills_all_and_any(self):
+        """Comma separated skills match all by default, or any with skills_match=any"""
+        both = self._create_job('Backend', ['Python', 'Django'])
+        python_only = self._create_job('Scripting', 'Python')
+        javascript = self._create_job('Frontend', ['JavaScript'])
+
+        self.assertEqual(self._ids('/api/jobs/?skills=django,python'), {both})
+        self.assertEqual(self._ids('/api/jobs/?skills=django,python&skills_match=any'), {both, python_only})
+        # Whole skill names only: java does not match javascript
+        self.assertNotIn(javascript, self._ids('/api/jobs/?skills=java'))
@@ -0,0 +1,87 @@
+from datetime import timedelta
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework import status
+from task_queue.models import Task
+from task_queue.queue import run_due_tasks
+from .models import JobPost, JobApplication, JobDailyStats
+from .stats import record_job_activity
+
+User = get_user_model()
+
+
+class JobStatsTestCase(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.employer = User.objects.create_user(
+            email='employer@test.com',
+            password='testpass123',
+            first_name='Jane',
+            job_role='Employer'
+        )
+        self.employee = User.objects.create_user(
+            email='employee@test.com',
+            password='testpass123',
+            first_name='John',
+            job_role='Employee'
+        )
+        self.job = JobPost.objects.create(title='Backend', description='Test Description', publisher=self.employer)
+        self.other_job = JobPost.objects.create(
+            title='Frontend', description='Test Description', publisher=self.employer, is_active=False
+        )
+
+    def test_activity_is_rolled_up_per_day(self):
+        self.client.force_authenticate(user=self.employee)
+        self.client.get(f'/api/jobs/{self.job.id}/')
+        self.client.get(f'/api/jobs/{self.job.id}/')
+        application = JobApplication.objects.create(
+            job=self.job,
+            applicant=self.employee,
+            applicant_name='John',
+            applicant_email=self.employee.email,
+            resume='resumes/test.pdf'
+        )
+
+        self.client.force_authenticate(user=self.employer)
+        self.client.get(f'/api/jobs/{self.job.id}/')  # the publisher's own views are not counted
+        self.client.patch(f'/api/applications/{application.id}/status/', {'status': 'reviewing'}, format='json')
+        self.client.patch(f'/api/applications/{application.id}/status/', {'status': 'reviewing'}, format='json')
+
+        # Views are queued and added by one task once the batch is due
+        row = JobDailyStats.objects.get(job=self.job, date=timezone.localdate())
+        self.assertEqual((row.applications, row.status_changes, row.views), (1, 1, 0))
+        self.assertEqual(run_due_tasks(), (0, 0))
+        Task.objects.update(run_at=timezone.now())
+        # The first task claimed takes over the unclaimed copy
+        self.assertEqual(run_due_tasks(batch_size=1), (1, 0))
+        row.refresh_from_db()
+        self.assertEqual(row.views, 2)
+
+    def test_stats_with_trend(self):
+        today = timezone.localdate()
+        record_job_activity(self.job.id, day=today - timedelta(days=2), views=3, applications=1)
+        record_job_activity(self.job.id, day=today, views=1)
+        record_job_activity(self.other_job.id, day=today, views=5)
+        record_job_activity(self.job.id, day=today - timedelta(days=40), views=7)
+        JobPost.objects.filter(id=self.job.id).update(application_count=4)
+
+        self.client.force_authenticate(user=self.employer)
+        with self.assertNumQueries(1):
+            response = self.client.get('/api/job-stats/')
+        self.assertEqual(response.data, {'total_jobs': 2, 'active_jobs': 1, 'inactive_jobs': 1, 'total_applications': 4})
+
+        response = self.client.get('/api/job-stats/?days=30')
+        trend = response.data['trend']
+        self.assertEqual(len(trend['series']), 30)
+        self.assertEqual(trend['totals'], {'applications': 1, 'status_changes': 0, 'views': 9})
+        self.assertEqual(trend['series'][-1], {'date': today.isoformat(), 'applications': 0, 'status_changes': 0, 'views': 6})
+
+        response = self.client.get(f'/api/job-stats/?days=90&job_id={self.job.id}')
+        self.assertEqual(response.data['trend']['totals']['views'], 11)
+
+        self.assertEqual(self.client.get('/api/job-stats/?days=45').status_code, status.HTTP_400_BAD_REQUEST)
+        other = JobPost.objects.create(title='Other', description='Test Description', publisher=self.employee)
+        response = self.client.get(f'/api/job-stats/?days=30&job_id={other.id}')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
@@ -1,16 +1,22 @@
 from django.urls import path
 from .views import (
-    JobListCreateView, JobDetailView, JobApplicationView, MyPostedJobsView, 
-    JobApplicantsView, MyAppliedJobsView, UpdateApplicationStatusView, 
+    JobListCreateView, JobImportView, JobFacetsView, JobRecommendationsView, JobDetailView, JobApplicationView, MyPostedJobsView, 
+    JobApplicantsView, JobApplicantsExportView, MyAppliedJobsView, UpdateApplicationStatusView, 
     ApplicationStatusStatsView, UserPermissionsView, JobActivateView, 
-    JobDeactivateView, JobStatsView, ApplicationDetailView, DownloadResumeView
+    JobDeactivateView, JobBulkActionView, JobStatsView, ApplicationDetailView, DownloadResumeView,
+    SavedSearchListCreateView, SavedSearchDetailView, JobAlertListView
 )
 
 urlpatterns = [
     path('jobs/', JobListCreateView.as_view(), name='job-list-create'),
+    path('jobs/import/', JobImportView.as_view(), name='job-import'),
+    path('jobs/bulk/', JobBulkActionView.as_view(), name='job-bulk-action'),
+    path('jobs/facets/', JobFacetsView.as_view(), name='job-facets'),
+    path('jobs/recommended/', JobRecommendationsView.as_view(), name='job-recommendations'),
     path('jobs/<int:pk>/', JobDetailView.as_view(), name='job-detail'),
     path('jobs/<int:job_id>/apply/', JobApplicationView.as_view(), name='job-apply'),
     path('jobs/<int:job_id>/applicants/', JobApplicantsView.as_view(), name='job-applicants'),
+    path('jobs/<int:job_id>/applicants/export/', JobApplicantsExportView.as_view(), name='job-applicants-export'),
     path('jobs/<int:pk>/activate/', JobActivateView.as_view(), name='job-activate'),
     path('jobs/<int:pk>/deactivate/', JobDeactivateView.as_view(), name='job-deactivate'),
     path('applications/<int:pk>/', ApplicationDetailView.as_view(), name='application-detail'),
@@ -21,4 +27,7 @@ urlpatterns = [
     path('job-stats/', JobStatsView.as_view(), name='job-stats'),
     path('application-stats/', ApplicationStatusStatsView.as_view(), name='application-stats'),
     path('user-permissions/', UserPermissionsView.as_view(), name='user-permissions'),
+    path('saved-searches/', SavedSearchListCreateView.as_view(), name='saved-search-list-create'),
+    path('saved-searches/<int:pk>/', SavedSearchDetailView.as_view(), name='saved-search-detail'),
+    path('job-alerts/', JobAlertListView.as_view(), name='job-alerts'),
 ]
\ No newline at end of file
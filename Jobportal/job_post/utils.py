@@ -14,6 +14,17 @@ def convert_to_pdf(file):
     # For now, we'll return the original file (implement conversion as needed)
     return file
 
+def attach_pdf_resume(application):
+    """Store a PDF copy of a DOC/DOCX resume on the application"""
+    import logging
+    try:
+        pdf_resume = convert_to_pdf(application.resume)
+        if pdf_resume != application.resume:
+            application.resume_pdf = pdf_resume
+            application.save(update_fields=['resume_pdf'])
+    except Exception as e:
+        logging.getLogger(__name__).error(f"Failed to convert resume to PDF: {str(e)}")
+
 def get_applicant_name(user):
     """Get applicant name from user or email fallback"""
     if user.first_name and user.last_name:
@@ -24,6 +35,73 @@ def get_applicant_name(user):
         # Use email username as fallback
         return user.email.split('@')[0]
 
+def get_user_job_flags(request, jobs):
+    """Return (applied job ids, followed publisher ids) for `jobs` in two queries"""
+    return get_user_flags_for_ids(
+        request,
+        {job.id for job in jobs},
+        {job.publisher_id for job in jobs},
+    )
+
+def get_user_flags_for_ids(request, job_ids, publisher_ids):
+    """(applied job ids, followed publisher ids) limited to the given ids"""
+    user = getattr(request, 'user', None)
+    if not job_ids or not user or not user.is_authenticated:
+        return set(), set()
+    
+    from follows.models import Follow
+    from .models import JobApplication
+    
+    applied = set(JobApplication.objects.filter(
+        applicant=user, job_id__in=job_ids
+    ).values_list('job_id', flat=True))
+    following = set(Follow.objects.filter(
+        follower=user, following_id__in=publisher_ids
+    ).values_list('following_id', flat=True))
+    return applied, following
+
+def get_job_counters(job_ids):
+    """
+    {job id: (application_count, updated_at)} read live. Applies bump the
+    count without invalidating the shared list cache, so cached pages take
+    both from here.
+    """
+    if not job_ids:
+        return {}
+    from .models import JobPost
+    return {
+        pk: (count, updated_at)
+        for pk, count, updated_at in JobPost.objects.filter(id__in=job_ids).values_list(
+            'id', 'application_count', 'updated_at'
+        )
+    }
+
+def overlay_job_counters(jobs, counters):
+    """Copy of serialized job dicts with live application counts"""
+    return [
+        {**job, 'application_count': counters[job['id']][0]} if job['id'] in counters else job
+        for job in jobs
+    ]
+
+def overlay_user_job_flags(request, jobs):
+    """
+    Copy of serialized public job dicts with the requesting user's
+    has_applied/is_following_company filled in
+    """
+    applied, following = get_user_flags_for_ids(
+        request,
+        {job['id'] for job in jobs},
+        {job['publisher_id'] for job in jobs},
+    )
+    return [
+        {
+            **job,
+            'has_applied': job['id'] in applied,
+            'is_following_company': job['publisher_id'] in following,
+        }
+        for job in jobs
+    ]
+
 def send_application_email(application):
     """Send email notification to job publisher"""
     job = application.job
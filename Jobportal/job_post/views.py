@@ -2,50 +2,55 @@ from rest_framework import generics, status
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticatedOrReadOnly, IsAuthenticated
 from rest_framework.filters import SearchFilter, OrderingFilter
-from django.db.models import Count, Q
-from django.core.mail import send_mail
-from django.conf import settings
+from rest_framework.parsers import MultiPartParser, FormParser
+from django.db import IntegrityError
+from django.db.models import Count, F, Q, Sum
+from django.db.models.functions import Coalesce
 from datetime import timedelta
 from django.utils import timezone
 from django.http import HttpResponse, Http404
+from django.core.cache import cache
 import logging
 import re
 import os
-from .models import JobPost, JobApplication
-from .serializers import JobPostListSerializer, JobPostDetailSerializer, JobApplicationSerializer, ApplicationListSerializer, ApplicantSerializer, ApplicationDetailSerializer
+from .models import JobPost, JobApplication, SavedSearch, JobAlert
+from .serializers import JobPostListSerializer, JobPostDetailSerializer, JobApplicationSerializer, ApplicationListSerializer, ApplicantSerializer, ApplicationDetailSerializer, SavedSearchSerializer, JobAlertSerializer, JobBulkActionSerializer
 from .permissions import IsEmployerOrCompanyOrReadOnly, CanApplyToJob
+from .filters import JobSearchFilter, JobNearFilter, JobOrderingFilter
+from .facets import FACET_FIELDS, compute_job_facets
+from . import list_cache
+from .skills import canonical_skills
+from .utils import get_job_counters, overlay_job_counters, overlay_user_job_flags
+from .recommendations import recommend_job_ids
+from .applicant_ranking import refresh_match_scores
+from .bulk_import import detect_format, import_jobs
+from .lifecycle import transition_jobs
+from .exports import stream_applicants_csv
+from .stats import TREND_DAYS, job_trend, record_job_activity
+from .tasks import queue_job_view
+from .conditional import weak_etag, not_modified, set_validators
 from .validators import RoleValidator, JobAccessControl
 
 logger = logging.getLogger(__name__)
 
-class JobListCreateView(generics.ListCreateAPIView):
-    queryset = JobPost.objects.select_related("publisher").prefetch_related("applications").filter(is_active=True, deleted_at__isnull=True).order_by('-created_at')
-    permission_classes = [IsAuthenticatedOrReadOnly, IsEmployerOrCompanyOrReadOnly]
-    filter_backends = [SearchFilter, OrderingFilter]
-    search_fields = ['title', 'description', 'requirements']
-    ordering_fields = ['created_at', 'title']
-    ordering = ['-created_at']
+class JobFilterMixin:
+    """Query-param filters shared by the job list and its facet counts"""
+    filter_params = ('title', 'location', 'job_type', 'work_mode', 'experience', 'experience_years', 'skills', 'skills_match', 'company', 'salary_min', 'salary_max', 'salary_currency', 'posted_days')
+    # Params whose filters ignore case, so 'Kochi' and 'kochi' share a signature
+    case_insensitive_params = ('title', 'location', 'skills', 'company', 'search', 'near')
     
-    def get_serializer_class(self):
-        if self.request.method == 'GET':
-            return JobPostListSerializer
-        return JobPostDetailSerializer
-    
-    def get_serializer_context(self):
-        context = super().get_serializer_context()
-        context['request'] = self.request
-        return context
-    
-    def get_queryset(self):
-        queryset = super().get_queryset()
-        return self._apply_filters(queryset)
-    
-    def _apply_filters(self, queryset):
+    def _get_params(self):
         try:
-            params = self.request.query_params
+            return self.request.query_params
         except AttributeError:
             # Fallback for non-DRF requests
-            params = getattr(self.request, 'GET', {})
+            return getattr(self.request, 'GET', {})
+    
+    def _apply_filters(self, queryset, exclude=()):
+        """Apply the query-param filters, leaving out the params in `exclude`"""
+        params = self._get_params()
+        if exclude:
+            params = {name: params.get(name) for name in params if name not in exclude}
         
         title = params.get('title')
         if title:
@@ -53,7 +58,7 @@ class JobListCreateView(generics.ListCreateAPIView):
         
         location = params.get('location')
         if location:
-            queryset = queryset.filter(location__icontains=location)
+            queryset = self._filter_by_location(queryset, location)
         
         job_type = params.get('job_type')
         if job_type:
@@ -67,15 +72,26 @@ class JobListCreateView(generics.ListCreateAPIView):
         if experience:
             queryset = queryset.filter(experience=experience)
         
+        experience_years = params.get('experience_years')
+        if experience_years:
+            queryset = self._filter_by_experience_years(queryset, experience_years)
+        
         skills = params.get('skills')
         if skills:
-            queryset = self._filter_by_skills(queryset, skills)
+            queryset = self._filter_by_skills(queryset, skills, params.get('skills_match', 'all'))
         
         company = params.get('company')
         if company:
             queryset = self._filter_by_company(queryset, company)
         
-
+        salary_min = params.get('salary_min')
+        salary_max = params.get('salary_max')
+        if salary_min or salary_max:
+            queryset = self._filter_by_salary(queryset, salary_min, salary_max)
+        
+        salary_currency = params.get('salary_currency')
+        if salary_currency:
+            queryset = queryset.filter(salary_currency=salary_currency.upper())
         
         posted_days = params.get('posted_days')
         if posted_days:
@@ -83,17 +99,64 @@ class JobListCreateView(generics.ListCreateAPIView):
         
         return queryset
     
+    # title, location and company substring filters are served by the
+    # UPPER(col) gin_trgm_ops indexes on JobPost
     def _filter_by_title(self, queryset, title):
         return queryset.filter(title__icontains=title)
     
-    def _filter_by_skills(self, queryset, skills):
-        if skills:
-            return queryset.filter(requirements__icontains=skills)
-        return queryset
+    def _filter_by_location(self, queryset, location):
+        return queryset.filter(location__icontains=location)
+    
+    def _facet_filters(self):
+        """The active job_type/work_mode/experience/location filters as Q objects, by field"""
+        params = self._get_params()
+        filters = {}
+        for field in FACET_FIELDS:
+            value = params.get(field)
+            if value:
+                filters[field] = Q(location__icontains=value) if field == 'location' else Q(**{field: value})
+        return filters
+    
+    def _filter_by_experience_years(self, queryset, years):
+        """Jobs whose parsed experience range includes `years`"""
+        try:
+            years = int(years)
+        except ValueError:
+            return queryset
+        return queryset.filter(
+            Q(experience_max_years__gte=years) | Q(experience_max_years__isnull=True),
+            experience_min_years__lte=years,
+        )
+    
+    def _filter_by_skills(self, queryset, skills, match='all'):
+        """?skills=python,django matches every skill; ?skills_match=any matches one or more"""
+        skills = canonical_skills(skills)
+        if not skills:
+            return queryset
+        if match == 'any':
+            return queryset.filter(skills__has_any_keys=skills)
+        return queryset.filter(skills__contains=skills)
     
     def _filter_by_company(self, queryset, company):
         return queryset.filter(company_name__icontains=company)
     
+    def _filter_by_salary(self, queryset, salary_min, salary_max):
+        """Jobs whose yearly salary range overlaps [salary_min, salary_max]"""
+        try:
+            if salary_min:
+                salary_min = int(salary_min)
+                queryset = queryset.filter(
+                    Q(salary_max__gte=salary_min) | Q(salary_max__isnull=True, salary_min__gte=salary_min)
+                )
+            if salary_max:
+                salary_max = int(salary_max)
+                queryset = queryset.filter(
+                    Q(salary_min__lte=salary_max) | Q(salary_min__isnull=True, salary_max__lte=salary_max)
+                )
+        except ValueError:
+            pass
+        return queryset
+    
     def _filter_by_date(self, queryset, posted_days):
         try:
             days = int(posted_days)
@@ -102,6 +165,118 @@ class JobListCreateView(generics.ListCreateAPIView):
         except ValueError:
             return queryset
     
+    def get_filter_signature(self):
+        """Stable, normalized representation of the active filters"""
+        params = self.request.query_params
+        signature = []
+        for name in self.filter_params + (JobSearchFilter.search_param, JobNearFilter.near_param, JobNearFilter.radius_param):
+            value = params.get(name)
+            if not value:
+                continue
+            if name in self.case_insensitive_params:
+                value = value.lower()
+            if name == JobNearFilter.near_param:
+                # Resolve aliases and near=me to the coordinates actually used
+                value = JobNearFilter().get_origin(self.request)
+            signature.append((name, value))
+        return tuple(signature)
+
+class JobListCreateView(JobFilterMixin, generics.ListCreateAPIView):
+    queryset = JobPost.objects.select_related("publisher").filter(is_active=True, deleted_at__isnull=True).order_by('-created_at')
+    permission_classes = [IsAuthenticatedOrReadOnly, IsEmployerOrCompanyOrReadOnly]
+    filter_backends = [JobOrderingFilter, JobSearchFilter, JobNearFilter]
+    ordering_fields = ['created_at', 'title', 'salary']
+    ordering = ['-created_at']
+    
+    def get_serializer_class(self):
+        if self.request.method == 'GET':
+            return JobPostListSerializer
+        return JobPostDetailSerializer
+    
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context['request'] = self.request
+        if self.request.method == 'GET':
+            # List pages are shared between users; see list()
+            context['public_payload'] = True
+        return context
+    
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        return self._apply_filters(queryset)
+    
+    def get_cache_signature(self):
+        """Filters plus the paging params that change an anonymous response"""
+        params = self.request.query_params
+        paging = tuple(
+            (name, params.get(name))
+            for name in ('ordering', 'cursor', 'page_size')
+            if params.get(name)
+        )
+        return (self.request.get_host(),) + self.get_filter_signature() + paging
+    
+    def list(self, request, *args, **kwargs):
+        # Every user shares the public page; has_applied/is_following_company
+        # are overlaid per request from two id lookups scoped to the page,
+        # and application_count, which every apply changes, from one more
+        cache_key = list_cache.make_key('job-list', self.get_cache_signature())
+        overlay_version = list_cache.get_overlay_version(request.user)
+        authenticated = bool(request.user and request.user.is_authenticated)
+        
+        cached = cache.get(cache_key)
+        if cached is not None:
+            list_cache.record('hit')
+            cache_status = 'HIT'
+            data, page_version = cached['data'], cached['version']
+            counters = get_job_counters([job['id'] for job in data['results']])
+        else:
+            list_cache.record('miss')
+            cache_status = 'MISS'
+            page = self.paginate_queryset(self.filter_queryset(self.get_queryset()))
+            # The page's rows and links identify its content, so validators
+            # agree across processes whatever their cache holds
+            page_version = (
+                [job.id for job in page],
+                self.paginator.get_next_link(),
+                self.paginator.get_previous_link(),
+            )
+            counters = {job.id: (job.application_count, job.updated_at) for job in page}
+            response = not_modified(
+                request,
+                self._list_etag(page_version, counters, overlay_version),
+                None if authenticated else self._last_modified(counters)
+            )
+            if response is not None:
+                return response
+            data = self.get_paginated_response(self.get_serializer(page, many=True).data).data
+            cache.set(cache_key, {'data': data, 'version': page_version}, list_cache.get_timeout())
+        
+        # Last-Modified cannot see overlay changes, so only anonymous
+        # responses carry it
+        etag = self._list_etag(page_version, counters, overlay_version)
+        last_modified = None if authenticated else self._last_modified(counters)
+        response = not_modified(request, etag, last_modified)
+        if response is not None:
+            return response
+        
+        if cached is not None:
+            data = {**data, 'results': overlay_job_counters(data['results'], counters)}
+        if authenticated and data['results']:
+            data = {**data, 'results': overlay_user_job_flags(request, data['results'])}
+        response = Response(data, headers={'X-Cache': cache_status})
+        return set_validators(response, etag, last_modified)
+    
+    def _list_etag(self, page_version, counters, overlay_version):
+        live = sorted((pk, count, updated_at.isoformat()) for pk, (count, updated_at) in counters.items())
+        return weak_etag(page_version, live, overlay_version)
+    
+    def _last_modified(self, counters):
+        # A job deactivated, deleted or expired off the page leaves only older
+        # rows behind, so the list-wide change time bounds it from below
+        page_modified = max((updated_at for _, updated_at in counters.values()), default=None)
+        changed_at = list_cache.get_changed_at()
+        return max(page_modified, changed_at) if page_modified else changed_at
+    
     def create(self, request, *args, **kwargs):
         # Check if user is authenticated
         if not request.user or not request.user.is_authenticated:
@@ -151,6 +326,69 @@ class JobListCreateView(generics.ListCreateAPIView):
             logger.error(f"Database error in perform_create: {str(e)}")
             raise
 
+class JobImportView(generics.GenericAPIView):
+    """Create many jobs from one CSV or JSON Lines upload (multipart field `file`)"""
+    permission_classes = [IsAuthenticated, IsEmployerOrCompanyOrReadOnly]
+    parser_classes = [MultiPartParser, FormParser]
+    serializer_class = JobPostDetailSerializer
+    
+    def post(self, request, *args, **kwargs):
+        upload = request.FILES.get('file')
+        if upload is None:
+            return Response({
+                'error': 'FILE_REQUIRED',
+                'message': 'Upload a CSV or JSON Lines file in the "file" field.'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        
+        file_format = detect_format(upload, request.data.get('format') or request.query_params.get('format'))
+        if file_format is None:
+            return Response({
+                'error': 'UNSUPPORTED_FORMAT',
+                'message': 'Supported formats are csv and jsonl.'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        
+        try:
+            report = import_jobs(upload, file_format, request.user, self.get_serializer_class(), self.get_serializer_context())
+        except Exception as e:
+            logger.error(f"Bulk job import failed for user {request.user.id}: {str(e)}")
+            return Response({
+                'error': 'JOB_IMPORT_FAILED',
+                'message': 'Failed to import jobs. Please try again.'
+            }, status=500)
+        
+        report['message'] = f"{report['created']} jobs imported, {report['failed']} rows failed"
+        if report['file_error']:
+            report['message'] += f". Stopped reading the file: {report['file_error']}"
+        return Response(report, status=status.HTTP_201_CREATED if report['created'] else status.HTTP_400_BAD_REQUEST)
+
+class JobFacetsView(JobFilterMixin, generics.GenericAPIView):
+    """Facet counts (job type, work mode, experience, top locations) for the current filters"""
+    queryset = JobPost.objects.filter(is_active=True, deleted_at__isnull=True)
+    permission_classes = [IsAuthenticatedOrReadOnly]
+    filter_backends = [JobSearchFilter, JobNearFilter]
+    cache_timeout = 60
+    
+    def get_queryset(self):
+        # Facet-field filters are applied per facet, each leaving out its own
+        return self._apply_filters(super().get_queryset(), exclude=FACET_FIELDS)
+    
+    def get(self, request, *args, **kwargs):
+        cache_key = list_cache.make_key('job-facets', self.get_filter_signature())
+        
+        facets = cache.get(cache_key)
+        if facets is None:
+            try:
+                facets = compute_job_facets(self.filter_queryset(self.get_queryset()), self._facet_filters())
+            except Exception as e:
+                logger.error(f"Failed to compute job facets: {str(e)}")
+                return Response({
+                    'error': 'FACETS_RETRIEVAL_FAILED',
+                    'message': 'Failed to retrieve job facets. Please try again.'
+                }, status=500)
+            cache.set(cache_key, facets, self.cache_timeout)
+        
+        return Response(facets)
+
 class JobDetailView(generics.RetrieveUpdateDestroyAPIView):
     queryset = JobPost.objects.select_related("publisher").filter(deleted_at__isnull=True)
     serializer_class = JobPostDetailSerializer
@@ -162,6 +400,24 @@ class JobDetailView(generics.RetrieveUpdateDestroyAPIView):
         context['request'] = self.request
         return context
     
+    def retrieve(self, request, *args, **kwargs):
+        job = self.get_object()
+        # updated_at also moves when the publisher's profile changes
+        # (see job_post.publisher); the overlay version covers has_applied
+        # and is_following_company
+        etag = weak_etag(job.id, job.updated_at.isoformat(), list_cache.get_overlay_version(request.user))
+        last_modified = None if request.user.is_authenticated else job.updated_at
+        response = not_modified(request, etag, last_modified)
+        if response is not None:
+            return response
+        
+        # Revalidations (304) are not counted as views
+        if job.publisher_id != request.user.pk:
+            queue_job_view(job.id)
+        
+        serializer = self.get_serializer(job)
+        return set_validators(Response(serializer.data), etag, last_modified)
+    
     def update(self, request, *args, **kwargs):
         try:
             response = super().update(request, *args, **kwargs)
@@ -198,6 +454,53 @@ class JobDetailView(generics.RetrieveUpdateDestroyAPIView):
                 'message': 'Failed to delete job. Please try again.'
             }, status=500)
 
+class JobRecommendationsView(generics.GenericAPIView):
+    """Active jobs ranked by how well their skills match the user's profile skills"""
+    serializer_class = JobPostListSerializer
+    permission_classes = [IsAuthenticated]
+    default_limit = 20
+    max_limit = 50
+    
+    def get(self, request, *args, **kwargs):
+        from profiles.models import UserProfile
+        profile = UserProfile.objects.filter(user=request.user).first()
+        skills = canonical_skills(profile.skills if profile else [])
+        if not skills:
+            return Response({
+                'message': 'Add skills to your profile to get job recommendations.',
+                'skills': [],
+                'results': []
+            })
+        
+        try:
+            limit = min(max(int(request.query_params.get('limit', self.default_limit)), 1), self.max_limit)
+        except ValueError:
+            limit = self.default_limit
+        
+        applied = set(JobApplication.objects.filter(applicant=request.user).values_list('job_id', flat=True))
+        try:
+            # Over-fetch so the user's own and since-removed jobs can be dropped
+            ranked = recommend_job_ids(skills, k=limit * 2, exclude=applied)
+        except Exception as e:
+            logger.error(f"Failed to compute job recommendations: {str(e)}")
+            return Response({
+                'error': 'RECOMMENDATIONS_FAILED',
+                'message': 'Failed to retrieve job recommendations. Please try again.'
+            }, status=500)
+        
+        jobs = JobPost.objects.select_related('publisher').filter(
+            id__in=[job_id for job_id, _ in ranked], is_active=True, deleted_at__isnull=True
+        ).exclude(publisher=request.user).in_bulk()
+        ordered = [jobs[job_id] for job_id, _ in ranked if job_id in jobs][:limit]
+        
+        scores = dict(ranked)
+        user_skills = set(skills)
+        results = self.get_serializer(ordered, many=True).data
+        for job in results:
+            job['match_score'] = round(scores[job['id']], 4)
+            job['matched_skills'] = [skill for skill in job['skills'] if skill in user_skills]
+        return Response({'skills': skills, 'results': results})
+
 class JobApplicationView(generics.CreateAPIView):
     serializer_class = JobApplicationSerializer
     permission_classes = [IsAuthenticated, CanApplyToJob]
@@ -233,7 +536,7 @@ class JobApplicationView(generics.CreateAPIView):
 
         
         try:
-            job = JobPost.objects.get(id=int(job_id), is_active=True)
+            job = JobPost.objects.select_related('publisher__companyprofile').get(id=int(job_id), is_active=True)
         except JobPost.DoesNotExist:
             return Response({
                 'error': 'JOB_NOT_FOUND',
@@ -253,7 +556,7 @@ class JobApplicationView(generics.CreateAPIView):
             }, status=500)
         
         # Check if user is trying to apply to their own job
-        if job.publisher == request.user:
+        if job.publisher_id == request.user.pk:
             return Response({
                 'error': 'OWN_JOB_APPLICATION',
                 'message': 'You cannot apply to your own job posting',
@@ -261,22 +564,25 @@ class JobApplicationView(generics.CreateAPIView):
                 'job_title': job.title
             }, status=status.HTTP_403_FORBIDDEN)
         
-        # Check if user already applied
-        if JobApplication.objects.filter(job=job, applicant=request.user).exists():
+        serializer = self.get_serializer(data=request.data, context={**self.get_serializer_context(), 'job': job})
+        if not serializer.is_valid():
+            return Response({
+                'error': 'VALIDATION_ERROR',
+                'message': 'Invalid application data provided',
+                'details': serializer.errors
+            }, status=status.HTTP_400_BAD_REQUEST)
+        
+        # No duplicate pre-check: the unique (job, applicant) constraint
+        # decides, so concurrent submissions cannot both succeed
+        try:
+            serializer.save(job=job)
+        except IntegrityError:
             return Response({
                 'error': 'ALREADY_APPLIED',
                 'message': 'You have already applied to this job',
                 'job_id': job_id,
                 'job_title': job.title
             }, status=status.HTTP_400_BAD_REQUEST)
-        
-        # Add job to request data
-        data = request.data.copy()
-        data['job'] = job_id
-        request._full_data = data
-        
-        try:
-            response = super().create(request, *args, **kwargs)
         except Exception as e:
             logger.error(f"Application creation failed: {str(e)}")
             return Response({
@@ -284,43 +590,7 @@ class JobApplicationView(generics.CreateAPIView):
                 'message': 'Failed to submit application. Please try again.'
             }, status=500)
         
-        # Send email notification to job provider
-        self._send_application_notification(job, request.user)
-        
         return Response({'message': 'Application submitted successfully'}, status=201)
-        
-    def _send_application_notification(self, job, applicant):
-        """Send email notification to job provider about new application"""
-        try:
-            provider_email = self._get_provider_email(job.publisher)
-            message = self._build_notification_message(job, applicant)
-            send_mail(
-                subject=f'New Application for {job.title}',
-                message=message,
-                from_email=settings.DEFAULT_FROM_EMAIL,
-                recipient_list=[provider_email],
-                fail_silently=True,
-            )
-        except Exception as e:
-            logger.error(f"Failed to send application notification email: {str(e)}")
-    
-    def _get_provider_email(self, publisher):
-        """Get email address for job provider"""
-        if publisher.job_role == 'Company':
-            try:
-                return publisher.companyprofile.company_email
-            except AttributeError:
-                return publisher.email
-        return publisher.email
-    
-    def _build_notification_message(self, job, applicant):
-        """Build email notification message"""
-        return (f'Hello,\n\n'
-                f'You have received a new application for your job posting "{job.title}".\n\n'
-                f'Applicant: {applicant.first_name} {applicant.last_name}\n'
-                f'Email: {applicant.email}\n\n'
-                f'Please log in to your account to review the application.\n\n'
-                f'Best regards,\nJob Portal Team')
 
 class MyPostedJobsView(generics.ListAPIView):
     serializer_class = JobPostListSerializer
@@ -359,6 +629,15 @@ class JobApplicantsView(generics.ListAPIView):
         
         queryset = JobApplication.objects.filter(job=job).select_related('applicant').order_by('-applied_at')
         
+        # ?ordering=match ranks by stored match scores, scoring new or stale rows first
+        if self.request.query_params.get('ordering') == 'match':
+            try:
+                refresh_match_scores(job)
+            except Exception as e:
+                # Unscored applicants still list, after the scored ones
+                logger.error(f"Error scoring applicants for job {job.id}: {str(e)}")
+            queryset = queryset.order_by(F('match_score').desc(nulls_last=True), '-id')
+        
         # Filter by status if provided
         filter_status = self.request.query_params.get('status')
         if filter_status and filter_status != 'all':
@@ -392,11 +671,14 @@ class JobApplicantsView(generics.ListAPIView):
                 'applicants': []
             })
         
+        page = self.paginate_queryset(queryset)
         try:
-            serializer = self.get_serializer(queryset, many=True)
+            serializer = self.get_serializer(page, many=True)
             return Response({
                 'message': f'{count} applicants found',
-                'applicants': serializer.data
+                'applicants': serializer.data,
+                'next': self.paginator.get_next_link(),
+                'previous': self.paginator.get_previous_link()
             })
         except Exception as e:
             logger.error(f"Serialization error in JobApplicantsView: {str(e)}")
@@ -405,6 +687,22 @@ class JobApplicantsView(generics.ListAPIView):
                 'message': 'Failed to retrieve applicants data'
             }, status=500)
 
+class JobApplicantsExportView(generics.GenericAPIView):
+    """Download all applicants of a job as CSV, streamed as rows are read"""
+    permission_classes = [IsAuthenticated]
+    
+    def get(self, request, job_id, *args, **kwargs):
+        job = JobPost.objects.filter(id=job_id, publisher=request.user).first()
+        if job is None:
+            return Response({'message': 'Job not found'}, status=404)
+        
+        queryset = JobApplication.objects.filter(job=job).order_by('-applied_at', '-id')
+        filter_status = request.query_params.get('status')
+        if filter_status and filter_status != 'all':
+            queryset = queryset.filter(status=filter_status)
+        
+        return stream_applicants_csv(queryset, request, f'job-{job.id}-applicants.csv')
+
 class MyAppliedJobsView(generics.ListAPIView):
     serializer_class = ApplicationListSerializer
     permission_classes = [IsAuthenticated]
@@ -467,11 +765,14 @@ class MyAppliedJobsView(generics.ListAPIView):
                 'results': []
             })
         
+        page = self.paginate_queryset(queryset)
         try:
-            serializer = self.get_serializer(queryset, many=True)
+            serializer = self.get_serializer(page, many=True)
             return Response({
                 'message': f'{count} applications found',
-                'results': serializer.data
+                'results': serializer.data,
+                'next': self.paginator.get_next_link(),
+                'previous': self.paginator.get_previous_link()
             })
         except Exception as e:
             logger.error(f"Serialization error in MyAppliedJobsView: {str(e)}")
@@ -503,8 +804,11 @@ class UpdateApplicationStatusView(generics.UpdateAPIView):
             return Response({'message': 'Invalid status'}, status=400)
         
         try:
+            changed = application.status != new_status
             application.status = new_status
             application.save()
+            if changed:
+                record_job_activity(application.job_id, status_changes=1)
             return Response({
                 'message': 'Application status updated successfully',
                 'status': new_status
@@ -577,6 +881,38 @@ class JobDeactivateView(generics.UpdateAPIView):
         job.deactivate()
         return Response({'message': 'Job deactivated successfully'})
 
+class JobBulkActionView(generics.GenericAPIView):
+    """Activate, deactivate or delete many of the user's jobs at once"""
+    serializer_class = JobBulkActionSerializer
+    permission_classes = [IsAuthenticated, IsEmployerOrCompanyOrReadOnly]
+    
+    def post(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        if not serializer.is_valid():
+            return Response({
+                'error': 'VALIDATION_ERROR',
+                'message': 'Invalid bulk action',
+                'details': serializer.errors
+            }, status=status.HTTP_400_BAD_REQUEST)
+        
+        action = serializer.validated_data['action']
+        try:
+            results = transition_jobs(request.user, serializer.validated_data['job_ids'], action)
+        except Exception as e:
+            logger.error(f"Bulk job {action} failed for user {request.user.id}: {str(e)}")
+            return Response({
+                'error': 'BULK_ACTION_FAILED',
+                'message': 'Failed to update jobs. Please try again.'
+            }, status=500)
+        
+        updated = sum(1 for _, result in results if result != 'not_found')
+        return Response({
+            'message': f'{updated} of {len(results)} jobs updated',
+            'action': action,
+            'updated': updated,
+            'results': [{'id': job_id, 'result': result} for job_id, result in results]
+        })
+
 class JobStatsView(generics.GenericAPIView):
     """Job statistics dashboard"""
     permission_classes = [IsAuthenticated]
@@ -590,12 +926,28 @@ class JobStatsView(generics.GenericAPIView):
         
         user_jobs = JobPost.objects.filter(publisher=user, deleted_at__isnull=True)
         
-        stats = {
-            'total_jobs': user_jobs.count(),
-            'active_jobs': user_jobs.filter(is_active=True).count(),
-            'inactive_jobs': user_jobs.filter(is_active=False).count(),
-            'total_applications': sum(job.application_count for job in user_jobs)
-        }
+        stats = user_jobs.aggregate(
+            total_jobs=Count('id'),
+            active_jobs=Count('id', filter=Q(is_active=True)),
+            inactive_jobs=Count('id', filter=Q(is_active=False)),
+            total_applications=Coalesce(Sum('application_count'), 0),
+        )
+        
+        # ?days=7|30|90 adds a daily trend, for all jobs or one ?job_id=
+        days = request.query_params.get('days')
+        if days is not None:
+            if days not in [str(choice) for choice in TREND_DAYS]:
+                return Response({
+                    'error': 'INVALID_DAYS',
+                    'message': f"days must be one of {', '.join(str(choice) for choice in TREND_DAYS)}"
+                }, status=400)
+            jobs = user_jobs
+            job_id = request.query_params.get('job_id')
+            if job_id is not None:
+                jobs = user_jobs.filter(id=job_id) if job_id.isdigit() else JobPost.objects.none()
+                if not jobs.exists():
+                    return Response({'message': 'Job not found'}, status=404)
+            stats['trend'] = job_trend(jobs, int(days))
         
         return Response(stats)
 
@@ -674,3 +1026,32 @@ class DownloadResumeView(generics.GenericAPIView):
             logger.error(f"Error downloading resume: {str(e)}")
             return Response({'error': 'Failed to download resume'}, status=500)
 
+class SavedSearchListCreateView(generics.ListCreateAPIView):
+    """Save a job list query (same params as /api/jobs/) to be alerted on"""
+    serializer_class = SavedSearchSerializer
+    permission_classes = [IsAuthenticated]
+    
+    def get_queryset(self):
+        return SavedSearch.objects.filter(user=self.request.user).order_by('-created_at')
+    
+    def perform_create(self, serializer):
+        serializer.save(user=self.request.user)
+
+class SavedSearchDetailView(generics.RetrieveUpdateDestroyAPIView):
+    serializer_class = SavedSearchSerializer
+    permission_classes = [IsAuthenticated]
+    lookup_field = 'pk'
+    
+    def get_queryset(self):
+        return SavedSearch.objects.filter(user=self.request.user)
+
+class JobAlertListView(generics.ListAPIView):
+    """Queued job alert digest entries; ?unsent=true for undelivered only"""
+    serializer_class = JobAlertSerializer
+    permission_classes = [IsAuthenticated]
+    
+    def get_queryset(self):
+        queryset = JobAlert.objects.filter(user=self.request.user).select_related('job', 'saved_search').order_by('-created_at')
+        if self.request.query_params.get('unsent') == 'true':
+            queryset = queryset.filter(sent_at__isnull=True)
+        return queryset
@@ -0,0 +1,8 @@
+from django.contrib import admin
+from .models import OutboxEmail
+
+@admin.register(OutboxEmail)
+class OutboxEmailAdmin(admin.ModelAdmin):
+    list_display = ("subject", "created_at", "attempts", "sent_at", "failed_at")
+    list_filter = ("sent_at", "failed_at")
+    search_fields = ("subject", "to", "last_error")
@@ -0,0 +1,165 @@
+"""
+Transactional email outbox.
+
+queue_mail() writes an OutboxEmail row instead of talking to SMTP, so an
+email is stored (or rolled back) together with the change that triggered
+it and requests never wait on the mail server. The `send_outbox` command
+drains pending rows in batches over one reused SMTP connection.
+
+Senders claim rows with SELECT ... FOR UPDATE SKIP LOCKED and a lease, as
+task_queue workers do, so several senders never deliver the same email.
+Failed deliveries are retried with backoff until MAX_ATTEMPTS, after which
+the row is marked failed and kept for inspection.
+"""
+import logging
+import smtplib
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.db import transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from task_queue.queue import backoff_seconds
+from .models import OutboxEmail
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 100
+MAX_ATTEMPTS = 5
+LEASE_SECONDS = 5 * 60
+
+# Errors after which smtplib has reset the session and it can keep going
+_MESSAGE_ERRORS = (smtplib.SMTPRecipientsRefused, smtplib.SMTPSenderRefused, smtplib.SMTPDataError)
+
+
+def queue_mail(subject, message, recipient_list, from_email=None):
+    """Drop-in for send_mail(): store the email for the sender process"""
+    return OutboxEmail.objects.create(
+        subject=subject,
+        body=message,
+        from_email=from_email or settings.DEFAULT_FROM_EMAIL,
+        to=list(recipient_list),
+    )
+
+
+def _due(emails=None):
+    now = timezone.now()
+    emails = OutboxEmail.objects.all() if emails is None else emails
+    return emails.filter(
+        sent_at__isnull=True, failed_at__isnull=True, send_after__lte=now
+    ).filter(Q(locked_until__isnull=True) | Q(locked_until__lt=now))
+
+
+def pending(emails=None):
+    """Emails due for delivery, optionally only those in the `emails` queryset"""
+    return _due(emails).filter(attempts__lt=MAX_ATTEMPTS)
+
+
+def claim(limit=DEFAULT_BATCH_SIZE, emails=None):
+    """
+    Lease up to `limit` pending emails, skipping rows another sender holds.
+    Emails whose sender died on their last attempt are marked failed here
+    rather than sent again.
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        exhausted = _due(emails).filter(attempts__gte=MAX_ATTEMPTS).select_for_update(skip_locked=True)
+        exhausted_ids = list(exhausted.values_list('id', flat=True)[:limit])
+        if exhausted_ids:
+            logger.error(f"Outbox emails {exhausted_ids} lost their sender on the last attempt")
+            OutboxEmail.objects.filter(id__in=exhausted_ids).update(
+                failed_at=now, locked_until=None,
+                last_error='Sender stopped or lease expired before the email was sent',
+            )
+
+        emails = list(pending(emails).order_by('send_after', 'id').select_for_update(skip_locked=True)[:limit])
+        if emails:
+            OutboxEmail.objects.filter(id__in=[email.id for email in emails]).update(
+                locked_until=now + timedelta(seconds=LEASE_SECONDS), attempts=F('attempts') + 1
+            )
+            for email in emails:
+                email.attempts += 1
+    return emails
+
+
+def send_batch(connection, limit=DEFAULT_BATCH_SIZE, emails=None):
+    """
+    Claim and deliver one batch over `connection`, which is opened if needed
+    and left open for the next batch. Returns (sent, failed).
+    """
+    emails = claim(limit, emails)
+    sent_ids = []
+    for email in emails:
+        message = EmailMessage(email.subject, email.body, email.from_email, email.to, connection=connection)
+        try:
+            # No-op while the connection is up, so send_messages() keeps it open
+            connection.open()
+            connection.send_messages([message])
+        except Exception as e:
+            logger.error(f"Failed to send outbox email {email.id} (attempt {email.attempts}): {str(e)}")
+            _record_failure(email, e)
+            if not isinstance(e, _MESSAGE_ERRORS):
+                # Reconnect for the rest of the batch
+                connection.close()
+        else:
+            sent_ids.append(email.id)
+
+    if sent_ids:
+        OutboxEmail.objects.filter(id__in=sent_ids).update(
+            sent_at=timezone.now(), locked_until=None, last_error=''
+        )
+    return len(sent_ids), len(emails) - len(sent_ids)
+
+
+def _record_failure(email, error):
+    changes = {'locked_until': None, 'last_error': str(error)}
+    if email.attempts >= MAX_ATTEMPTS:
+        changes['failed_at'] = timezone.now()
+    else:
+        changes['send_after'] = timezone.now() + timedelta(seconds=backoff_seconds(email.attempts))
+    OutboxEmail.objects.filter(id=email.id).update(**changes)
+
+
+def drain(batch_size=DEFAULT_BATCH_SIZE, limit=None, connection=None, emails=None):
+    """
+    Send pending emails until none are left (or `limit` were tried) over one
+    SMTP connection. Returns throughput metrics.
+    """
+    connection = connection or get_connection(fail_silently=False)
+    stats = {'sent': 0, 'failed': 0, 'batches': 0}
+    started = time.perf_counter()
+    try:
+        while limit is None or stats['sent'] + stats['failed'] < limit:
+            size = batch_size if limit is None else min(batch_size, limit - stats['sent'] - stats['failed'])
+            sent, failed = send_batch(connection, size, emails)
+            if not sent and not failed:
+                break
+            stats['sent'] += sent
+            stats['failed'] += failed
+            stats['batches'] += 1
+    finally:
+        connection.close()
+    stats['seconds'] = time.perf_counter() - started
+    stats['per_second'] = stats['sent'] / stats['seconds'] if stats['seconds'] else 0.0
+    return stats
+
+
+def outbox_stats():
+    """Backlog size and the age of the oldest pending email"""
+    now = timezone.now()
+    unsent = OutboxEmail.objects.filter(sent_at__isnull=True, failed_at__isnull=True)
+    oldest = unsent.order_by('created_at').values_list('created_at', flat=True).first()
+    return {
+        'pending': unsent.count(),
+        'failed': OutboxEmail.objects.filter(failed_at__isnull=False).count(),
+        'max_lag_seconds': (now - oldest).total_seconds() if oldest else 0.0,
+    }
+
+
+def purge_sent(older_than):
+    """Delete emails sent before `older_than`; returns the number deleted"""
+    deleted, _ = OutboxEmail.objects.filter(sent_at__lt=older_than).delete()
+    return deleted
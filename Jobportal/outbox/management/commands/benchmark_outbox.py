@@ -0,0 +1,62 @@
+import time
+import uuid
+
+from django.core.mail import send_mail
+from django.core.management.base import BaseCommand, CommandError
+from django.test import override_settings
+
+from outbox.mail import drain, queue_mail
+from outbox.models import OutboxEmail
+from outbox.testing import LocalSMTPServer
+
+
+class Command(BaseCommand):
+    help = ('Compare sending emails with one SMTP connection each (send_mail) '
+            'against draining the outbox over one connection, using a local SMTP '
+            'stand-in. Benchmark emails are deleted afterwards.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--emails', type=int, default=200)
+        parser.add_argument('--batch-size', type=int, default=100)
+        parser.add_argument('--connect-ms', type=float, default=50.0,
+                            help='Simulated connection setup time of the SMTP server')
+        parser.add_argument('--min-speedup', type=float, default=5.0)
+
+    def handle(self, *args, **options):
+        token = uuid.uuid4().hex[:8]
+        recipients = [f'benchmark-{token}-{i}@example.com' for i in range(options['emails'])]
+
+        with LocalSMTPServer(connect_delay=options['connect_ms'] / 1000) as server, \
+                override_settings(**server.email_settings()):
+            started = time.perf_counter()
+            for recipient in recipients:
+                send_mail('Benchmark', 'Benchmark email', None, [recipient])
+            direct_seconds = time.perf_counter() - started
+            direct_connections = server.connections
+
+            # Only the benchmark's own emails go to the stand-in
+            emails = OutboxEmail.objects.filter(to__in=[[recipient] for recipient in recipients])
+            try:
+                for recipient in recipients:
+                    queue_mail('Benchmark', 'Benchmark email', [recipient])
+                stats = drain(batch_size=options['batch_size'], emails=emails)
+                sent = emails.filter(sent_at__isnull=False).count()
+            finally:
+                emails.delete()
+
+        direct_rate = len(recipients) / direct_seconds
+        speedup = stats['per_second'] / direct_rate
+        self.stdout.write(
+            f"send_mail: {len(recipients)} emails in {direct_seconds:.2f}s ({direct_rate:.1f}/s) "
+            f"over {direct_connections} connections"
+        )
+        self.stdout.write(
+            f"outbox: {stats['sent']} emails in {stats['seconds']:.2f}s ({stats['per_second']:.1f}/s) "
+            f"in {stats['batches']} batches over {server.connections - direct_connections} connection(s), "
+            f"{speedup:.1f}x"
+        )
+        if sent != len(recipients) or stats['failed']:
+            raise CommandError(f"Expected {len(recipients)} sent, got {sent} ({stats['failed']} failed)")
+        if speedup < options['min_speedup']:
+            raise CommandError(f"Speedup of {speedup:.1f}x is below the minimum of {options['min_speedup']:.1f}x")
+        self.stdout.write(self.style.SUCCESS('Outbox delivery within budget'))
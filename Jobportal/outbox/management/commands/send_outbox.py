@@ -0,0 +1,51 @@
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from outbox.mail import DEFAULT_BATCH_SIZE, drain, outbox_stats, purge_sent
+
+
+class Command(BaseCommand):
+    help = ('Send pending outbox emails in batches over one SMTP connection and '
+            'report throughput. Safe to run on several workers.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE)
+        parser.add_argument('--loop', action='store_true', help='Keep running every --interval seconds')
+        parser.add_argument('--interval', type=float, default=5.0)
+        parser.add_argument('--purge-sent-days', type=int,
+                            help='Also delete emails sent more than this many days ago')
+        parser.add_argument('--stats', action='store_true', help='Only report the backlog')
+
+    def handle(self, *args, **options):
+        if options['stats']:
+            self._report_backlog()
+            return
+
+        while True:
+            stats = drain(batch_size=options['batch_size'])
+            if stats['sent'] or stats['failed']:
+                self.stdout.write(self.style.SUCCESS(
+                    f"Sent {stats['sent']} emails, {stats['failed']} failed, in {stats['batches']} batches "
+                    f"over {stats['seconds']:.2f}s ({stats['per_second']:.1f}/s)"
+                ))
+            if options['purge_sent_days'] is not None:
+                purged = purge_sent(timezone.now() - timedelta(days=options['purge_sent_days']))
+                if purged:
+                    self.stdout.write(f'Purged {purged} sent emails')
+            if not options['loop']:
+                self._report_backlog()
+                return
+            try:
+                time.sleep(options['interval'])
+            except KeyboardInterrupt:
+                return
+
+    def _report_backlog(self):
+        backlog = outbox_stats()
+        self.stdout.write(
+            f"backlog pending={backlog['pending']} failed={backlog['failed']} "
+            f"max_lag_seconds={backlog['max_lag_seconds']:.0f}"
+        )
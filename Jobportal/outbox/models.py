@@ -0,0 +1,32 @@
+from django.db import models
+from django.utils import timezone
+
+
+class OutboxEmail(models.Model):
+    """An email written with the change that triggered it and sent by `send_outbox`"""
+    subject = models.CharField(max_length=255)
+    body = models.TextField()
+    from_email = models.CharField(max_length=254)
+    to = models.JSONField(default=list)
+    created_at = models.DateTimeField(default=timezone.now)
+    send_after = models.DateTimeField(default=timezone.now)  # pushed back on retries
+    attempts = models.PositiveSmallIntegerField(default=0)
+    # Lease held by the sender delivering the email
+    locked_until = models.DateTimeField(null=True, blank=True)
+    last_error = models.TextField(blank=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+    failed_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            # Pending scan of the sender; sent and failed rows drop out
+            models.Index(
+                fields=['send_after', 'id'],
+                condition=models.Q(sent_at__isnull=True, failed_at__isnull=True),
+                name='outbox_pending_idx',
+            ),
+            models.Index(fields=['sent_at'], condition=models.Q(sent_at__isnull=False), name='outbox_sent_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.subject} to {', '.join(self.to)}"
@@ -0,0 +1,113 @@
+from datetime import timedelta
+from email import message_from_bytes
+
+from django.core import mail
+from django.db import transaction
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from accounts.models import User
+
+from .mail import MAX_ATTEMPTS, claim, drain, outbox_stats, purge_sent, queue_mail
+from .models import OutboxEmail
+from .testing import LocalSMTPServer
+
+
+class OutboxTestCase(TestCase):
+    def test_queued_email_rolls_back_with_its_transaction(self):
+        try:
+            with transaction.atomic():
+                queue_mail('Hello', 'Body', ['a@test.com'])
+                raise RuntimeError
+        except RuntimeError:
+            pass
+        self.assertFalse(OutboxEmail.objects.exists())
+
+    def test_batches_share_one_smtp_connection(self):
+        for i in range(25):
+            queue_mail(f'Hello {i}', 'Body', [f'user{i}@test.com'])
+
+        with LocalSMTPServer() as server, override_settings(**server.email_settings()):
+            stats = drain(batch_size=10)
+
+        self.assertEqual((stats['sent'], stats['failed'], stats['batches']), (25, 0, 3))
+        self.assertEqual(server.connections, 1)
+        self.assertEqual(len(server.messages), 25)
+        first = message_from_bytes(server.messages[0]['data'])
+        self.assertEqual((first['Subject'], server.messages[0]['to']), ('Hello 0', ['user0@test.com']))
+        self.assertFalse(OutboxEmail.objects.filter(sent_at__isnull=True).exists())
+        self.assertEqual(outbox_stats()['pending'], 0)
+
+    def test_refused_recipient_is_retried_then_failed(self):
+        queue_mail('Hello', 'Body', ['ok@test.com'])
+        queue_mail('Hello', 'Body', ['bounce@test.com'])
+
+        with LocalSMTPServer(reject=['bounce@test.com']) as server, override_settings(**server.email_settings()):
+            stats = drain()
+            self.assertEqual((stats['sent'], stats['failed']), (1, 1))
+            # The session survives a refused recipient
+            self.assertEqual(server.connections, 1)
+            retry = OutboxEmail.objects.get(to=['bounce@test.com'])
+            self.assertGreater(retry.send_after, timezone.now())
+            self.assertIn('bounce@test.com', retry.last_error)
+            # Not due again until its backoff has passed
+            self.assertEqual(drain()['failed'], 0)
+
+            for _ in range(MAX_ATTEMPTS - 1):
+                OutboxEmail.objects.filter(id=retry.id).update(send_after=timezone.now())
+                drain()
+
+        retry.refresh_from_db()
+        self.assertEqual(retry.attempts, MAX_ATTEMPTS)
+        self.assertIsNotNone(retry.failed_at)
+        self.assertEqual(outbox_stats()['failed'], 1)
+
+    def test_email_whose_sender_dies_is_not_sent_forever(self):
+        email = queue_mail('Hello', 'Body', ['a@test.com'])
+        # Each claim's sender dies before recording the outcome
+        for attempt in range(1, MAX_ATTEMPTS + 1):
+            [claimed] = claim()
+            self.assertEqual(claimed.attempts, attempt)
+            OutboxEmail.objects.update(locked_until=timezone.now() - timedelta(seconds=1))
+
+        self.assertEqual(claim(), [])
+        self.assertEqual(drain()['sent'], 0)
+        self.assertEqual(len(mail.outbox), 0)
+        email.refresh_from_db()
+        self.assertIsNotNone(email.failed_at)
+        self.assertIn('lease expired', email.last_error)
+
+    def test_unreachable_server_leaves_email_pending(self):
+        queue_mail('Hello', 'Body', ['a@test.com'])
+        with LocalSMTPServer() as server:
+            unreachable = server.email_settings()
+        with override_settings(**unreachable):
+            stats = drain()
+        self.assertEqual(stats['failed'], 1)
+        email = OutboxEmail.objects.get()
+        self.assertIsNone(email.sent_at)
+        self.assertIsNone(email.failed_at)
+
+    def test_purge_sent(self):
+        queue_mail('Hello', 'Body', ['a@test.com'])
+        drain()
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(purge_sent(timezone.now() - timedelta(days=1)), 0)
+        self.assertEqual(purge_sent(timezone.now() + timedelta(seconds=1)), 1)
+
+
+class RegisterOutboxTestCase(TestCase):
+    def test_register_queues_otp_email(self):
+        response = self.client.post('/accounts/register/', {
+            'first_name': 'Ann',
+            'email': 'ann@test.com',
+            'password': 'Str0ng-pass!',
+            'confirm_password': 'Str0ng-pass!',
+            'job_role': 'Employee',
+        })
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(len(mail.outbox), 0)
+
+        email = OutboxEmail.objects.get()
+        self.assertEqual(email.to, ['ann@test.com'])
+        self.assertIn(User.objects.get(email='ann@test.com').otp, email.body)
@@ -0,0 +1,106 @@
+"""
+A local SMTP stand-in for tests and benchmarks.
+
+    with LocalSMTPServer() as server:
+        with override_settings(**server.email_settings()):
+            drain()
+        server.messages, server.connections
+
+Speaks just enough plain SMTP (no TLS or auth) for Django's SMTP backend
+and records every accepted message. Recipients in `reject` are refused;
+`connect_delay` seconds are spent before the greeting to stand in for the
+TCP and TLS setup of a remote server.
+"""
+import socketserver
+import threading
+import time
+
+
+class _SMTPHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        server = self.server.owner
+        with server.lock:
+            server.connections += 1
+        time.sleep(server.connect_delay)
+        self._reply('220 localhost SMTP stand-in')
+        envelope = {'from': None, 'to': []}
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            command = line.decode('utf-8', 'replace').strip()
+            verb = command.split(' ', 1)[0].upper()
+            if verb in ('EHLO', 'HELO'):
+                self._reply('250 localhost')
+            elif verb == 'MAIL':
+                envelope = {'from': command.split(':', 1)[1].strip(' <>'), 'to': []}
+                self._reply('250 OK')
+            elif verb == 'RCPT':
+                recipient = command.split(':', 1)[1].strip(' <>')
+                if recipient in server.reject:
+                    self._reply('550 No such user')
+                else:
+                    envelope['to'].append(recipient)
+                    self._reply('250 OK')
+            elif verb == 'DATA':
+                self._reply('354 End data with <CR><LF>.<CR><LF>')
+                data = []
+                for data_line in self.rfile:
+                    if data_line in (b'.\r\n', b'.\n'):
+                        break
+                    data.append(data_line)
+                with server.lock:
+                    server.messages.append({**envelope, 'data': b''.join(data)})
+                self._reply('250 OK queued')
+            elif verb in ('RSET', 'NOOP'):
+                envelope = {'from': None, 'to': []}
+                self._reply('250 OK')
+            elif verb == 'QUIT':
+                self._reply('221 Bye')
+                return
+            else:
+                self._reply('502 Command not implemented')
+
+    def _reply(self, text):
+        self.wfile.write(f'{text}\r\n'.encode('ascii'))
+
+
+class _Server(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class LocalSMTPServer:
+    def __init__(self, reject=(), connect_delay=0.0):
+        self.reject = set(reject)
+        self.connect_delay = connect_delay
+        self.messages = []
+        self.connections = 0
+        self.lock = threading.Lock()
+        self._server = None
+
+    def __enter__(self):
+        self._server = _Server(('127.0.0.1', 0), _SMTPHandler)
+        self._server.owner = self
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._server.shutdown()
+        self._server.server_close()
+
+    @property
+    def port(self):
+        return self._server.server_address[1]
+
+    def email_settings(self):
+        """Settings pointing Django's SMTP backend at this server"""
+        return {
+            'EMAIL_BACKEND': 'django.core.mail.backends.smtp.EmailBackend',
+            'EMAIL_HOST': '127.0.0.1',
+            'EMAIL_PORT': self.port,
+            'EMAIL_USE_TLS': False,
+            'EMAIL_USE_SSL': False,
+            'EMAIL_HOST_USER': '',
+            'EMAIL_HOST_PASSWORD': '',
+        }
@@ -11,6 +11,10 @@ class Post(models.Model):
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['-created_at', '-id'], name='post_created_id_idx'),
+            models.Index(fields=['author', '-created_at', '-id'], name='post_author_created_id_idx'),
+        ]
 
     def __str__(self):
         return f"Post by {self.author.username}"
@@ -49,6 +53,9 @@ class Comment(models.Model):
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['post', '-created_at', '-id'], name='comment_post_created_id_idx'),
+        ]
 
     def __str__(self):
         return f"{self.user.username} - {self.text[:30]}"
\ No newline at end of file
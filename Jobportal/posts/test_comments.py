@@ -0,0 +1,44 @@
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+from rest_framework import status
+from .models import Post, Comment
+
+User = get_user_model()
+
+class CommentCountTestCase(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.author = User.objects.create_user(
+            email='author@test.com',
+            first_name='Author',
+            password='testpass123'
+        )
+        self.commenter = User.objects.create_user(
+            email='commenter@test.com',
+            first_name='Commenter',
+            password='testpass123'
+        )
+        self.post = Post.objects.create(author=self.author, content='Test post content')
+
+    def test_comment_count_follows_adds_and_deletes(self):
+        self.client.force_authenticate(user=self.commenter)
+        response = self.client.post(f'/api-post/posts/{self.post.id}/comments/add/', {'text': 'Nice'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.comments_count, 1)
+
+        comment = Comment.objects.get(post=self.post)
+        response = self.client.delete(f'/api-post/comments/{comment.id}/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.comments_count, 0)
+
+    def test_decrement_never_goes_below_zero(self):
+        # A drifted counter must not make deletes fail
+        comment = Comment.objects.create(post=self.post, user=self.commenter, text='Nice')
+        self.client.force_authenticate(user=self.commenter)
+        response = self.client.delete(f'/api-post/comments/{comment.id}/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.comments_count, 0)
@@ -33,15 +33,16 @@ class PostViewSet(viewsets.ModelViewSet):
         return obj
 
     def list(self, request, *args, **kwargs):
-        queryset = self.get_queryset()
-        serializer = self.get_serializer(queryset, many=True, context={'request': request})
-        return Response(serializer.data)
+        page = self.paginate_queryset(self.get_queryset())
+        serializer = self.get_serializer(page, many=True, context={'request': request})
+        return self.get_paginated_response(serializer.data)
 
     @action(detail=False, methods=['get'], permission_classes=[IsAuthenticated])
     def my_posts(self, request):
         queryset = Post.objects.filter(author=request.user).prefetch_related('images')
-        serializer = self.get_serializer(queryset, many=True, context={'request': request})
-        return Response(serializer.data)
+        page = self.paginate_queryset(queryset)
+        serializer = self.get_serializer(page, many=True, context={'request': request})
+        return self.get_paginated_response(serializer.data)
 
     def create(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
@@ -119,7 +120,7 @@ class PostViewSet(viewsets.ModelViewSet):
             with transaction.atomic():
                 deleted, _ = PostLike.objects.filter(user=user, post=post).delete()
                 if deleted:
-                    Post.objects.filter(pk=post.pk).update(likes_count=F("likes_count") - 1)
+                    Post.objects.filter(pk=post.pk, likes_count__gt=0).update(likes_count=F("likes_count") - 1)
         except Exception:
             return Response({"detail": "Could not unlike post."}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
@@ -143,8 +144,11 @@ class PostViewSet(viewsets.ModelViewSet):
             comment = Comment.objects.get(id=comment_id, post=post)
             if comment.user == request.user and not request.user.is_staff:
                 return Response({'detail': 'Comment authors should use /comments/{id}/ endpoint'}, status=status.HTTP_400_BAD_REQUEST)
-            comment.delete()
-            Post.objects.filter(pk=post.pk).update(comments_count=F('comments_count') - 1)
+            with transaction.atomic():
+                # Only the request that actually removed the row decrements
+                deleted, _ = Comment.objects.filter(pk=comment.pk).delete()
+                if deleted:
+                    Post.objects.filter(pk=post.pk, comments_count__gt=0).update(comments_count=F('comments_count') - 1)
             return Response({'message': 'Comment deleted successfully'})
         except Comment.DoesNotExist:
             return Response({'detail': 'Comment not found'}, status=status.HTTP_404_NOT_FOUND)
@@ -155,8 +159,9 @@ class CommentCreateView(generics.CreateAPIView):
 
     def perform_create(self, serializer):
         post = get_object_or_404(Post, id=self.kwargs['post_id'])
-        serializer.save(user=self.request.user, post=post)
-        Post.objects.filter(pk=post.pk).update(comments_count=F('comments_count') + 1)
+        with transaction.atomic():
+            serializer.save(user=self.request.user, post=post)
+            Post.objects.filter(pk=post.pk).update(comments_count=F('comments_count') + 1)
 
     def create(self, request, *args, **kwargs):
         super().create(request, *args, **kwargs)
@@ -179,7 +184,9 @@ class CommentDetailView(generics.RetrieveUpdateDestroyAPIView):
 
     def destroy(self, request, *args, **kwargs):
         comment = self.get_object()
-        post = comment.post
-        super().destroy(request, *args, **kwargs)
-        Post.objects.filter(pk=post.pk).update(comments_count=F('comments_count') - 1)
+        with transaction.atomic():
+            # Only the request that actually removed the row decrements
+            deleted, _ = Comment.objects.filter(pk=comment.pk).delete()
+            if deleted:
+                Post.objects.filter(pk=comment.post_id, comments_count__gt=0).update(comments_count=F('comments_count') - 1)
         return Response({'message': 'Comment deleted successfully'})
\ No newline at end of file
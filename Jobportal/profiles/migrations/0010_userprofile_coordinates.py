@@ -0,0 +1,43 @@
+# Generated by Django 5.2.8 on 2026-10-18 04:26
+
+from django.db import migrations, models
+
+
+def populate_coordinates(apps, schema_editor):
+    from authentication.geo import normalize_location
+    UserProfile = apps.get_model('profiles', 'UserProfile')
+    batch = []
+    rows = UserProfile.objects.exclude(location__isnull=True).exclude(location='').only('id', 'location')
+    for row in rows.iterator(chunk_size=2000):
+        city = normalize_location(row.location)
+        if city is None:
+            continue
+        row.latitude, row.longitude = city.latitude, city.longitude
+        batch.append(row)
+        if len(batch) >= 2000:
+            UserProfile.objects.bulk_update(batch, ['latitude', 'longitude'])
+            batch = []
+    if batch:
+        UserProfile.objects.bulk_update(batch, ['latitude', 'longitude'])
+
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profiles', '0009_alter_companyprofile_company_address_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='userprofile',
+            name='latitude',
+            field=models.FloatField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='userprofile',
+            name='longitude',
+            field=models.FloatField(blank=True, editable=False, null=True),
+        ),
+        migrations.RunPython(populate_coordinates, migrations.RunPython.noop),
+    ]
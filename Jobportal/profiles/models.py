@@ -1,5 +1,6 @@
 from django.db import models
 from accounts.models import User
+from authentication.geo import normalize_location
 
 def default_skills():
     return []
@@ -29,6 +30,9 @@ class UserProfile(models.Model):
     profile_image = models.ImageField(upload_to='profile_images/', null=True, blank=True)
     phone = models.CharField(max_length=20, null=True, blank=True)
     location = models.CharField(max_length=255, null=True, blank=True)
+    # Resolved from `location` against the bundled gazetteer on save
+    latitude = models.FloatField(null=True, blank=True, editable=False)
+    longitude = models.FloatField(null=True, blank=True, editable=False)
     bio = models.TextField(null=True, blank=True)
 
     # Employee/Employer specific fields
@@ -41,6 +45,15 @@ class UserProfile(models.Model):
     def full_name(self):
         return f"{self.user.first_name} {self.user.last_name}"
     
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None or 'location' in update_fields:
+            city = normalize_location(self.location)
+            self.latitude, self.longitude = (city.latitude, city.longitude) if city else (None, None)
+            if update_fields is not None:
+                kwargs['update_fields'] = set(update_fields) | {'latitude', 'longitude'}
+        super().save(*args, **kwargs)
+    
     def __str__(self):
         return f"{self.full_name} Profile"
 
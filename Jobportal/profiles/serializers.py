@@ -19,7 +19,7 @@ class UserProfileSerializer(serializers.ModelSerializer):
     
     class Meta:
         model = UserProfile
-        fields = ["id",'email', 'full_name', 'job_role', 'profile_image', 'phone', 'location', 'bio', 'skills', 'education_summary', 'experience_years', 'company_name', 'followers_count', 'following_count', 'posts_count', 'education']
+        fields = ["id",'email', 'full_name', 'job_role', 'profile_image', 'phone', 'location', 'latitude', 'longitude', 'bio', 'skills', 'education_summary', 'experience_years', 'company_name', 'followers_count', 'following_count', 'posts_count', 'education']
     
     def get_full_name(self, obj):
         try:
@@ -0,0 +1,12 @@
+from django.contrib import admin
+from .models import Task, DeadTask
+
+@admin.register(Task)
+class TaskAdmin(admin.ModelAdmin):
+    list_display = ("name", "run_at", "attempts", "max_attempts", "locked_until", "created_at")
+    search_fields = ("name",)
+
+@admin.register(DeadTask)
+class DeadTaskAdmin(admin.ModelAdmin):
+    list_display = ("name", "attempts", "failed_at", "created_at")
+    search_fields = ("name", "last_error")
@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from task_queue.models import DeadTask
+from task_queue.queue import requeue_dead
+
+
+class Command(BaseCommand):
+    help = 'Put dead-lettered tasks back on the queue with a fresh attempt budget.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--name', help='Only tasks with this name')
+        parser.add_argument('--id', type=int, action='append', dest='ids', help='Only this dead task (repeatable)')
+
+    def handle(self, *args, **options):
+        dead_tasks = DeadTask.objects.order_by('id')
+        if options['name']:
+            dead_tasks = dead_tasks.filter(name=options['name'])
+        if options['ids']:
+            dead_tasks = dead_tasks.filter(id__in=options['ids'])
+        self.stdout.write(self.style.SUCCESS(f'Requeued {requeue_dead(dead_tasks)} tasks'))
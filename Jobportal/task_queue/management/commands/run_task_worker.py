@@ -0,0 +1,59 @@
+import signal
+import threading
+
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+from task_queue.queue import claim, queue_stats, run, run_due_tasks
+
+
+class Command(BaseCommand):
+    help = ('Run queued background tasks (such as resume conversion) with N '
+            'concurrent workers. Safe to run in several processes and hosts.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--concurrency', type=int, default=4, help='Worker threads')
+        parser.add_argument('--batch-size', type=int, default=10, help='Tasks claimed per poll')
+        parser.add_argument('--poll-interval', type=float, default=1.0,
+                            help='Seconds an idle worker waits before polling again')
+        parser.add_argument('--burst', action='store_true', help='Run due tasks and exit')
+        parser.add_argument('--stats', action='store_true', help='Only report the queue size')
+
+    def handle(self, *args, **options):
+        if options['stats']:
+            stats = queue_stats()
+            self.stdout.write(' '.join(f'{key}={value}' for key, value in stats.items()))
+            return
+
+        if options['burst']:
+            succeeded, failed = run_due_tasks(batch_size=options['batch_size'])
+            self.stdout.write(self.style.SUCCESS(f'Ran {succeeded} tasks, {failed} failed'))
+            return
+
+        stop = threading.Event()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            # Finish the claimed tasks, then exit
+            signal.signal(signum, lambda *_: stop.set())
+
+        workers = [
+            threading.Thread(target=self._work, args=(stop, options['batch_size'], options['poll_interval']))
+            for _ in range(options['concurrency'])
+        ]
+        for worker in workers:
+            worker.start()
+        self.stdout.write(f"Started {options['concurrency']} workers")
+        for worker in workers:
+            worker.join()
+        self.stdout.write(self.style.SUCCESS('Workers stopped'))
+
+    def _work(self, stop, batch_size, poll_interval):
+        try:
+            while not stop.is_set():
+                tasks = claim(batch_size)
+                for task_row in tasks:
+                    run(task_row)
+                if not tasks:
+                    stop.wait(poll_interval)
+        finally:
+            # Each worker thread opened its own connection
+            connections.close_all()
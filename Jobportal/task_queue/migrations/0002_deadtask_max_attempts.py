@@ -0,0 +1,18 @@
+# Generated by Django 5.2.8 on 2026-10-18 05:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('task_queue', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='deadtask',
+            name='max_attempts',
+            field=models.PositiveSmallIntegerField(default=5),
+        ),
+    ]
@@ -0,0 +1,41 @@
+from django.db import models
+from django.utils import timezone
+
+
+class Task(models.Model):
+    """A queued call of a registered task function (see task_queue.queue)"""
+    name = models.CharField(max_length=200)
+    args = models.JSONField(default=list, blank=True)
+    kwargs = models.JSONField(default=dict, blank=True)
+    run_at = models.DateTimeField(default=timezone.now)  # not before; later for retries and scheduled tasks
+    attempts = models.PositiveSmallIntegerField(default=0)
+    max_attempts = models.PositiveSmallIntegerField(default=5)
+    # Lease held by the worker running the task; an expired lease means the
+    # worker died and the task is due again
+    locked_until = models.DateTimeField(null=True, blank=True)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        indexes = [
+            # Due-task scan of the workers
+            models.Index(fields=['run_at', 'id'], name='task_run_at_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.name} (attempt {self.attempts}/{self.max_attempts})"
+
+
+class DeadTask(models.Model):
+    """A task that failed max_attempts times; kept for inspection and requeueing"""
+    name = models.CharField(max_length=200)
+    args = models.JSONField(default=list, blank=True)
+    kwargs = models.JSONField(default=dict, blank=True)
+    attempts = models.PositiveSmallIntegerField()
+    max_attempts = models.PositiveSmallIntegerField(default=5)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField()
+    failed_at = models.DateTimeField(default=timezone.now, db_index=True)
+
+    def __str__(self):
+        return f"{self.name} failed at {self.failed_at}"
@@ -0,0 +1,215 @@
+"""
+PostgreSQL-backed background tasks.
+
+Functions decorated with @task are registered by name; `func.delay(...)`
+inserts a Task row, in the caller's transaction, so a task is only ever
+visible to workers once the data it refers to is committed. Arguments must
+be JSON serializable (pass ids, not model instances).
+
+Workers claim due tasks with SELECT ... FOR UPDATE SKIP LOCKED and take a
+lease on them, then run them outside the claiming transaction. Successful
+tasks are deleted. Failures are retried with exponential backoff until
+max_attempts, after which the task moves to the DeadTask table.
+"""
+import logging
+import random
+import traceback
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from .models import DeadTask, Task
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ATTEMPTS = 5
+DEFAULT_BACKOFF_SECONDS = 30
+MAX_BACKOFF_SECONDS = 60 * 60
+# How long a claimed task is reserved for its worker
+DEFAULT_LEASE_SECONDS = 5 * 60
+
+_registry = {}
+
+
+class UnknownTask(Exception):
+    pass
+
+
+def task(func=None, *, name=None, max_attempts=DEFAULT_MAX_ATTEMPTS):
+    """
+    Register `func` as a background task:
+
+        @task(max_attempts=3)
+        def send_welcome(user_id): ...
+
+        send_welcome.delay(user.id)
+        send_welcome.schedule(run_at, user.id)
+    """
+    def register(func):
+        task_name = name or f'{func.__module__}.{func.__qualname__}'
+        _registry[task_name] = func
+        func.task_name = task_name
+        func.delay = lambda *args, **kwargs: enqueue(task_name, args, kwargs, max_attempts=max_attempts)
+        func.schedule = lambda run_at, *args, **kwargs: enqueue(
+            task_name, args, kwargs, run_at=run_at, max_attempts=max_attempts
+        )
+        return func
+
+    return register(func) if func is not None else register
+
+
+def enqueue(name, args=(), kwargs=None, run_at=None, max_attempts=DEFAULT_MAX_ATTEMPTS):
+    if name not in _registry:
+        raise UnknownTask(name)
+    return Task.objects.create(
+        name=name,
+        args=list(args),
+        kwargs=kwargs or {},
+        run_at=run_at or timezone.now(),
+        max_attempts=max_attempts,
+    )
+
+
+def discard_pending(name, args=(), kwargs=None):
+    """
+    Delete the queued copies of a task that no worker has claimed yet and
+    return how many there were, so the copy that runs first can do their
+    work in one go. Call it in the same transaction as that work.
+    """
+    pending = list(
+        Task.objects.filter(name=name, args=list(args), kwargs=kwargs or {}, attempts=0)
+        .select_for_update(skip_locked=True)
+        .values_list('id', flat=True)
+    )
+    return Task.objects.filter(id__in=pending).delete()[0] if pending else 0
+
+
+def backoff_seconds(attempts):
+    """Exponential backoff with jitter: ~30s, 1m, 2m, 4m ... capped at an hour"""
+    base = getattr(settings, 'TASK_RETRY_BACKOFF_SECONDS', DEFAULT_BACKOFF_SECONDS)
+    delay = min(MAX_BACKOFF_SECONDS, base * 2 ** max(attempts - 1, 0))
+    return delay * random.uniform(0.5, 1.0)
+
+
+def claim(limit=1, lease_seconds=DEFAULT_LEASE_SECONDS):
+    """
+    Reserve up to `limit` due tasks for this worker. Rows another worker is
+    claiming right now are skipped instead of waited on. The attempt is
+    counted here, so a task that keeps killing its worker still runs out of
+    attempts once its lease lapses; such tasks are dead-lettered here.
+    """
+    now = timezone.now()
+    due = (
+        Task.objects.filter(run_at__lte=now)
+        .filter(Q(locked_until__isnull=True) | Q(locked_until__lt=now))
+    )
+    with transaction.atomic():
+        exhausted = list(
+            due.filter(attempts__gte=F('max_attempts')).select_for_update(skip_locked=True)[:limit]
+        )
+        for task_row in exhausted:
+            logger.error(f"Task {task_row.name} (id {task_row.id}) lost its worker on its last attempt")
+            _bury(task_row, 'Worker stopped or lease expired before the task finished')
+
+        tasks = list(
+            due.filter(attempts__lt=F('max_attempts'))
+            .order_by('run_at', 'id')
+            .select_for_update(skip_locked=True)[:limit]
+        )
+        if tasks:
+            locked_until = now + timedelta(seconds=lease_seconds)
+            Task.objects.filter(id__in=[t.id for t in tasks]).update(
+                locked_until=locked_until, attempts=F('attempts') + 1
+            )
+            for t in tasks:
+                t.locked_until = locked_until
+                t.attempts += 1
+    return tasks
+
+
+def run(task_row):
+    """Run one claimed task; returns True if it succeeded"""
+    try:
+        func = _registry.get(task_row.name)
+        if func is None:
+            raise UnknownTask(task_row.name)
+        func(*task_row.args, **task_row.kwargs)
+    except Exception as e:
+        logger.error(f"Task {task_row.name} (id {task_row.id}) failed on attempt {task_row.attempts}: {str(e)}")
+        _record_failure(task_row, traceback.format_exc())
+        return False
+
+    Task.objects.filter(id=task_row.id).delete()
+    return True
+
+
+def _record_failure(task_row, error):
+    if task_row.attempts >= task_row.max_attempts:
+        with transaction.atomic():
+            _bury(task_row, error)
+        return
+    Task.objects.filter(id=task_row.id).update(
+        last_error=error,
+        locked_until=None,
+        run_at=timezone.now() + timedelta(seconds=backoff_seconds(task_row.attempts)),
+    )
+
+
+def _bury(task_row, error):
+    """Move a task that ran out of attempts to the DeadTask table"""
+    DeadTask.objects.create(
+        name=task_row.name,
+        args=task_row.args,
+        kwargs=task_row.kwargs,
+        attempts=task_row.attempts,
+        max_attempts=task_row.max_attempts,
+        last_error=error,
+        created_at=task_row.created_at,
+    )
+    Task.objects.filter(id=task_row.id).delete()
+
+
+def run_due_tasks(limit=None, batch_size=10):
+    """Claim and run due tasks until none are left (or `limit` ran); returns (succeeded, failed)"""
+    succeeded = failed = 0
+    while limit is None or succeeded + failed < limit:
+        size = batch_size if limit is None else min(batch_size, limit - succeeded - failed)
+        tasks = claim(size)
+        if not tasks:
+            break
+        for task_row in tasks:
+            if run(task_row):
+                succeeded += 1
+            else:
+                failed += 1
+    return succeeded, failed
+
+
+def requeue_dead(dead_tasks):
+    """Move dead tasks back onto the queue with a fresh attempt budget"""
+    requeued = 0
+    with transaction.atomic():
+        for dead in dead_tasks.select_for_update():
+            Task.objects.create(
+                name=dead.name,
+                args=dead.args,
+                kwargs=dead.kwargs,
+                max_attempts=dead.max_attempts,
+                created_at=dead.created_at,
+            )
+            dead.delete()
+            requeued += 1
+    return requeued
+
+
+def queue_stats():
+    now = timezone.now()
+    return {
+        'due': Task.objects.filter(run_at__lte=now).filter(Q(locked_until__isnull=True) | Q(locked_until__lt=now)).count(),
+        'running': Task.objects.filter(locked_until__gte=now).count(),
+        'scheduled': Task.objects.filter(run_at__gt=now).count(),
+        'dead': DeadTask.objects.count(),
+    }
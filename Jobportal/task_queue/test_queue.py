@@ -0,0 +1,131 @@
+from datetime import timedelta
+import threading
+
+from django.db import connection
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.utils import timezone
+
+from .models import DeadTask, Task
+from .queue import claim, discard_pending, requeue_dead, run, run_due_tasks, task
+
+calls = []
+
+
+@task(name='test.record')
+def record(value):
+    calls.append(value)
+
+
+@task(name='test.fail', max_attempts=2)
+def fail():
+    raise RuntimeError('boom')
+
+
+@override_settings(TASK_RETRY_BACKOFF_SECONDS=30)
+class TaskQueueTestCase(TestCase):
+    def setUp(self):
+        calls.clear()
+
+    def test_delay_runs_and_deletes(self):
+        record.delay('a')
+        record.delay(value='b')
+        self.assertEqual(run_due_tasks(), (2, 0))
+        self.assertEqual(calls, ['a', 'b'])
+        self.assertFalse(Task.objects.exists())
+
+    def test_scheduled_task_waits_for_run_at(self):
+        record.schedule(timezone.now() + timedelta(hours=1), 'later')
+        self.assertEqual(run_due_tasks(), (0, 0))
+        Task.objects.update(run_at=timezone.now())
+        self.assertEqual(run_due_tasks(), (1, 0))
+        self.assertEqual(calls, ['later'])
+
+    def test_discard_pending_skips_claimed_and_other_copies(self):
+        for _ in range(3):
+            record.delay('a')
+        record.delay('b')
+        claimed = claim(1)[0]
+        self.assertEqual(discard_pending('test.record', ('a',)), 2)
+        self.assertEqual(
+            sorted(Task.objects.values_list('id', 'args')),
+            sorted([(claimed.id, ['a']), (Task.objects.get(args=['b']).id, ['b'])])
+        )
+
+    def test_failure_retries_with_backoff_then_dead_letters(self):
+        fail.delay()
+        self.assertEqual(run_due_tasks(), (0, 1))
+        retry = Task.objects.get()
+        self.assertEqual(retry.attempts, 1)
+        self.assertIn('boom', retry.last_error)
+        self.assertIsNone(retry.locked_until)
+        # Backoff with jitter: between half and all of the 30s base
+        delay = (retry.run_at - timezone.now()).total_seconds()
+        self.assertTrue(10 < delay <= 30)
+        # Not due again yet
+        self.assertEqual(run_due_tasks(), (0, 0))
+
+        Task.objects.update(run_at=timezone.now())
+        self.assertEqual(run_due_tasks(), (0, 1))
+        self.assertFalse(Task.objects.exists())
+        dead = DeadTask.objects.get()
+        self.assertEqual((dead.name, dead.attempts), ('test.fail', 2))
+
+        self.assertEqual(requeue_dead(DeadTask.objects.all()), 1)
+        self.assertFalse(DeadTask.objects.exists())
+        requeued = Task.objects.get()
+        self.assertEqual((requeued.attempts, requeued.max_attempts), (0, 2))
+
+    def test_claimed_task_is_leased(self):
+        record.delay('x')
+        [claimed] = claim(5)
+        self.assertEqual(claimed.attempts, 1)
+        # Leased to the first worker
+        self.assertEqual(claim(5), [])
+        # A lapsed lease (dead worker) makes it due again
+        Task.objects.update(locked_until=timezone.now() - timedelta(seconds=1))
+        [reclaimed] = claim(5)
+        self.assertEqual(reclaimed.attempts, 2)
+        self.assertTrue(run(reclaimed))
+        self.assertEqual(calls, ['x'])
+
+
+    def test_task_that_never_finishes_runs_out_of_attempts(self):
+        fail.delay()
+        # Each claim's worker dies before finishing and the lease lapses
+        for attempt in (1, 2):
+            [claimed] = claim(5)
+            self.assertEqual(claimed.attempts, attempt)
+            Task.objects.update(locked_until=timezone.now() - timedelta(seconds=1))
+
+        self.assertEqual(claim(5), [])
+        self.assertFalse(Task.objects.exists())
+        dead = DeadTask.objects.get()
+        self.assertEqual((dead.attempts, dead.max_attempts), (2, 2))
+        self.assertIn('lease expired', dead.last_error)
+
+
+class TaskClaimConcurrencyTestCase(TransactionTestCase):
+    def test_concurrent_claims_skip_locked_rows(self):
+        if connection.vendor != 'postgresql':
+            self.skipTest('SKIP LOCKED requires PostgreSQL')
+        for i in range(20):
+            record.delay(i)
+        claimed = []
+
+        def worker():
+            try:
+                while True:
+                    tasks = claim(3)
+                    if not tasks:
+                        return
+                    claimed.extend(t.id for t in tasks)
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(claimed), 20)
+        self.assertEqual(len(set(claimed)), 20)